@@ -19,84 +19,31 @@ echo Date: %TODAY%
 
 echo.
 echo ================================================
-echo   [1/4] TAM GIAC MACH - HA GIANG
+echo   ALL AOIS IN PARALLEL (4 workers)
 echo ================================================
+REM One Python process: AOIs run concurrently in a worker pool and each
+REM AOI writes its merged timeseries GeoJSON (linked into web\) directly.
 %PYTHON% main.py ^
-  --aoi Ha_Giang_TamGiacMach ^
+  --all-aois ^
+  --aois Ha_Giang_TamGiacMach Moc_Chau_Prunus Hoang_Lien_Rhododendron Lao_Cai_Rhododendron ^
+  --workers 4 ^
   --date-start %TODAY% ^
   --models lstm gru ^
   --top-n 50 ^
+  --retrain-if-stale ^
   --threshold 0.5
 
 if errorlevel 1 (
-    echo ❌ Failed
+    echo ❌ One or more AOIs failed - see run report
 ) else (
-    echo ✅ Success - Merging...
-    %PYTHON% merge_daily_geojson.py --aoi Ha_Giang_TamGiacMach
-)
-echo.
-
-echo.
-echo ================================================
-echo   [2/4] HOA MAN - MOC CHAU
-echo ================================================
-%PYTHON% main.py ^
-  --aoi Moc_Chau_Prunus ^
-  --date-start %TODAY% ^
-  --models lstm gru ^
-  --top-n 50 ^
-  --threshold 0.5
-
-if errorlevel 1 (
-    echo ❌ Failed
-) else (
-    echo ✅ Success - Merging...
-    %PYTHON% merge_daily_geojson.py --aoi Moc_Chau_Prunus
-)
-echo.
-
-echo.
-echo ================================================
-echo   [3/4] DO QUYEN - FANSIPAN
-echo ================================================
-%PYTHON% main.py ^
-  --aoi Hoang_Lien_Rhododendron ^
-  --date-start %TODAY% ^
-  --models lstm gru ^
-  --top-n 50 ^
-  --threshold 0.6
-
-if errorlevel 1 (
-    echo ❌ Failed
-) else (
-    echo ✅ Success - Merging...
-    %PYTHON% merge_daily_geojson.py --aoi Hoang_Lien_Rhododendron
-)
-echo.
-
-echo.
-echo ================================================
-echo   [4/4] DO QUYEN - LAO CAI
-echo ================================================
-%PYTHON% main.py ^
-  --aoi Lao_Cai_Rhododendron ^
-  --date-start %TODAY% ^
-  --models lstm gru ^
-  --top-n 50 ^
-  --threshold 0.6
-
-if errorlevel 1 (
-    echo ❌ Failed
-) else (
-    echo ✅ Success - Merging...
-    %PYTHON% merge_daily_geojson.py --aoi Lao_Cai_Rhododendron
+    echo ✅ Success - all AOIs predicted and exported
 )
 echo.
 
 echo   ALL COMPLETE!
 echo End time: %TIME%
 echo.
-echo All species predicted and merged!
+echo All species predicted and exported!
 echo Run: setup_web.bat
 echo.
 
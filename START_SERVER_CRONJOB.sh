@@ -3,6 +3,10 @@
 PYTHON=$(which python3)
 TODAY=$(date +%Y-%m-%d)
 
+# AOIs served by the web frontend
+AOIS="Ha_Giang_TamGiacMach Moc_Chau_Prunus Hoang_Lien_Rhododendron Lao_Cai_Rhododendron"
+WORKERS=4
+
 echo ""
 echo "================================================"
 echo "   GPU-OPTIMIZED PREDICTION STARTING"
@@ -15,84 +19,34 @@ start_prediction() {
 
     echo ""
     echo "================================================"
-    echo "   [1/4] TAM GIAC MACH - HA GIANG"
+    echo "   ALL AOIS IN PARALLEL ($WORKERS workers)"
+    echo "   $AOIS"
     echo "================================================"
+    # One Python process: AOIs run concurrently in a worker pool and
+    # each AOI writes its merged timeseries GeoJSON (linked into web/)
+    # directly from memory - no daily files, no separate merge step.
+    # A per-AOI report is written to outputs/hotspots/run_all_aois_$TODAY.json
     $PYTHON main.py \
-      --aoi Ha_Giang_TamGiacMach \
+      --all-aois \
+      --aois $AOIS \
+      --workers $WORKERS \
       --date-start $TODAY \
       --models lstm gru \
       --top-n 50 \
+      --retrain-if-stale \
       --threshold 0.5
 
     if [ $? -eq 0 ]; then
-        echo "✅ Success - Merging..."
-        $PYTHON merge_daily_geojson.py --aoi Ha_Giang_TamGiacMach
-    else
-        echo "❌ Failed"
-    fi
-    echo ""
-
-    echo ""
-    echo "================================================"
-    echo "   [2/4] HOA MAN - MOC CHAU"
-    echo "================================================"
-    $PYTHON main.py \
-      --aoi Moc_Chau_Prunus \
-      --date-start $TODAY \
-      --models lstm gru \
-      --top-n 50 \
-      --threshold 0.5
-
-    if [ $? -eq 0 ]; then
-        echo "✅ Success - Merging..."
-        $PYTHON merge_daily_geojson.py --aoi Moc_Chau_Prunus
-    else
-        echo "❌ Failed"
-    fi
-    echo ""
-
-    echo ""
-    echo "================================================"
-    echo "   [3/4] DO QUYEN - FANSIPAN"
-    echo "================================================"
-    $PYTHON main.py \
-      --aoi Hoang_Lien_Rhododendron \
-      --date-start $TODAY \
-      --models lstm gru \
-      --top-n 50 \
-      --threshold 0.6
-
-    if [ $? -eq 0 ]; then
-        echo "✅ Success - Merging..."
-        $PYTHON merge_daily_geojson.py --aoi Hoang_Lien_Rhododendron
-    else
-        echo "❌ Failed"
-    fi
-    echo ""
-
-    echo ""
-    echo "================================================"
-    echo "   [4/4] DO QUYEN - LAO CAI"
-    echo "================================================"
-    $PYTHON main.py \
-      --aoi Lao_Cai_Rhododendron \
-      --date-start $TODAY \
-      --models lstm gru \
-      --top-n 50 \
-      --threshold 0.6
-
-    if [ $? -eq 0 ]; then
-        echo "✅ Success - Merging..."
-        $PYTHON merge_daily_geojson.py --aoi Lao_Cai_Rhododendron
+        echo "✅ Success - all AOIs predicted and exported"
     else
-        echo "❌ Failed"
+        echo "❌ One or more AOIs failed - see run report"
     fi
     echo ""
 
     echo "   ALL COMPLETE!"
     echo "End time: $(date +%T)"
     echo ""
-    echo "All species predicted and merged!"
+    echo "All species predicted and exported!"
     echo "Run: ./setup_web.sh"
     echo ""
 }
@@ -1,6 +1,6 @@
 """
 Analyze and visualize 30-day time-series bloom forecasts
-Works with individual daily GeoJSON files
+Works with the columnar or merged time-series file, or individual daily GeoJSON files
 """
 import json
 import pandas as pd
@@ -11,75 +11,125 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import argparse
 from glob import glob
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from utils.geojson_io import iter_features
 
 sns.set_style('whitegrid')
 
 
-def load_daily_geojson_files(input_dir):
+def _read_columnar(path):
+    """Read a GeoParquet/FlatGeobuf hotspot file as a plain attribute table"""
+    if path.suffix == '.parquet':
+        df = pd.read_parquet(path)
+    else:
+        import geopandas as gpd
+        df = pd.DataFrame(gpd.read_file(path, ignore_geometry=True))
+    
+    return df.drop(columns=['geometry'], errors='ignore')
+
+
+def _read_geojson(path):
+    """Read the feature properties of a (possibly compressed) GeoJSON file"""
+    return pd.DataFrame([f['properties'] for f in iter_features(path)])
+
+
+def read_hotspot_file(path):
     """
-    Load all daily GeoJSON files from directory
+    Read one hotspot export (columnar, merged or daily GeoJSON) as a table
     
     Args:
-        input_dir: Directory containing daily GeoJSON files
+        path: .parquet / .fgb / .geojson[.gz|.br] file
         
     Returns:
-        Dictionary mapping date_str → features list
+        DataFrame with one row per hotspot
+    """
+    path = Path(path)
+    if path.suffix in ('.parquet', '.fgb'):
+        return _read_columnar(path)
+    return _read_geojson(path)
+
+
+def load_hotspots(input_dir):
+    """
+    Load all hotspots from directory into one table
+    
+    Source preference: columnar time-series file (*_hotspots_timeseries.parquet
+    or .fgb), merged time-series GeoJSON, then the daily GeoJSON files.
+    
+    Args:
+        input_dir: Directory containing hotspot exports
+        
+    Returns:
+        DataFrame with one row per hotspot and a datetime 'date' column
     """
     input_path = Path(input_dir)
     
-    # Find all daily GeoJSON files (pattern: *_hotspots_YYYY-MM-DD.geojson)
-    geojson_files = sorted(input_path.glob('*_hotspots_????-??-??.geojson'))
+    for pattern in ('*_hotspots_timeseries.parquet',
+                    '*_hotspots_timeseries.fgb',
+                    '*_hotspots_timeseries.geojson*'):
+        files = sorted(input_path.glob(pattern))
+        if files:
+            print(f"\n📂 Reading time-series file: {files[0].name}")
+            return _with_dates(read_hotspot_file(files[0]))
+    
+    # Daily files (pattern: *_hotspots_YYYY-MM-DD.geojson[.gz|.br])
+    geojson_files = sorted(input_path.glob('*_hotspots_????-??-??.geojson*'))
     
     if not geojson_files:
-        raise FileNotFoundError(f"No daily GeoJSON files found in {input_dir}")
+        raise FileNotFoundError(f"No hotspot files found in {input_dir}")
     
     print(f"\n📂 Found {len(geojson_files)} daily GeoJSON files")
     
-    daily_data = {}
-    
+    frames = []
     for geojson_file in geojson_files:
-        # Extract date from filename
-        # Format: AOI_hotspots_YYYY-MM-DD.geojson
-        filename = geojson_file.stem
-        date_str = filename.split('_')[-1]  # Get last part (YYYY-MM-DD)
-        
-        # Load GeoJSON
-        with open(geojson_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        daily_data[date_str] = data['features']
-        print(f"   ✅ {date_str}: {len(data['features'])} hotspots")
+        frame = _read_geojson(geojson_file)
+        if 'date' not in frame.columns:
+            # Format: AOI_hotspots_YYYY-MM-DD.geojson
+            frame['date'] = geojson_file.name.split('_')[-1][:10]
+        frames.append(frame)
     
-    return daily_data
+    return _with_dates(pd.concat(frames, ignore_index=True))
 
 
-def extract_daily_stats(daily_data):
-    """Extract daily statistics from daily GeoJSON data"""
-    daily_stats = []
-    
-    for date_str, features in sorted(daily_data.items()):
-        if len(features) > 0:
-            probs = [f['properties']['bloom_probability'] for f in features]
-            stats = {
-                'date': pd.to_datetime(date_str),
-                'total_hotspots': len(features),
-                'mean_score': np.mean(probs),
-                'max_score': np.max(probs),
-                'min_score': np.min(probs),
-                'std_score': np.std(probs)
-            }
-        else:
-            stats = {
-                'date': pd.to_datetime(date_str),
-                'total_hotspots': 0,
-                'mean_score': 0,
-                'max_score': 0,
-                'min_score': 0,
-                'std_score': 0
-            }
-        daily_stats.append(stats)
-    
-    df = pd.DataFrame(daily_stats).sort_values('date')
+def _with_dates(df):
+    """Normalize the date column to day-resolution timestamps"""
+    if len(df) > 0:
+        df['date'] = pd.to_datetime(df['date']).dt.normalize()
+    else:
+        df = pd.DataFrame({'date': pd.Series(dtype='datetime64[ns]'),
+                           'bloom_probability': pd.Series(dtype=float)})
+    
+    print(f"   ✅ {len(df)} hotspots over {df['date'].nunique()} days")
+    return df
+
+
+def extract_daily_stats(hotspots, date_range=None):
+    """
+    Daily statistics from one groupby over the date column
+    
+    Args:
+        hotspots: Output of load_hotspots()
+        date_range: Optional {'start', 'end'}; days without hotspots get zeros
+        
+    Returns:
+        DataFrame with date, total_hotspots, mean/max/min/std score
+    """
+    df = hotspots.groupby('date', sort=True)['bloom_probability'].agg(
+        total_hotspots='count',
+        mean_score='mean',
+        max_score='max',
+        min_score='min',
+        std_score=lambda p: p.std(ddof=0)
+    )
+    
+    if date_range is not None:
+        df = df.reindex(pd.date_range(date_range['start'], date_range['end'], freq='D'))
+        df.index.name = 'date'
+    
+    df = df.fillna(0).reset_index()
+    df['total_hotspots'] = df['total_hotspots'].astype(int)
     return df
 
 
@@ -256,30 +306,25 @@ def plot_heatmap_calendar(df, aoi_name, save_path):
 def main():
     parser = argparse.ArgumentParser(description='Analyze 30-day bloom forecast')
     parser.add_argument('--input', type=str, required=True,
-                       help='Path to directory containing daily GeoJSON files OR path to metadata JSON')
+                       help='Directory with hotspot exports, a time-series/daily hotspot file, '
+                            'or path to metadata JSON')
     parser.add_argument('--output-dir', type=str, default='outputs/analysis',
                        help='Output directory for analysis results')
     
     args = parser.parse_args()
     
     input_path = Path(args.input)
+    date_range = None
     
     # Determine input type
     if input_path.is_dir():
-        # Directory containing daily GeoJSON files
-        print(f"\n📂 Loading daily GeoJSON files from: {input_path}")
-        daily_data = load_daily_geojson_files(input_path)
+        # Directory containing hotspot exports
+        print(f"\n📂 Loading hotspots from: {input_path}")
+        hotspots = load_hotspots(input_path)
         
-        # Extract AOI name from directory name or first file
+        # Extract AOI name from directory name
         aoi_name = input_path.name
         
-        # Get date range
-        dates = sorted(daily_data.keys())
-        date_range = {
-            'start': dates[0],
-            'end': dates[-1]
-        }
-        
     elif input_path.suffix == '.json' and 'metadata' in input_path.name:
         # Metadata JSON file
         print(f"\n📂 Loading from metadata: {input_path}")
@@ -289,17 +334,31 @@ def main():
         aoi_name = metadata['aoi_name']
         date_range = metadata['date_range']
         
-        # Load daily files from same directory
-        daily_data = load_daily_geojson_files(input_path.parent)
+        # Load exports from same directory
+        hotspots = load_hotspots(input_path.parent)
+        
+    elif input_path.is_file():
+        # Single merged/columnar (or daily) hotspot file
+        print(f"\n📂 Loading hotspots from: {input_path}")
+        hotspots = _with_dates(read_hotspot_file(input_path))
+        aoi_name = input_path.name.split('_hotspots')[0]
     else:
-        raise ValueError("Input must be a directory or metadata JSON file")
+        raise ValueError("Input must be a directory, a hotspot file or metadata JSON file")
+    
+    if date_range is None:
+        if len(hotspots) == 0:
+            raise ValueError(f"No hotspots found in {input_path}")
+        date_range = {
+            'start': hotspots['date'].min().strftime('%Y-%m-%d'),
+            'end': hotspots['date'].max().strftime('%Y-%m-%d')
+        }
     
     print(f"🌸 AOI: {aoi_name}")
     print(f"📅 Date range: {date_range['start']} → {date_range['end']}")
     
     # Extract daily statistics
     print(f"\n📊 Extracting daily statistics...")
-    df = extract_daily_stats(daily_data)
+    df = extract_daily_stats(hotspots, date_range)
     
     # Create output directory
     output_dir = Path(args.output_dir) / aoi_name
@@ -16,10 +16,12 @@ packages_to_check = [
     ('dotenv', 'python-dotenv'),
     ('geopandas', 'GeoPandas'),
     ('shapely', 'Shapely'),
-    ('esda', 'ESDA'),
-    ('libpysal', 'LibPySAL'),
+    ('pyproj', 'PyProj'),
+    ('scipy', 'SciPy'),
     ('folium', 'Folium'),
     ('plotly', 'Plotly'),
+    ('pyarrow', 'PyArrow'),
+    ('ijson', 'ijson'),
 ]
 
 missing = []
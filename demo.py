@@ -88,7 +88,7 @@ try:
     print("  ✅ Hotspot analyzer OK\n")
 except Exception as e:
     print(f"  ❌ Spatial analysis failed: {e}\n")
-    print(f"  This might be due to missing spatial libraries (geopandas, esda)\n")
+    print(f"  This might be due to missing spatial libraries (geopandas, scipy)\n")
 
 # Test 7: Visualization
 print("✓ Test 7: Visualization tools...")
@@ -12,8 +12,8 @@ echo [1/5] Installing geopandas and dependencies...
 %PYTHON_PATH% -m pip install geopandas
 
 echo.
-echo [2/5] Installing spatial analysis libraries (esda, libpysal)...
-%PYTHON_PATH% -m pip install esda libpysal
+echo [2/5] Installing spatial analysis libraries (scipy)...
+%PYTHON_PATH% -m pip install scipy
 
 echo.
 echo [3/5] Installing visualization libraries...
@@ -21,7 +21,7 @@ echo [3/5] Installing visualization libraries...
 
 echo.
 echo [4/5] Installing remaining packages...
-%PYTHON_PATH% -m pip install pyyaml python-dotenv tqdm joblib
+%PYTHON_PATH% -m pip install pyyaml python-dotenv tqdm joblib pyarrow ijson
 
 echo.
 echo [5/5] Installing scikit-learn-extra...
@@ -18,8 +18,8 @@ echo (This may take 5-10 minutes - Rat nhieu dependencies)
 %PYTHON_PATH% -m pip install geopandas
 echo.
 
-echo Step 2/5: Installing PySAL ecosystem...
-%PYTHON_PATH% -m pip install libpysal esda
+echo Step 2/5: Installing SciPy (sparse spatial weights)...
+%PYTHON_PATH% -m pip install scipy
 echo.
 
 echo Step 3/5: Installing Folium (maps)...
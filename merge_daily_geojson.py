@@ -9,18 +9,31 @@ Gộp 30 files GeoJSON riêng lẻ thành 1 meta file duy nhất    print(f"{'='
 def main():nguyên ALL properties và structure
 """
 
-import json
+import sys
 from pathlib import Path
 import argparse
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-def merge_daily_geojson(aoi_name, output_dir=None):
+from utils.geojson_io import (
+    GeoJSONFeatureWriter, DEFAULT_CRS, iter_features, link_or_copy, read_crs
+)
+
+
+def merge_daily_geojson(aoi_name, output_dir=None, input_dir=None, compression=None):
     """
     Gộp 30 daily GeoJSON files thành 1 timeseries file
     
+    Features được đọc và ghi từng cái một (streaming), nên bộ nhớ không tăng
+    theo số ngày hay top-N. File gộp được sắp theo ngày và có thêm 'date_index'
+    (date → [offset, count]) và 'date_summary' (count / mean / max).
+    
     Args:
         aoi_name: Tên AOI (e.g., 'Ha_Giang_TamGiacMach')
         output_dir: Thư mục output (default: same as daily files)
+        input_dir: Thư mục chứa daily files (default: outputs/hotspots/{aoi_name})
+        compression: None, 'gzip' hoặc 'brotli' cho file gộp
     
     Returns:
         Path to merged file
@@ -31,12 +44,16 @@ def merge_daily_geojson(aoi_name, output_dir=None):
     print(f"{'='*80}\n")
     
     # 1. Find all daily files
-    base_dir = Path(f'outputs/hotspots/{aoi_name}')
+    base_dir = Path(input_dir) if input_dir else Path(f'outputs/hotspots/{aoi_name}')
     if not base_dir.exists():
         raise FileNotFoundError(f"Directory not found: {base_dir}")
     
-    # Pattern: {AOI}_hotspots_YYYY-MM-DD.geojson
-    daily_files = sorted(base_dir.glob(f'{aoi_name}_hotspots_????-??-??.geojson'))
+    # Pattern: {AOI}_hotspots_YYYY-MM-DD.geojson (optionally .gz / .br)
+    # Sorted by name = sorted by date, so each date is one contiguous slice
+    daily_files = sorted(
+        f for f in base_dir.glob(f'{aoi_name}_hotspots_????-??-??.geojson*')
+        if not f.name.endswith('.tmp')
+    )
     
     if len(daily_files) == 0:
         raise FileNotFoundError(f"No daily files found in {base_dir}")
@@ -45,82 +62,65 @@ def merge_daily_geojson(aoi_name, output_dir=None):
     print(f"   First: {daily_files[0].name}")
     print(f"   Last:  {daily_files[-1].name}\n")
     
-    # 2. Load first file to get CRS template
-    with open(daily_files[0], 'r', encoding='utf-8') as f:
-        first_data = json.load(f)
-    
-    # Extract CRS (must preserve exactly)
-    crs = first_data.get('crs', {
-        "type": "name",
-        "properties": {
-            "name": "urn:ogc:def:crs:OGC:1.3:CRS84"
-        }
-    })
+    # 2. CRS template from the first file (must preserve exactly)
+    crs = read_crs(daily_files[0]) or DEFAULT_CRS
     
     print(f"📍 CRS: {crs['properties']['name']}\n")
     
-    # 3. Collect all features from all files
-    all_features = []
+    # 3. Stream features from every daily file into the merged file
+    output_path_local = base_dir / f'{aoi_name}_hotspots_timeseries.geojson'
     file_stats = []
-    
-    for i, file_path in enumerate(daily_files, 1):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        features = data.get('features', [])
-        num_features = len(features)
-        
-        # Get date from filename
-        date_str = file_path.stem.split('_')[-1]
-        
-        # Verify each feature has required properties
-        for feature in features:
-            # Ensure date property exists
-            if 'date' not in feature.get('properties', {}):
-                feature['properties']['date'] = date_str
+    total_features = 0
+    sample = None
+    
+    with GeoJSONFeatureWriter(
+        output_path_local,
+        name=f"{aoi_name}_hotspots_timeseries",
+        crs=crs,  # Preserve exact CRS
+        compression=compression,
+        index_dates=True  # date_index / date_summary for O(1) date lookup
+    ) as writer:
+        for i, file_path in enumerate(daily_files, 1):
+            # Get date from filename
+            date_str = file_path.name.split('_')[-1][:10]
+            num_features = 0
             
-            # Preserve all original properties
-            # (lon, lat, bloom_probability, gi_star_z, gi_star_p, 
-            #  gi_star_significant, hotspot_type, cluster_id, is_noise, etc.)
-            all_features.append(feature)
-        
-        file_stats.append({
-            'file': file_path.name,
-            'date': date_str,
-            'features': num_features
-        })
-        
-        print(f"   [{i:2d}/{len(daily_files)}] {date_str}: {num_features:3d} features")
-    
-    print(f"\n✅ Total features collected: {len(all_features)}")
-    
-    # 4. Create merged GeoJSON
-    merged_geojson = {
-        "type": "FeatureCollection",
-        "name": f"{aoi_name}_hotspots_timeseries",
-        "crs": crs,  # Preserve exact CRS
-        "features": all_features  # All features with all properties preserved
-    }
-    
-    # 5. Save merged file to TWO locations
-    # 5a. Local backup in outputs folder
-    output_path_local = base_dir / f'{aoi_name}_hotspots_timeseries.geojson'
-    with open(output_path_local, 'w', encoding='utf-8') as f:
-        json.dump(merged_geojson, f, indent=2, ensure_ascii=False)
+            for feature in iter_features(file_path):
+                # Ensure date property exists
+                properties = feature.setdefault('properties', {})
+                if 'date' not in properties:
+                    properties['date'] = date_str
+                
+                # Preserve all original properties
+                writer.write_features([feature])
+                num_features += 1
+                
+                if sample is None:
+                    sample = feature
+            
+            total_features += num_features
+            file_stats.append({
+                'file': file_path.name,
+                'date': date_str,
+                'features': num_features
+            })
+            
+            print(f"   [{i:2d}/{len(daily_files)}] {date_str}: {num_features:3d} features")
     
-    # 5b. Frontend public folder (main output)
+    output_path_local = writer.path
+    print(f"\n✅ Total features merged: {total_features}")
+    
+    # 4. Second location: frontend public folder (main output), linked not re-serialized
     if output_dir:
         frontend_dir = Path(output_dir)
     else:
         frontend_dir = Path('./web')
     
     frontend_dir.mkdir(parents=True, exist_ok=True)
-    output_path_frontend = frontend_dir / f'{aoi_name}_hotspots_timeseries.geojson'
-    
-    with open(output_path_frontend, 'w', encoding='utf-8') as f:
-        json.dump(merged_geojson, f, indent=2, ensure_ascii=False)
+    output_path_frontend = frontend_dir / output_path_local.name
+    link_or_copy(output_path_local, output_path_frontend)
     
-    # 6. Print summary
+    # 5. Print summary
     print(f"\n{'='*80}")
     print(f"MERGE COMPLETED!")
     print(f"{'='*80}")
@@ -128,8 +128,8 @@ def merge_daily_geojson(aoi_name, output_dir=None):
     print(f"🌐 Frontend output: {output_path_frontend}")
     print(f"📊 Statistics:")
     print(f"   - Total days: {len(daily_files)}")
-    print(f"   - Total features: {len(all_features)}")
-    print(f"   - Average features/day: {len(all_features)/len(daily_files):.1f}")
+    print(f"   - Total features: {total_features}")
+    print(f"   - Average features/day: {total_features/len(daily_files):.1f}")
     print(f"   - Date range: {file_stats[0]['date']} → {file_stats[-1]['date']}")
     
     # File size (check frontend file)
@@ -140,16 +140,15 @@ def merge_daily_geojson(aoi_name, output_dir=None):
         size_str = f"{file_size/1024:.2f} KB"
     print(f"   - File size: {size_str}")
     
-    # 7. Sample feature check (verify properties preserved)
-    if len(all_features) > 0:
-        sample = all_features[0]
+    # 6. Sample feature check (verify properties preserved)
+    if sample is not None:
         print(f"\n📋 Sample feature properties:")
         for key, value in sample.get('properties', {}).items():
             print(f"   - {key}: {value}")
     
     print(f"\n{'='*80}\n")
     
-    # 8. Delete daily files after successful merge
+    # 7. Delete daily files after successful merge
     print(f"🗑️  CLEANING UP DAILY FILES...")
     print(f"{'='*80}")
     
@@ -176,7 +175,7 @@ def merge_daily_geojson(aoi_name, output_dir=None):
             print(f"   - {fname}: {error}")
     
     print(f"\n📁 Remaining files in {base_dir}:")
-    remaining = list(base_dir.glob('*.geojson'))
+    remaining = list(base_dir.glob('*.geojson*'))
     for f in remaining:
         print(f"   - {f.name}")
     
@@ -191,11 +190,13 @@ def main():
                         help='AOI name (e.g., Ha_Giang_TamGiacMach)')
     parser.add_argument('--output-dir', type=str, default=None,
                         help='Output directory (default: same as input)')
+    parser.add_argument('--compression', choices=['gzip', 'brotli'], default=None,
+                        help='Compress the merged file (default: plain GeoJSON)')
     
     args = parser.parse_args()
     
     try:
-        output_path = merge_daily_geojson(args.aoi, args.output_dir)
+        output_path = merge_daily_geojson(args.aoi, args.output_dir, compression=args.compression)
         print(f"✅ SUCCESS! Merged file: {output_path}")
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
@@ -136,9 +136,7 @@ if errorlevel 1 (
     echo ❌ Error running Tam Giac Mach prediction
 ) else (
     echo ✅ Tam Giac Mach completed!
-    echo Merging daily files...
-    %PYTHON% merge_daily_geojson.py --aoi Ha_Giang_TamGiacMach
-    echo ✅ Merged Ha_Giang_TamGiacMach
+    echo ✅ Exported Ha_Giang_TamGiacMach_hotspots_timeseries.geojson
 )
 
 REM 2. Hoa Man
@@ -156,9 +154,7 @@ if errorlevel 1 (
     echo ❌ Error running Hoa Man prediction
 ) else (
     echo ✅ Hoa Man completed!
-    echo Merging daily files...
-    %PYTHON% merge_daily_geojson.py --aoi Moc_Chau_Prunus
-    echo ✅ Merged Moc_Chau_Prunus
+    echo ✅ Exported Moc_Chau_Prunus_hotspots_timeseries.geojson
 )
 
 REM 3. Do Quyen Fansipan
@@ -176,9 +172,7 @@ if errorlevel 1 (
     echo ❌ Error running Do Quyen Fansipan prediction
 ) else (
     echo ✅ Do Quyen Fansipan completed!
-    echo Merging daily files...
-    %PYTHON% merge_daily_geojson.py --aoi Hoang_Lien_Rhododendron
-    echo ✅ Merged Hoang_Lien_Rhododendron
+    echo ✅ Exported Hoang_Lien_Rhododendron_hotspots_timeseries.geojson
 )
 
 REM 4. Do Quyen Lao Cai
@@ -196,9 +190,7 @@ if errorlevel 1 (
     echo ❌ Error running Do Quyen Lao Cai prediction
 ) else (
     echo ✅ Do Quyen Lao Cai completed!
-    echo Merging daily files...
-    %PYTHON% merge_daily_geojson.py --aoi Lao_Cai_Rhododendron
-    echo ✅ Merged Lao_Cai_Rhododendron
+    echo ✅ Exported Lao_Cai_Rhododendron_hotspots_timeseries.geojson
 )
 
 echo.
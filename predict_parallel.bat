@@ -41,29 +41,6 @@ if errorlevel 1 (
     goto end
 )
 
-echo.
-echo ================================================
-echo   MERGING FILES...
-echo ================================================
-echo.
-
-REM Merge all species
-echo Merging Ha_Giang_TamGiacMach...
-%PYTHON% merge_daily_geojson.py --aoi Ha_Giang_TamGiacMach
-echo.
-
-echo Merging Moc_Chau_Prunus...
-%PYTHON% merge_daily_geojson.py --aoi Moc_Chau_Prunus
-echo.
-
-echo Merging Hoang_Lien_Rhododendron...
-%PYTHON% merge_daily_geojson.py --aoi Hoang_Lien_Rhododendron
-echo.
-
-echo Merging Lao_Cai_Rhododendron...
-%PYTHON% merge_daily_geojson.py --aoi Lao_Cai_Rhododendron
-echo.
-
 echo.
 echo ================================================
 echo   ✅ ALL COMPLETE!
@@ -71,7 +48,7 @@ echo ================================================
 echo.
 echo End time: %TIME%
 echo.
-echo All 4 species predicted and merged!
+echo All 4 species predicted and exported!
 echo.
 echo Output files:
 echo   - Ha_Giang_TamGiacMach_hotspots_timeseries.geojson
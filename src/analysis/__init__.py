@@ -1,4 +1,13 @@
 """Spatial analysis modules"""
 from .hotspot_detection import HotspotAnalyzer
+from .spatial_weights import (
+    distance_band_matrix, distance_band_weights, estimate_neighbor_pairs, gi_star
+)
 
-__all__ = ['HotspotAnalyzer']
+__all__ = [
+    'HotspotAnalyzer',
+    'distance_band_matrix',
+    'distance_band_weights',
+    'estimate_neighbor_pairs',
+    'gi_star'
+]
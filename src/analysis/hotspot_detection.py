@@ -1,14 +1,18 @@
 """
 Spatial analysis for bloom hotspot detection
 """
+import hashlib
 import numpy as np
 import pandas as pd
 import geopandas as gpd
-from shapely.geometry import Point
+from collections import OrderedDict
+from pyproj import Transformer
+from scipy import sparse
 from typing import Tuple, Optional, List, Dict, Any
 from sklearn.cluster import DBSCAN
-from esda.getisord import G_Local
-from libpysal.weights import DistanceBand
+from .spatial_weights import (
+    distance_band_matrix, distance_band_weights, estimate_neighbor_pairs, gi_star
+)
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,12 +20,28 @@ warnings.filterwarnings('ignore')
 class HotspotAnalyzer:
     """Analyze bloom hotspots using spatial statistics"""
     
+    # Projected CRS for metric calculations (approximate for Southeast Asia)
+    PROJECTED_CRS = 'EPSG:32648'  # UTM Zone 48N
+    
+    # File suffix per export format
+    EXPORT_SUFFIX = {
+        'geojson': '.geojson',
+        'shapefile': '.shp',
+        'csv': '.csv',
+        'geoparquet': '.parquet',
+        'flatgeobuf': '.fgb'
+    }
+    
     def __init__(
         self,
         probability_threshold: float = 0.70,
         distance_band: float = 1000,
         dbscan_eps: float = 500,
-        dbscan_min_samples: int = 10
+        dbscan_min_samples: int = 10,
+        gi_star_permutations: int = 999,
+        significance_level: float = 0.05,
+        cache_size: int = 1,
+        max_cached_pairs: int = 50_000_000
     ):
         """
         Initialize hotspot analyzer
@@ -31,11 +51,27 @@ class HotspotAnalyzer:
             distance_band: Distance band for Gi* analysis (meters)
             dbscan_eps: DBSCAN epsilon parameter (meters)
             dbscan_min_samples: DBSCAN minimum samples
+            gi_star_permutations: Permutations for Gi* pseudo p-values
+                (0 → analytical p-values)
+            significance_level: Gi* significance level
+            cache_size: Prediction grids whose projected coordinates and
+                neighbor distances are kept (LRU); one entry serves every
+                date of the same grid
+            max_cached_pairs: Largest distance matrix (stored pairs) cached for
+                a whole grid; denser grids only cache the projection, and
+                subsets over the budget keep only their nearest neighbors
         """
         self.probability_threshold = probability_threshold
         self.distance_band = distance_band
         self.dbscan_eps = dbscan_eps
         self.dbscan_min_samples = dbscan_min_samples
+        self.gi_star_permutations = gi_star_permutations
+        self.significance_level = significance_level
+        self.cache_size = cache_size
+        self.max_cached_pairs = max_cached_pairs
+        
+        # Grid coordinate hash → projected coordinates / neighbor distances
+        self._neighborhood_cache = OrderedDict()
     
     def identify_hotspots(
         self,
@@ -43,103 +79,281 @@ class HotspotAnalyzer:
         lon_col: str = 'lon',
         lat_col: str = 'lat',
         prob_col: str = 'bloom_probability',
-        date_col: str = 'date'
+        date_col: str = 'date',
+        verbose: bool = True,
+        geometry: bool = True,
+        population: Optional[np.ndarray] = None,
+        population_index: Optional[np.ndarray] = None
     ) -> gpd.GeoDataFrame:
         """
         Identify bloom hotspots from prediction data
         
+        predictions normally cover the whole study area. For one tile of a
+        larger area, pass the area's high-probability values as population so
+        Gi* uses the area-wide mean, variance and permutation pool.
+        
         Args:
             predictions: DataFrame with predictions
             lon_col: Longitude column name
             lat_col: Latitude column name
             prob_col: Bloom probability column name
             date_col: Date column name
+            verbose: Print progress (off for per-tile calls)
+            geometry: Return a GeoDataFrame; False returns the plain DataFrame
+                so callers can merge results and materialize geometry once
+            population: Probabilities of every point above the threshold in
+                the study area (None → the points in predictions)
+            population_index: Position of each predictions row in population
+                (only read for rows above the threshold)
             
         Returns:
-            GeoDataFrame with hotspot analysis results
+            GeoDataFrame (or DataFrame) with hotspot analysis results
         """
-        print(f"\n🔍 Identifying bloom hotspots...")
-        print(f"   Probability threshold: {self.probability_threshold}")
-        print(f"   Total predictions: {len(predictions)}")
+        if verbose:
+            print(f"\n🔍 Identifying bloom hotspots...")
+            print(f"   Probability threshold: {self.probability_threshold}")
+            print(f"   Total predictions: {len(predictions)}")
         
         # Filter by probability threshold
-        hotspots = predictions[predictions[prob_col] >= self.probability_threshold].copy()
-        print(f"   High-probability locations: {len(hotspots)}")
+        mask = (predictions[prob_col] >= self.probability_threshold).to_numpy()
+        hotspots = predictions[mask].copy()
+        if verbose:
+            print(f"   High-probability locations: {len(hotspots)}")
         
         if len(hotspots) == 0:
-            print("   ⚠️  No hotspots found above threshold")
+            if verbose:
+                print("   ⚠️  No hotspots found above threshold")
+            return gpd.GeoDataFrame() if geometry else hotspots
+        
+        # Neighbor distances of the high-probability subset; the projection
+        # (and distances when small enough) are shared by every date on a grid
+        distances = self._subset_distances(
+            predictions[lon_col].to_numpy(dtype=np.float64),
+            predictions[lat_col].to_numpy(dtype=np.float64),
+            np.flatnonzero(mask)
+        )
+        
+        # Perform Getis-Ord Gi* analysis
+        if verbose:
+            print(f"   Running Getis-Ord Gi* analysis...")
+        if population is not None:
+            population_index = np.asarray(population_index)[mask]
+        hotspots = self._getis_ord_gi_star(
+            hotspots, prob_col, distances, population, population_index
+        )
+        
+        # Perform DBSCAN clustering
+        if verbose:
+            print(f"   Running DBSCAN clustering...")
+        hotspots = self._dbscan_clustering(hotspots, distances)
+        
+        # Summary statistics
+        if verbose:
+            labels = hotspots['cluster_id'].to_numpy()
+            n_hotspots = int(hotspots['gi_star_significant'].sum())
+            n_clusters = len(np.unique(labels[labels >= 0]))
+            print(f"   ✅ Statistically significant hotspots: {n_hotspots}")
+            print(f"   ✅ DBSCAN clusters found: {n_clusters}")
+        
+        if not geometry:
+            return hotspots
+        
+        return self.to_geodataframe(hotspots, lon_col, lat_col, prob_col)
+    
+    def to_geodataframe(
+        self,
+        df: pd.DataFrame,
+        lon_col: str = 'lon',
+        lat_col: str = 'lat',
+        prob_col: str = 'bloom_probability'
+    ) -> gpd.GeoDataFrame:
+        """
+        Materialize point geometry (and cluster statistics) for hotspot results
+        
+        Args:
+            df: Hotspot table from identify_hotspots(geometry=False)
+            lon_col: Longitude column name
+            lat_col: Latitude column name
+            prob_col: Bloom probability column name
+            
+        Returns:
+            GeoDataFrame in EPSG:4326
+        """
+        if len(df) == 0:
             return gpd.GeoDataFrame()
         
-        # Create GeoDataFrame
-        geometry = [Point(xy) for xy in zip(hotspots[lon_col], hotspots[lat_col])]
         gdf = gpd.GeoDataFrame(
-            hotspots,
-            geometry=geometry,
+            df,
+            geometry=gpd.points_from_xy(df[lon_col], df[lat_col]),
             crs='EPSG:4326'
         )
         
-        # Project to UTM for metric calculations (approximate for Southeast Asia)
-        gdf_utm = gdf.to_crs('EPSG:32648')  # UTM Zone 48N
+        if 'cluster_id' in gdf.columns:
+            gdf.cluster_stats = self.cluster_statistics(gdf, lon_col, lat_col, prob_col)
         
-        # Perform Getis-Ord Gi* analysis
-        print(f"   Running Getis-Ord Gi* analysis...")
-        gdf_utm = self._getis_ord_gi_star(gdf_utm, prob_col)
+        return gdf
+    
+    @staticmethod
+    def cluster_statistics(
+        df: pd.DataFrame,
+        lon_col: str = 'lon',
+        lat_col: str = 'lat',
+        prob_col: str = 'bloom_probability'
+    ) -> pd.DataFrame:
+        """
+        Per-cluster size, probability and centroid in one bincount pass
         
-        # Perform DBSCAN clustering
-        print(f"   Running DBSCAN clustering...")
-        gdf_utm = self._dbscan_clustering(gdf_utm)
+        Args:
+            df: Hotspot table with cluster_id
+            lon_col: Longitude column name
+            lat_col: Latitude column name
+            prob_col: Bloom probability column name
+            
+        Returns:
+            DataFrame with one row per cluster (noise excluded)
+        """
+        labels = df['cluster_id'].to_numpy()
+        clustered = labels >= 0
+        cluster_ids, inverse = np.unique(labels[clustered], return_inverse=True)
+        
+        prob = df[prob_col].to_numpy(dtype=np.float64)[clustered]
+        counts = np.bincount(inverse, minlength=len(cluster_ids))
+        max_prob = np.full(len(cluster_ids), -np.inf)
+        np.maximum.at(max_prob, inverse, prob)
+        
+        return pd.DataFrame({
+            'cluster_id': cluster_ids,
+            'n_points': counts,
+            'mean_probability': np.bincount(inverse, weights=prob) / counts,
+            'max_probability': max_prob,
+            'centroid_lon': np.bincount(inverse, weights=df[lon_col].to_numpy(dtype=np.float64)[clustered]) / counts,
+            'centroid_lat': np.bincount(inverse, weights=df[lat_col].to_numpy(dtype=np.float64)[clustered]) / counts
+        })
+    
+    @staticmethod
+    def _coordinate_key(lon: np.ndarray, lat: np.ndarray) -> str:
+        """Hash of a full coordinate array pair"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(np.ascontiguousarray(lon, dtype=np.float64).tobytes())
+        h.update(np.ascontiguousarray(lat, dtype=np.float64).tobytes())
+        return h.hexdigest()
+    
+    def _neighborhood(self, lon: np.ndarray, lat: np.ndarray) -> Dict[str, Any]:
+        """
+        Projected coordinates and neighbor distances for a prediction grid (LRU cached)
+        
+        Args:
+            lon: Longitudes of every grid point
+            lat: Latitudes of every grid point
+            
+        Returns:
+            Dict with 'xy' (n, 2) projected coordinates, search 'radius' and
+            'distances' (CSR within radius, or None if too dense to cache)
+        """
+        key = self._coordinate_key(lon, lat)
+        entry = self._neighborhood_cache.get(key)
+        if entry is not None:
+            self._neighborhood_cache.move_to_end(key)
+            return entry
+        
+        transformer = Transformer.from_crs('EPSG:4326', self.PROJECTED_CRS, always_xy=True)
+        xy = np.column_stack(transformer.transform(lon, lat))
+        
+        # One radius serves both Gi* (distance band) and DBSCAN (eps)
+        radius = max(self.distance_band, self.dbscan_eps)
+        distances = None
+        if estimate_neighbor_pairs(xy, radius) <= self.max_cached_pairs:
+            distances = distance_band_matrix(xy, radius)
+        
+        entry = {'xy': xy, 'radius': radius, 'distances': distances}
+        self._neighborhood_cache[key] = entry
+        while len(self._neighborhood_cache) > self.cache_size:
+            self._neighborhood_cache.popitem(last=False)
+        
+        return entry
+    
+    def clear_neighborhood_cache(self) -> None:
+        """Drop cached grid neighborhoods (e.g. once a spatial tile is done)"""
+        self._neighborhood_cache.clear()
+    
+    def _subset_distances(
+        self,
+        lon: np.ndarray,
+        lat: np.ndarray,
+        idx: np.ndarray
+    ) -> sparse.csr_matrix:
+        """
+        Neighbor distance matrix restricted to a subset of grid points
         
-        # Convert back to WGS84
-        gdf = gdf_utm.to_crs('EPSG:4326')
+        Args:
+            lon: Longitudes of every grid point
+            lat: Latitudes of every grid point
+            idx: Positions of the subset
+            
+        Returns:
+            (len(idx), len(idx)) CSR distances within the search radius
+        """
+        neighborhood = self._neighborhood(lon, lat)
         
-        # Summary statistics
-        n_hotspots = len(gdf[gdf['gi_star_significant'] == True])
-        n_clusters = gdf['cluster_id'].nunique() - (1 if -1 in gdf['cluster_id'].values else 0)
+        if neighborhood['distances'] is not None:
+            return neighborhood['distances'][idx][:, idx]
         
-        print(f"   ✅ Statistically significant hotspots: {n_hotspots}")
-        print(f"   ✅ DBSCAN clusters found: {n_clusters}")
+        xy, radius = neighborhood['xy'][idx], neighborhood['radius']
+        if estimate_neighbor_pairs(xy, radius) <= self.max_cached_pairs:
+            return distance_band_matrix(xy, radius)
         
-        return gdf
+        # Too dense even for the subset: keep each point's nearest neighbors only
+        max_neighbors = max(self.dbscan_min_samples, self.max_cached_pairs // (2 * max(len(idx), 1)))
+        print(f"   ⚠️  {len(idx)} hotspot points exceed the neighbor pair budget "
+              f"({self.max_cached_pairs:,}); keeping the {max_neighbors} nearest neighbors per point")
+        return distance_band_matrix(xy, radius, max_neighbors=max_neighbors)
     
     def _getis_ord_gi_star(
         self,
-        gdf: gpd.GeoDataFrame,
-        value_col: str
-    ) -> gpd.GeoDataFrame:
+        gdf: pd.DataFrame,
+        value_col: str,
+        distances: sparse.csr_matrix,
+        population: Optional[np.ndarray] = None,
+        population_index: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
         """
         Calculate Getis-Ord Gi* statistic
         
         Args:
-            gdf: GeoDataFrame (must be in projected CRS)
+            gdf: Hotspot table with values
             value_col: Column with values to analyze
+            distances: Projected neighbor distances (rows aligned with gdf)
+            population: Study-area values (None → gdf's values)
+            population_index: Position of each gdf row in population
             
         Returns:
-            GeoDataFrame with Gi* results
+            Table with Gi* results
         """
         try:
-            # Create spatial weights matrix (distance band)
-            w = DistanceBand.from_dataframe(
-                gdf,
-                threshold=self.distance_band,
-                binary=False,
-                alpha=-1.0  # Inverse distance weighting
-            )
+            # Sparse inverse-distance weights from the shared neighbor distances
+            w = distance_band_weights(distances, self.distance_band, alpha=-1.0)
             
             # Calculate Gi*
             values = gdf[value_col].values
-            gi_star = G_Local(values, w, star=True)
+            z, p = gi_star(
+                values, w,
+                permutations=self.gi_star_permutations,
+                population=population,
+                population_index=population_index
+            )
             
             # Add results to GeoDataFrame
-            gdf['gi_star_z'] = gi_star.Zs
-            gdf['gi_star_p'] = gi_star.p_sim
+            gdf['gi_star_z'] = z
+            gdf['gi_star_p'] = p
             
-            # Classify significance (p < 0.05)
-            gdf['gi_star_significant'] = gdf['gi_star_p'] < 0.05
+            # Classify significance
+            significant = gdf['gi_star_p'] < self.significance_level
+            gdf['gi_star_significant'] = significant
             
             # Classify hotspot types
             gdf['hotspot_type'] = 'Not Significant'
-            gdf.loc[(gdf['gi_star_z'] > 1.96) & (gdf['gi_star_p'] < 0.05), 'hotspot_type'] = 'Hot Spot'
-            gdf.loc[(gdf['gi_star_z'] < -1.96) & (gdf['gi_star_p'] < 0.05), 'hotspot_type'] = 'Cold Spot'
+            gdf.loc[(gdf['gi_star_z'] > 1.96) & significant, 'hotspot_type'] = 'Hot Spot'
+            gdf.loc[(gdf['gi_star_z'] < -1.96) & significant, 'hotspot_type'] = 'Cold Spot'
             
         except Exception as e:
             print(f"   ⚠️  Gi* calculation failed: {e}")
@@ -150,51 +364,39 @@ class HotspotAnalyzer:
         
         return gdf
     
-    def _dbscan_clustering(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    def _dbscan_clustering(
+        self,
+        gdf: pd.DataFrame,
+        distances: sparse.csr_matrix
+    ) -> pd.DataFrame:
         """
         Perform DBSCAN clustering
         
         Args:
-            gdf: GeoDataFrame (must be in projected CRS)
+            gdf: Hotspot table
+            distances: Projected neighbor distances (rows aligned with gdf)
             
         Returns:
-            GeoDataFrame with cluster IDs
+            Table with cluster IDs
         """
-        # Extract coordinates
-        coords = np.array([[geom.x, geom.y] for geom in gdf.geometry])
-        
-        # DBSCAN clustering
+        # DBSCAN clustering on the precomputed sparse neighbor graph
         dbscan = DBSCAN(
             eps=self.dbscan_eps,
             min_samples=self.dbscan_min_samples,
-            metric='euclidean'
+            metric='precomputed'
         )
         
-        clusters = dbscan.fit_predict(coords)
+        dbscan.fit(distances)
+        clusters = dbscan.labels_
         gdf['cluster_id'] = clusters
         
         # Mark noise points
-        gdf['is_noise'] = gdf['cluster_id'] == -1
+        gdf['is_noise'] = clusters == -1
         
-        # Calculate cluster statistics
-        cluster_stats = []
-        for cluster_id in gdf['cluster_id'].unique():
-            if cluster_id == -1:  # Skip noise
-                continue
-            
-            cluster_points = gdf[gdf['cluster_id'] == cluster_id]
-            
-            stats = {
-                'cluster_id': cluster_id,
-                'n_points': len(cluster_points),
-                'mean_probability': cluster_points['bloom_probability'].mean(),
-                'max_probability': cluster_points['bloom_probability'].max(),
-                'centroid_lon': cluster_points.geometry.centroid.x.mean(),
-                'centroid_lat': cluster_points.geometry.centroid.y.mean()
-            }
-            cluster_stats.append(stats)
-        
-        gdf.cluster_stats = pd.DataFrame(cluster_stats)
+        # Core samples (lets tiled callers merge clusters across tile edges)
+        is_core = np.zeros(len(clusters), dtype=bool)
+        is_core[dbscan.core_sample_indices_] = True
+        gdf['is_core_sample'] = is_core
         
         return gdf
     
@@ -308,16 +510,30 @@ class HotspotAnalyzer:
         """
         Export hotspots to file
         
+        Columnar formats (GeoParquet, FlatGeobuf) are written sorted by date
+        so a date range is a contiguous block of rows.
+        
         Args:
             gdf: GeoDataFrame with hotspots
             output_path: Output file path
-            format: Output format ('geojson', 'shapefile', 'csv')
+            format: Output format ('geojson', 'shapefile', 'csv',
+                'geoparquet', 'flatgeobuf')
         """
         if len(gdf) == 0:
             print("   ⚠️  No hotspots to export")
             return
         
-        if format == 'geojson':
+        if format in ('geoparquet', 'flatgeobuf') and 'date' in gdf.columns:
+            gdf = gdf.sort_values('date', kind='stable')
+        
+        if format == 'geoparquet':
+            gdf.to_parquet(output_path, index=False)
+        elif format == 'flatgeobuf':
+            # No spatial index: it would reorder features and break the date sort
+            if 'date' in gdf.columns:
+                gdf = gdf.assign(date=gdf['date'].astype(str))
+            gdf.to_file(output_path, driver='FlatGeobuf', SPATIAL_INDEX='NO')
+        elif format == 'geojson':
             gdf.to_file(output_path, driver='GeoJSON')
         elif format == 'shapefile':
             gdf.to_file(output_path, driver='ESRI Shapefile')
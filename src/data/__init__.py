@@ -1,5 +1,7 @@
 """Data collection and processing modules"""
 from .ee_data_collector import EarthEngineDataCollector
 from .spectral_indices import SpectralIndices
+from .timeseries_cache import TimeSeriesCache
+from .pixel_store import PixelTimeSeriesStore
 
-__all__ = ['EarthEngineDataCollector', 'SpectralIndices']
+__all__ = ['EarthEngineDataCollector', 'SpectralIndices', 'TimeSeriesCache', 'PixelTimeSeriesStore']
@@ -3,8 +3,10 @@ Simple Earth Engine data collector - matches notebook logic exactly
 No complex topographic correction - just cloud masking and indices
 """
 import ee
+import time
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Optional, List
 from datetime import datetime
 
@@ -23,14 +25,48 @@ except ImportError:
 class EarthEngineDataCollector:
     """Simple data collector matching notebook approach"""
     
-    def __init__(self, scale: int = 20):
+    COLLECTION_ID = 'COPERNICUS/S2_SR_HARMONIZED'
+    
+    # Stands in for null properties in 'columns' extraction (decoded as NaN);
+    # a string, so no numeric band or property value can collide with it
+    NULL_MARKER = '__null__'
+    
+    def __init__(
+        self,
+        scale: int = 20,
+        cloud_threshold: float = 60,
+        fetch_workers: int = 4,
+        batch_size: int = 50,
+        max_batch_size: int = 500,
+        target_latency: float = 5.0,
+        extraction_mode: str = 'paged',
+        dtype: str = 'float32'
+    ):
         """
         Initialize collector
         
         Args:
             scale: Resolution in meters (default: 20m for S2)
+            cloud_threshold: Max CLOUDY_PIXEL_PERCENTAGE for scene filtering
+            fetch_workers: Max feature slices fetched concurrently
+            batch_size: Initial slice size for FC to DataFrame conversion
+            max_batch_size: Upper bound for adaptive slice size
+            target_latency: Per-slice latency (seconds) the batch size adapts to
+            extraction_mode: 'paged' (toList slices) or 'columns' (one
+                reduceColumns computation, falls back to paging on failure)
+            dtype: Float dtype of extracted band columns (runtime.dtype)
         """
+        if extraction_mode not in ('paged', 'columns'):
+            raise ValueError(f"Unknown extraction mode: {extraction_mode}")
+        
         self.scale = scale
+        self.cloud_threshold = cloud_threshold
+        self.fetch_workers = max(1, fetch_workers)
+        self.batch_size = batch_size
+        self.max_batch_size = max(batch_size, max_batch_size)
+        self.target_latency = target_latency
+        self.extraction_mode = extraction_mode
+        self.dtype = np.dtype(dtype)
         self.spectral_calc = SpectralIndices()
     
     def _cloud_mask(self, image: ee.Image) -> ee.Image:
@@ -73,10 +109,10 @@ class EarthEngineDataCollector:
         Returns:
             Processed image collection with indices
         """
-        collection = (ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED')
+        collection = (ee.ImageCollection(self.COLLECTION_ID)
                      .filterBounds(geometry)
                      .filterDate(start_date, end_date)
-                     .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', 60))
+                     .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', self.cloud_threshold))
                      .map(self._cloud_mask)
                      .map(self.spectral_calc.add_all_indices))
         
@@ -129,15 +165,152 @@ class EarthEngineDataCollector:
         # Filter out nulls (images with all masked pixels)
         fc = fc.filter(ee.Filter.notNull(bands[:1]))  # At least first band must exist
         
-        # Convert to DataFrame - matches notebook fc_to_df() function
-        df = self._fc_to_dataframe(fc, properties=['date'] + bands)
+        # Convert to DataFrame
+        df = self._fc_to_table(fc, properties=['date'] + bands)
         
         if len(df) > 0:
             df['date'] = pd.to_datetime(df['date'])
             df = df.sort_values('date').reset_index(drop=True)
+            df = self._cast_bands(df, bands)
+        
+        return df
+    
+    def extract_pixel_time_series(
+        self,
+        collection: ee.ImageCollection,
+        lons: np.ndarray,
+        lats: np.ndarray,
+        bands: Optional[List[str]] = None,
+        max_points_per_request: int = 5000
+    ) -> pd.DataFrame:
+        """
+        Extract per-pixel time series at point locations
+        
+        Every image in the collection is sampled at all points with
+        sampleRegions, so each chunk of points costs one computation for the
+        whole date window. Masked (cloudy) pixels produce no row.
+        
+        Args:
+            collection: Image collection (already filtered to the date window)
+            lons: Point longitudes
+            lats: Point latitudes
+            bands: Bands to extract (default: bloom indices)
+            max_points_per_request: Points per Earth Engine request
+            
+        Returns:
+            Long-form DataFrame with pixel_id (index into lons/lats), date, bands
+        """
+        if bands is None:
+            bands = SpectralIndices.get_bloom_sensitive_bands()
+        
+        collection = collection.select(bands)
+        properties = ['pixel_id', 'date'] + bands
+        frames = []
+        
+        for start in range(0, len(lons), max_points_per_request):
+            end = min(start + max_points_per_request, len(lons))
+            points = ee.FeatureCollection([
+                ee.Feature(ee.Geometry.Point([float(lon), float(lat)]), {'pixel_id': i})
+                for i, lon, lat in zip(range(start, end), lons[start:end], lats[start:end])
+            ])
+            
+            def sample_pixels(img):
+                """Sample one image at all points and attach date"""
+                img = ee.Image(img)
+                date_str = img.date().format('YYYY-MM-dd')
+                samples = img.sampleRegions(
+                    collection=points,
+                    properties=['pixel_id'],
+                    scale=self.scale,
+                    geometries=False
+                )
+                return samples.map(lambda f: f.set('date', date_str))
+            
+            fc = collection.map(sample_pixels).flatten()
+            frames.append(self._fc_to_table(fc, properties))
+        
+        frames = [df for df in frames if len(df) > 0]
+        if not frames:
+            return pd.DataFrame(columns=properties)
+        
+        df = pd.concat(frames, ignore_index=True)
+        df['pixel_id'] = df['pixel_id'].astype(np.int64)
+        df['date'] = pd.to_datetime(df['date'])
         
+        return self._cast_bands(df, bands)
+    
+    def _cast_bands(self, df: pd.DataFrame, bands: List[str]) -> pd.DataFrame:
+        """Cast numeric band columns to the collector dtype"""
+        for band in bands:
+            if band in df.columns and pd.api.types.is_float_dtype(df[band]):
+                df[band] = df[band].astype(self.dtype, copy=False)
         return df
     
+    def _fc_to_table(
+        self,
+        fc: ee.FeatureCollection,
+        properties: List[str]
+    ) -> pd.DataFrame:
+        """
+        FC to DataFrame using the configured extraction mode
+        
+        Args:
+            fc: Feature collection
+            properties: Properties to extract
+            
+        Returns:
+            Pandas DataFrame
+        """
+        if self.extraction_mode == 'columns':
+            try:
+                return self._fc_to_columns(fc, properties)
+            except Exception as e:
+                print(f"Warning: Column extraction failed, falling back to paging: {e}")
+        
+        return self._fc_to_dataframe(fc, properties)
+    
+    def _fc_to_columns(
+        self,
+        fc: ee.FeatureCollection,
+        properties: List[str]
+    ) -> pd.DataFrame:
+        """
+        FC to DataFrame in a single server-side computation
+        
+        Reduces the whole collection into one list per property with
+        reduceColumns, avoiding the quadratic toList().slice() paging, and
+        decodes each list straight into a NumPy column.
+        
+        Args:
+            fc: Feature collection
+            properties: Properties to extract
+            
+        Returns:
+            Pandas DataFrame
+        """
+        # reduceColumns drops every feature with a null selector, so fill
+        # nulls server-side first; rows then match the paged extraction
+        defaults = ee.Dictionary.fromLists(properties, [self.NULL_MARKER] * len(properties))
+        filled = fc.map(lambda f: f.set(defaults.combine(f.toDictionary(), True)))
+        
+        reducer = ee.Reducer.toList().repeat(len(properties))
+        result = robust_getinfo(filled.reduceColumns(reducer, properties))
+        
+        columns = {}
+        for name, values in zip(properties, result.get('list', [])):
+            column = np.asarray(values, dtype=object)
+            null = np.array([isinstance(v, str) and v == self.NULL_MARKER for v in values], dtype=bool)
+            try:
+                column = np.where(null, np.nan, column).astype(self.dtype)
+            except (TypeError, ValueError):
+                column[null] = None
+            columns[name] = column
+        
+        if not columns:
+            return pd.DataFrame(columns=properties)
+        
+        return pd.DataFrame(columns, columns=properties)
+    
     def _fc_to_dataframe(
         self,
         fc: ee.FeatureCollection,
@@ -167,25 +340,53 @@ class EarthEngineDataCollector:
         # Convert to list
         lst = fc.toList(size)
         
-        # Extract features in batches to avoid timeout
-        batch_size = 50
-        all_rows = []
+        def fetch_slice(start: int, end: int):
+            """Fetch one slice and time the round trip"""
+            t0 = time.monotonic()
+            batch_info = robust_getinfo(lst.slice(start, end))
+            return batch_info, time.monotonic() - t0
         
-        for start in range(0, size, batch_size):
-            end = min(start + batch_size, size)
-            batch = lst.slice(start, end)
-            
-            try:
-                # Get batch info
-                batch_info = robust_getinfo(batch)
+        # Extract features in slices with bounded concurrency; slice size adapts
+        # to observed latency (grow while fast, shrink when close to timeouts)
+        batch_size = self.batch_size
+        min_batch_size = max(1, self.batch_size // 4)
+        rows_by_start = {}
+        next_start = 0
+        pending = {}
+        
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+            while next_start < size or pending:
+                while next_start < size and len(pending) < self.fetch_workers:
+                    end = min(next_start + batch_size, size)
+                    future = executor.submit(fetch_slice, next_start, end)
+                    pending[future] = (next_start, end)
+                    next_start = end
                 
-                for feat_dict in batch_info:
-                    props = feat_dict.get('properties', {})
-                    row = {k: props.get(k) for k in properties}
-                    all_rows.append(row)
-            except Exception as e:
-                print(f"Warning: Failed to extract batch {start}-{end}: {e}")
-                continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    start, end = pending.pop(future)
+                    try:
+                        batch_info, latency = future.result()
+                    except Exception as e:
+                        print(f"Warning: Failed to extract batch {start}-{end}: {e}")
+                        batch_size = max(min_batch_size, batch_size // 2)
+                        continue
+                    
+                    rows_by_start[start] = [
+                        {k: feat_dict.get('properties', {}).get(k) for k in properties}
+                        for feat_dict in batch_info
+                    ]
+                    
+                    if latency < self.target_latency / 2:
+                        batch_size = min(self.max_batch_size, batch_size * 2)
+                    elif latency > self.target_latency:
+                        batch_size = max(min_batch_size, batch_size // 2)
+        
+        # Reassemble in collection order
+        all_rows = []
+        for start in sorted(rows_by_start):
+            all_rows.extend(rows_by_start[start])
         
         return pd.DataFrame(all_rows)
     
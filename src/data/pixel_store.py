@@ -0,0 +1,381 @@
+"""
+Chunked on-disk store of per-pixel time series for out-of-core training
+Pixels are written in fixed-size chunks of .npy files (read back as np.memmap),
+so (n_pixels x n_dates x n_features) never has to fit in memory
+"""
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class PixelTimeSeriesStore:
+    """
+    Per-pixel time series on a shared date axis, stored chunk by chunk
+
+    Layout:
+        meta.json               features, dtype, dates, chunk list
+        chunk_00000.npy         (n_pixels, n_dates, n_features); NaN where unobserved
+        chunk_00000_ids.npy     pixel ids of the chunk's rows
+    """
+
+    def __init__(self, store_dir: Path):
+        """
+        Open an existing store
+
+        Args:
+            store_dir: Store directory (written by create() / append())
+        """
+        self.store_dir = Path(store_dir)
+        with open(self.store_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+        self.features = self.meta['features']
+        self.dtype = np.dtype(self.meta['dtype'])
+        self.dates = np.array(self.meta['dates'], dtype='datetime64[D]')
+        self.chunk_pixels = self.meta['chunk_pixels']
+
+    @classmethod
+    def create(
+        cls,
+        store_dir: Path,
+        dates: Sequence[Any],
+        features: List[str],
+        dtype: str = 'float32',
+        chunk_pixels: int = 1024
+    ) -> 'PixelTimeSeriesStore':
+        """
+        Create an empty store (an existing store in store_dir is replaced)
+
+        Args:
+            store_dir: Store directory (e.g. outputs/timeseries/pixel_store/{AOI})
+            dates: Observation dates of the date axis
+            features: Feature columns, target first
+            dtype: Float dtype of stored values (runtime.dtype)
+            chunk_pixels: Pixels per chunk file
+
+        Returns:
+            The opened store
+        """
+        store_dir = Path(store_dir)
+        if store_dir.exists():
+            shutil.rmtree(store_dir)
+        store_dir.mkdir(parents=True, exist_ok=True)
+
+        dates = np.unique(pd.to_datetime(pd.Series(dates)).to_numpy().astype('datetime64[D]'))
+        meta = {
+            'features': list(features),
+            'dtype': np.dtype(dtype).name,
+            'dates': [str(d) for d in dates],
+            'chunk_pixels': int(chunk_pixels),
+            'chunks': []
+        }
+        cls._write_meta(store_dir, meta)
+
+        return cls(store_dir)
+
+    @staticmethod
+    def _write_meta(store_dir: Path, meta: Dict[str, Any]) -> None:
+        """Write meta.json atomically (chunks only count once listed here)"""
+        tmp_path = store_dir / 'meta.json.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        tmp_path.replace(store_dir / 'meta.json')
+
+    @property
+    def n_chunks(self) -> int:
+        return len(self.meta['chunks'])
+
+    @property
+    def n_pixels(self) -> int:
+        return sum(chunk['n_pixels'] for chunk in self.meta['chunks'])
+
+    @property
+    def n_dates(self) -> int:
+        return len(self.dates)
+
+    def append(self, pixel_df: pd.DataFrame) -> int:
+        """
+        Write long-form pixel observations as new chunks
+
+        Args:
+            pixel_df: Rows of (pixel_id, date, feature columns), e.g. from
+                EarthEngineDataCollector.extract_pixel_time_series(); pixel ids
+                must not repeat across appends
+
+        Returns:
+            Pixels written
+        """
+        if len(pixel_df) == 0:
+            return 0
+
+        # Overlapping tiles on the same day → one observation per pixel/date
+        df = pixel_df.groupby(['pixel_id', 'date'], as_index=False).mean(numeric_only=True)
+
+        day = pd.to_datetime(df['date']).to_numpy().astype('datetime64[D]')
+        day_idx = np.clip(np.searchsorted(self.dates, day), 0, self.n_dates - 1)
+        on_axis = self.dates[day_idx] == day
+        df, day_idx = df[on_axis], day_idx[on_axis]
+
+        ids, inverse = np.unique(df['pixel_id'].to_numpy(dtype=np.int64), return_inverse=True)
+        values = df[self.features].to_numpy(dtype=self.dtype)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(0, len(ids) + self.chunk_pixels, self.chunk_pixels))
+
+        for start in range(0, len(ids), self.chunk_pixels):
+            rows = order[bounds[start // self.chunk_pixels]:bounds[start // self.chunk_pixels + 1]]
+            chunk_ids = ids[start:start + self.chunk_pixels]
+            name = f"chunk_{self.n_chunks:05d}"
+
+            cube = np.lib.format.open_memmap(
+                self.store_dir / f"{name}.npy", mode='w+', dtype=self.dtype,
+                shape=(len(chunk_ids), self.n_dates, len(self.features))
+            )
+            cube[:] = np.nan
+            cube[inverse[rows] - start, day_idx[rows]] = values[rows]
+            cube.flush()
+            del cube
+            np.save(self.store_dir / f"{name}_ids.npy", chunk_ids)
+
+            self.meta['chunks'].append({'name': name, 'n_pixels': int(len(chunk_ids))})
+            self._write_meta(self.store_dir, self.meta)
+
+        return int(len(ids))
+
+    def chunk(self, i: int) -> np.memmap:
+        """Raw values of chunk i (read-only memmap)"""
+        return np.load(self.store_dir / f"{self.meta['chunks'][i]['name']}.npy", mmap_mode='r')
+
+    def chunk_ids(self, i: int) -> np.ndarray:
+        """Pixel ids of chunk i"""
+        return np.load(self.store_dir / f"{self.meta['chunks'][i]['name']}_ids.npy")
+
+    def normalization_stats(
+        self,
+        days: Optional[slice] = None,
+        method: str = 'standard'
+    ) -> Dict[str, Any]:
+        """
+        Per-feature normalization statistics streamed over all chunks
+
+        Same format as TimeSeriesDataPreprocessor.fit_normalization().
+
+        Args:
+            days: Date-axis slice to fit on (e.g. the training period)
+            method: 'standard' (mean/std) or 'minmax'
+
+        Returns:
+            Dict with method, features, offset and scale
+        """
+        if method not in ('standard', 'minmax'):
+            raise ValueError(f"Unknown normalization method: {method}")
+
+        days = days if days is not None else slice(None)
+        n_features = len(self.features)
+        count = np.zeros(n_features)
+        total = np.zeros(n_features)
+        total_sq = np.zeros(n_features)
+        low = np.full(n_features, np.inf)
+        high = np.full(n_features, -np.inf)
+
+        for i in range(self.n_chunks):
+            block = np.asarray(self.chunk(i)[:, days], dtype=np.float64).reshape(-1, n_features)
+            valid = ~np.isnan(block)
+            block = np.where(valid, block, 0.0)
+
+            count += valid.sum(axis=0)
+            total += block.sum(axis=0)
+            total_sq += (block ** 2).sum(axis=0)
+            low = np.minimum(low, np.where(valid, block, np.inf).min(axis=0, initial=np.inf))
+            high = np.maximum(high, np.where(valid, block, -np.inf).max(axis=0, initial=-np.inf))
+
+        n = np.maximum(count, 1)
+        if method == 'standard':
+            offset = total / n
+            scale = np.sqrt(np.maximum(total_sq / n - offset ** 2, 0.0))
+        else:
+            offset = np.where(count > 0, low, 0.0)
+            scale = np.where(count > 0, high - low, 1.0)
+
+        # Constant / empty columns pass through unscaled
+        scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+
+        return {
+            'method': method,
+            'features': list(self.features),
+            'offset': offset.tolist(),
+            'scale': scale.tolist()
+        }
+
+    def _load_block(
+        self,
+        chunks: Sequence[int],
+        target_feature: int,
+        normalization: Optional[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Read chunks into memory, gap-filled and normalized
+
+        Unobserved dates repeat the nearest observation (ffill, then bfill for
+        the leading gap), matching the training and inference pipelines.
+        Pixels without any observation are dropped.
+
+        Returns:
+            (values (n_pixels, n_dates, n_features), raw target (n_pixels, n_dates))
+        """
+        block = np.concatenate([np.array(self.chunk(i)) for i in chunks])
+        valid = ~np.isnan(block)
+        block = block[valid.any(axis=(1, 2))]
+        valid = valid[valid.any(axis=(1, 2))]
+
+        idx = np.where(valid, np.arange(self.n_dates)[None, :, None], -1)
+        np.maximum.accumulate(idx, axis=1, out=idx)
+        first_valid = valid.argmax(axis=1)[:, None, :]
+        idx = np.where(idx < 0, first_valid, idx)
+        block = np.take_along_axis(block, idx, axis=1)
+        np.nan_to_num(block, copy=False)
+
+        target = block[:, :, target_feature].copy()
+        if normalization is not None:
+            block -= np.asarray(normalization['offset'], dtype=block.dtype)
+            block /= np.asarray(normalization['scale'], dtype=block.dtype)
+
+        return block, target
+
+    def _window_starts(
+        self,
+        sequence_length: int,
+        forecast_horizon: int,
+        target_days: Optional[Tuple[int, int]]
+    ) -> Tuple[int, int]:
+        """[first, last) window start index whose first target lies in target_days"""
+        t0, t1 = target_days if target_days is not None else (0, self.n_dates)
+        first = max(t0 - sequence_length, 0)
+        last = min(t1 - sequence_length, self.n_dates - sequence_length - forecast_horizon + 1)
+        return first, max(last, first)
+
+    @staticmethod
+    def _gather(
+        block: np.ndarray,
+        target: np.ndarray,
+        pixels: np.ndarray,
+        starts: np.ndarray,
+        sequence_length: int,
+        forecast_horizon: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Copy the selected windows out of a block"""
+        steps = starts[:, None] + np.arange(sequence_length)
+        X = block[pixels[:, None], steps]
+        y = target[pixels[:, None], starts[:, None] + sequence_length + np.arange(forecast_horizon)]
+        return X, y
+
+    def iter_windows(
+        self,
+        sequence_length: int,
+        batch_size: int,
+        forecast_horizon: int = 1,
+        target_feature: int = 0,
+        target_days: Optional[Tuple[int, int]] = None,
+        normalization: Optional[Dict[str, Any]] = None,
+        shuffle: bool = True,
+        block_chunks: int = 2,
+        seed: Optional[int] = None
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield (X, y) mini-batches of windows, one block of chunks in memory at a time
+
+        Shuffling is two-level: chunk order, then all windows of the loaded
+        block.
+
+        Args:
+            sequence_length: Observations per input sequence
+            batch_size: Windows per batch
+            forecast_horizon: Target steps per window
+            target_feature: Feature index forecast as y (kept in raw units)
+            target_days: (start, stop) date-axis range the window targets must fall in
+            normalization: Statistics applied to inputs (normalization_stats())
+            shuffle: Shuffle chunks and windows
+            block_chunks: Chunks loaded together (memory vs. shuffle quality)
+            seed: Random seed
+
+        Yields:
+            X (batch, sequence_length, n_features), y (batch, forecast_horizon)
+        """
+        rng = np.random.default_rng(seed)
+        first, last = self._window_starts(sequence_length, forecast_horizon, target_days)
+        n_starts = last - first
+        if n_starts == 0:
+            return
+
+        chunk_order = rng.permutation(self.n_chunks) if shuffle else np.arange(self.n_chunks)
+
+        for b in range(0, self.n_chunks, block_chunks):
+            block, target = self._load_block(chunk_order[b:b + block_chunks], target_feature, normalization)
+
+            n_windows = len(block) * n_starts
+            windows = rng.permutation(n_windows) if shuffle else np.arange(n_windows)
+
+            for start in range(0, n_windows, batch_size):
+                w = windows[start:start + batch_size]
+                yield self._gather(block, target, w // n_starts, first + w % n_starts,
+                                   sequence_length, forecast_horizon)
+
+    def sample_windows(
+        self,
+        n_samples: int,
+        sequence_length: int,
+        forecast_horizon: int = 1,
+        target_feature: int = 0,
+        target_days: Optional[Tuple[int, int]] = None,
+        normalization: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Random subsample of windows across all chunks, as in-memory arrays
+
+        Reads one chunk at a time; windows are drawn uniformly over all pixels
+        (chunks contribute in proportion to their size).
+
+        Args:
+            n_samples: Windows to draw (fewer if the store has fewer)
+            sequence_length: Observations per input sequence
+            forecast_horizon: Target steps per window
+            target_feature: Feature index forecast as y (kept in raw units)
+            target_days: (start, stop) date-axis range the window targets must fall in
+            normalization: Statistics applied to inputs (normalization_stats())
+            seed: Random seed
+
+        Returns:
+            X (n, sequence_length, n_features), y (n, forecast_horizon)
+        """
+        rng = np.random.default_rng(seed)
+        first, last = self._window_starts(sequence_length, forecast_horizon, target_days)
+        n_starts = last - first
+
+        sizes = np.array([chunk['n_pixels'] for chunk in self.meta['chunks']], dtype=np.int64)
+        n_total = int(sizes.sum()) * n_starts
+        if n_total == 0 or n_samples <= 0:
+            return (np.empty((0, sequence_length, len(self.features)), dtype=self.dtype),
+                    np.empty((0, forecast_horizon), dtype=self.dtype))
+
+        per_chunk = rng.multinomial(min(n_samples, n_total), sizes / sizes.sum())
+        X_parts, y_parts = [], []
+
+        for i in np.flatnonzero(per_chunk):
+            block, target = self._load_block([i], target_feature, normalization)
+            if len(block) == 0:
+                continue
+
+            w = rng.choice(len(block) * n_starts, size=min(per_chunk[i], len(block) * n_starts), replace=False)
+            X, y = self._gather(block, target, w // n_starts, first + w % n_starts,
+                                sequence_length, forecast_horizon)
+            X_parts.append(X)
+            y_parts.append(y)
+
+        if not X_parts:
+            return (np.empty((0, sequence_length, len(self.features)), dtype=self.dtype),
+                    np.empty((0, forecast_horizon), dtype=self.dtype))
+
+        return np.concatenate(X_parts), np.concatenate(y_parts)
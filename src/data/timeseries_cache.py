@@ -0,0 +1,185 @@
+"""
+Persistent on-disk cache for Earth Engine time-series extraction
+Stores extracted AOI time series as Parquet and only fetches new dates on later runs
+"""
+import hashlib
+import json
+import pandas as pd
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+
+
+class TimeSeriesCache:
+    """Content-addressed Parquet cache with incremental (high-water mark) refresh"""
+
+    def __init__(self, cache_dir: Path, refresh_days: int = 5):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding cached Parquet files and manifests
+            refresh_days: Days before the high-water mark to re-fetch on every
+                refresh, so late-ingested Sentinel-2 scenes are still picked up
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh_days = refresh_days
+
+    @staticmethod
+    def make_key(
+        coordinates: List[Any],
+        bands: List[str],
+        scale: float,
+        cloud_threshold: float,
+        collection_id: str = 'COPERNICUS/S2_SR_HARMONIZED'
+    ) -> str:
+        """
+        Build cache key from everything that changes the extracted values
+
+        The date range is deliberately not part of the key: it is tracked in the
+        manifest so later runs can extend the same entry instead of starting over.
+
+        Args:
+            coordinates: AOI polygon coordinates (as in config.yaml)
+            bands: Extracted bands / indices
+            scale: Reduction scale in meters
+            cloud_threshold: Scene-level cloud filter (CLOUDY_PIXEL_PERCENTAGE)
+            collection_id: Source image collection
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        payload = json.dumps({
+            'geometry': coordinates,
+            'bands': list(bands),
+            'scale': scale,
+            'cloud_threshold': cloud_threshold,
+            'collection': collection_id
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:20]
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        """Parquet and manifest paths for a cache key"""
+        return self.cache_dir / f"{key}.parquet", self.cache_dir / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """
+        Load cached time series
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            (DataFrame, manifest) or None if the entry does not exist
+        """
+        data_path, manifest_path = self._paths(key)
+        if not data_path.exists() or not manifest_path.exists():
+            return None
+
+        try:
+            df = pd.read_parquet(data_path)
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except Exception as e:
+            print(f"   ⚠️  Could not read cache entry {key}: {e}")
+            return None
+
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'])
+
+        return df, manifest
+
+    def save(self, key: str, df: pd.DataFrame, manifest: Dict[str, Any]) -> None:
+        """
+        Save time series and manifest (written atomically via temp files)
+
+        Args:
+            key: Cache key
+            df: Time series DataFrame
+            manifest: Coverage metadata
+        """
+        data_path, manifest_path = self._paths(key)
+
+        tmp_data = data_path.with_suffix('.parquet.tmp')
+        df.to_parquet(tmp_data, index=False)
+        tmp_data.replace(data_path)
+
+        tmp_manifest = manifest_path.with_suffix('.json.tmp')
+        with open(tmp_manifest, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        tmp_manifest.replace(manifest_path)
+
+    def get_or_fetch(
+        self,
+        key: str,
+        start_date: str,
+        end_date: str,
+        fetch_fn: Callable[[str, str], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Return time series for [start_date, end_date), fetching only what is missing
+
+        Args:
+            key: Cache key from make_key()
+            start_date: Requested start (YYYY-MM-DD, inclusive)
+            end_date: Requested end (YYYY-MM-DD, exclusive like ee filterDate)
+            fetch_fn: Callable(start, end) -> DataFrame that queries Earth Engine
+
+        Returns:
+            DataFrame covering the requested range, sorted by date
+        """
+        cached = self.load(key)
+
+        if cached is None or start_date < cached[1]['start_date']:
+            # Nothing usable cached (or the request reaches further back): full fetch
+            print(f"   Cache miss ({key}): fetching {start_date} → {end_date}")
+            df = fetch_fn(start_date, end_date)
+            covered_start = start_date
+            covered_end = end_date
+        else:
+            df, manifest = cached
+            covered_start = manifest['start_date']
+            covered_end = max(end_date, manifest['end_date'])
+            high_water = manifest.get('high_water') or manifest['start_date']
+
+            # Re-fetch a short overlap before the high-water mark for late scenes
+            refresh_start = (datetime.strptime(high_water, '%Y-%m-%d')
+                             - timedelta(days=self.refresh_days)).strftime('%Y-%m-%d')
+            refresh_start = max(refresh_start, covered_start)
+
+            if refresh_start < end_date:
+                print(f"   ♻️  Cache hit ({key}): {len(df)} rows up to {high_water}")
+                print(f"   Fetching new dates: {refresh_start} → {end_date}")
+                new_df = fetch_fn(refresh_start, end_date)
+
+                # Only replace the overlap when the refresh returned data, so a
+                # failed fetch never drops rows that are already cached
+                if len(new_df) > 0:
+                    if len(df) > 0:
+                        df = df[df['date'] < pd.Timestamp(refresh_start)]
+                        df = pd.concat([df, new_df], ignore_index=True)
+                    else:
+                        df = new_df
+            else:
+                print(f"   ♻️  Cache hit ({key}): up to date ({len(df)} rows)")
+
+        if len(df) > 0:
+            df = df.sort_values('date').reset_index(drop=True)
+            high_water = df['date'].max().strftime('%Y-%m-%d')
+        else:
+            high_water = None
+
+        self.save(key, df, {
+            'start_date': covered_start,
+            'end_date': covered_end,
+            'high_water': high_water,
+            'rows': len(df),
+            'updated_at': datetime.now().isoformat()
+        })
+
+        if len(df) == 0:
+            return df
+
+        mask = (df['date'] >= pd.Timestamp(start_date)) & (df['date'] < pd.Timestamp(end_date))
+        return df[mask].reset_index(drop=True)
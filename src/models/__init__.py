@@ -1,7 +1,9 @@
 """Machine learning and deep learning models"""
 from .base_model import BaseBloomModel, TimeSeriesDataPreprocessor
 from .random_forest_model import RandomForestBloomModel
-from .deep_learning_models import DeepLearningBloomModel, LSTMModel, GRUModel
+from .deep_learning_models import DeepLearningBloomModel, LSTMModel, GRUModel, SlidingWindowDataset
+from .spatial_inference import SpatialInferenceEngine
+from .model_registry import ModelRegistry
 
 __all__ = [
     'BaseBloomModel',
@@ -9,5 +11,8 @@ __all__ = [
     'RandomForestBloomModel',
     'DeepLearningBloomModel',
     'LSTMModel',
-    'GRUModel'
+    'GRUModel',
+    'SlidingWindowDataset',
+    'SpatialInferenceEngine',
+    'ModelRegistry'
 ]
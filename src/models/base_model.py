@@ -2,9 +2,10 @@
 Base model interface and common utilities
 """
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, List, Optional
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from pathlib import Path
 import joblib
 import json
@@ -27,6 +28,10 @@ class BaseBloomModel(ABC):
         self.is_trained = False
         self.feature_names = None
         self.scaler = None
+        
+        # Input normalization fitted on the training series (see
+        # TimeSeriesDataPreprocessor.fit_normalization); saved with the model
+        self.normalization = None
     
     @abstractmethod
     def build_model(self) -> None:
@@ -104,7 +109,8 @@ class BaseBloomModel(ABC):
             'model_name': self.model_name,
             'config': self.config,
             'is_trained': self.is_trained,
-            'feature_names': self.feature_names
+            'feature_names': self.feature_names,
+            'normalization': self.normalization
         }
         
         metadata_path = save_dir / f"{self.model_name}_metadata.json"
@@ -138,6 +144,7 @@ class BaseBloomModel(ABC):
         
         self.is_trained = metadata['is_trained']
         self.feature_names = metadata['feature_names']
+        self.normalization = metadata.get('normalization')
         
         # Load scaler if exists
         scaler_path = load_dir / f"{self.model_name}_scaler.pkl"
@@ -177,31 +184,50 @@ class TimeSeriesDataPreprocessor:
         data: np.ndarray,
         sequence_length: int,
         forecast_horizon: int = 1,
-        stride: int = 1
+        stride: int = 1,
+        materialize: bool = False,
+        target: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Create sequences for time series forecasting
         
+        Windows are read-only, zero-copy views of data (sliding_window_view);
+        slicing them stays free and copies happen only where a model needs
+        contiguous input (e.g. flattening for Random Forest).
+        
         Args:
             data: Time series data (n_samples, n_features)
             sequence_length: Length of input sequences
             forecast_horizon: Number of steps to forecast
             stride: Step size between sequences
+            materialize: Return contiguous copies instead of views
+            target: Series forecast as y (default: data[:, 0]); pass the raw
+                target when data has been normalized
             
         Returns:
             X: Input sequences (n_sequences, sequence_length, n_features)
             y: Target values (n_sequences, forecast_horizon)
         """
-        X, y = [], []
-        
-        for i in range(0, len(data) - sequence_length - forecast_horizon + 1, stride):
-            # Input sequence
-            X.append(data[i:i + sequence_length])
-            
-            # Target (forecast horizon steps ahead)
-            y.append(data[i + sequence_length:i + sequence_length + forecast_horizon, 0])
-        
-        return np.array(X), np.array(y)
+        data = np.asarray(data)
+        n_features = data.shape[1]
+        
+        # Too short for a single window
+        if len(data) < sequence_length + forecast_horizon:
+            return (np.empty((0, sequence_length, n_features), dtype=data.dtype),
+                    np.empty((0, forecast_horizon), dtype=data.dtype))
+        
+        # Input sequences: (n, n_features, seq_len) view → (n, seq_len, n_features)
+        X = sliding_window_view(data[:len(data) - forecast_horizon], sequence_length, axis=0)
+        X = X[::stride].transpose(0, 2, 1)
+        
+        # Target (forecast horizon steps ahead)
+        if target is None:
+            target = data[:, 0]
+        y = sliding_window_view(np.asarray(target)[sequence_length:], forecast_horizon)[::stride]
+        
+        if materialize:
+            return np.ascontiguousarray(X), np.ascontiguousarray(y)
+        return X, y
     
     @staticmethod
     def normalize_sequences(
@@ -213,6 +239,10 @@ class TimeSeriesDataPreprocessor:
         """
         Normalize sequences
         
+        Fits on the flattened windows, i.e. every row counted up to
+        sequence_length times; prefer fit_normalization() on the 2D series
+        before create_sequences().
+        
         Args:
             X_train: Training sequences
             X_val: Validation sequences (optional)
@@ -254,6 +284,92 @@ class TimeSeriesDataPreprocessor:
         
         return tuple(results)
     
+    @staticmethod
+    def fit_normalization(
+        data: np.ndarray,
+        feature_names: Optional[List[str]] = None,
+        method: str = 'standard'
+    ) -> Dict[str, Any]:
+        """
+        Fit per-feature normalization statistics on the 2D training series
+        
+        Args:
+            data: Training rows (n_samples, n_features), before windowing
+            feature_names: Column names (stored so inference can align columns)
+            method: 'standard' (mean/std) or 'minmax'
+            
+        Returns:
+            Dict with method, features, offset and scale (plain lists, so the
+            stats serialize to JSON and into torch checkpoints)
+        """
+        data = np.asarray(data, dtype=np.float64)
+        
+        if method == 'standard':
+            offset = np.nanmean(data, axis=0)
+            scale = np.nanstd(data, axis=0)
+        elif method == 'minmax':
+            offset = np.nanmin(data, axis=0)
+            scale = np.nanmax(data, axis=0) - offset
+        else:
+            raise ValueError(f"Unknown normalization method: {method}")
+        
+        # Constant / empty columns pass through unscaled
+        offset = np.nan_to_num(offset, nan=0.0)
+        scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+        
+        return {
+            'method': method,
+            'features': list(feature_names) if feature_names is not None else None,
+            'offset': offset.tolist(),
+            'scale': scale.tolist()
+        }
+    
+    @staticmethod
+    def apply_normalization(
+        data: np.ndarray,
+        stats: Dict[str, Any],
+        dtype: Any = np.float32
+    ) -> np.ndarray:
+        """
+        Normalize with fitted statistics, in place
+        
+        Args:
+            data: Rows (..., n_features); input already in dtype is modified in place
+            stats: Output of fit_normalization()
+            dtype: Output dtype (runtime.dtype)
+            
+        Returns:
+            The normalized array
+        """
+        data = np.asarray(data, dtype=dtype)
+        data -= np.asarray(stats['offset'], dtype=dtype)
+        data /= np.asarray(stats['scale'], dtype=dtype)
+        return data
+    
+    @staticmethod
+    def renormalize(
+        data: np.ndarray,
+        from_stats: Dict[str, Any],
+        to_stats: Optional[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Re-express normalized data under other statistics (None → raw units)
+        
+        Args:
+            data: Rows (..., n_features) normalized with from_stats
+            from_stats: Statistics data was normalized with
+            to_stats: Target statistics (e.g. a registered model's)
+            
+        Returns:
+            New array of the same dtype
+        """
+        dtype = data.dtype
+        data = data * np.asarray(from_stats['scale'], dtype=dtype)
+        data += np.asarray(from_stats['offset'], dtype=dtype)
+        if to_stats is not None:
+            data = TimeSeriesDataPreprocessor.apply_normalization(data, to_stats, dtype=dtype)
+        return data
+    
     @staticmethod
     def add_temporal_features(df: pd.DataFrame, date_col: str = 'date') -> pd.DataFrame:
         """
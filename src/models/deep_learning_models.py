@@ -4,12 +4,12 @@ LSTM/GRU models for time series bloom forecasting
 import numpy as np
 import torch
 import torch.nn as nn
-from torch.utils.data import Dataset, DataLoader
-from typing import Dict, Any, Optional, Tuple
+from torch.utils.data import Dataset
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 from pathlib import Path
 import json
 
-from .base_model import BaseBloomModel
+from .base_model import BaseBloomModel, TimeSeriesDataPreprocessor
 
 
 class TimeSeriesDataset(Dataset):
@@ -33,6 +33,43 @@ class TimeSeriesDataset(Dataset):
         return self.X[idx], self.y[idx]
 
 
+class SlidingWindowDataset(Dataset):
+    """
+    Lazy dataset of forecasting windows over one time series
+    
+    X / y are zero-copy window views of the series; a window is copied only
+    when indexed, so memory stays O(n_samples) instead of O(n * seq_len).
+    """
+    
+    def __init__(
+        self,
+        data: np.ndarray,
+        sequence_length: int,
+        forecast_horizon: int = 1,
+        stride: int = 1
+    ):
+        """
+        Initialize dataset
+        
+        Args:
+            data: Time series data (n_samples, n_features)
+            sequence_length: Length of input sequences
+            forecast_horizon: Number of steps to forecast
+            stride: Step size between sequences
+        """
+        self.data = np.ascontiguousarray(data, dtype=np.float32)
+        self.X, self.y = TimeSeriesDataPreprocessor.create_sequences(
+            self.data, sequence_length, forecast_horizon, stride
+        )
+    
+    def __len__(self) -> int:
+        return len(self.X)
+    
+    def __getitem__(self, idx) -> Tuple[torch.Tensor, torch.Tensor]:
+        return (torch.from_numpy(np.ascontiguousarray(self.X[idx])),
+                torch.from_numpy(np.ascontiguousarray(self.y[idx])))
+
+
 class LSTMModel(nn.Module):
     """LSTM model for sequence forecasting"""
     
@@ -204,9 +241,12 @@ class DeepLearningBloomModel(BaseBloomModel):
         
         # Training parameters
         self.batch_size = config.get('batch_size', 32)
+        self.inference_batch_size = config.get('inference_batch_size', 8192)
         self.epochs = config.get('epochs', 100)
         self.learning_rate = config.get('learning_rate', 0.001)
         self.patience = config.get('early_stopping_patience', 15)
+        self.checkpoint_every = config.get('checkpoint_every', 5)
+        self.materialize_budget_mb = config.get('materialize_budget_mb', 1024)
         
         # Model architecture params
         self.input_size = None  # Set during build
@@ -215,6 +255,13 @@ class DeepLearningBloomModel(BaseBloomModel):
         self.dropout = config.get('dropout', 0.2)
         self.bidirectional = config.get('bidirectional', True)
         self.output_size = config.get('output_size', 1)
+        
+        # Optimizer / LR scheduler of the last (fine-)training run; saved in the
+        # checkpoint so training and fine-tuning can continue from them
+        self.optimizer = None
+        self.optimizer_state = None
+        self.scheduler = None
+        self.scheduler_state = None
     
     def build_model(self, input_size: int) -> None:
         """
@@ -258,66 +305,335 @@ class DeepLearningBloomModel(BaseBloomModel):
     def train(
         self,
         X_train: np.ndarray,
-        y_train: np.ndarray,
+        y_train: Optional[np.ndarray] = None,
         X_val: Optional[np.ndarray] = None,
-        y_val: Optional[np.ndarray] = None
+        y_val: Optional[np.ndarray] = None,
+        checkpoint_path: Optional[Path] = None
     ) -> Dict[str, Any]:
         """
         Train the model
         
+        With checkpoint_path, the full training state is checkpointed every
+        checkpoint_every epochs and an existing checkpoint there is resumed
+        (for interrupted long trainings); it is removed once training finishes.
+        
         Args:
-            X_train: Training sequences
+            X_train: Training sequences (or a SlidingWindowDataset, then y_train is unused)
             y_train: Training labels
-            X_val: Validation sequences
+            X_val: Validation sequences (or a SlidingWindowDataset)
             y_val: Validation labels
+            checkpoint_path: In-progress training checkpoint file
             
         Returns:
             Training history
         """
+        if isinstance(X_train, SlidingWindowDataset):
+            X_train, y_train = X_train.X, X_train.y
+        if isinstance(X_val, SlidingWindowDataset):
+            X_val, y_val = X_val.X, X_val.y
+        
         print(f"\n🚀 Training {self.model_type.upper()} model...")
         print(f"   Training samples: {len(X_train)}")
         print(f"   Sequence length: {X_train.shape[1]}")
         print(f"   Features: {X_train.shape[2]}")
         
-        # Create datasets
-        train_dataset = TimeSeriesDataset(X_train, y_train)
-        train_loader = DataLoader(
-            train_dataset,
-            batch_size=self.batch_size,
-            shuffle=True,
-            num_workers=0
+        resume_state = self._start_training(checkpoint_path)
+        
+        history = self._fit(
+            X_train, y_train, X_val, y_val, self.epochs,
+            checkpoint_path=checkpoint_path, resume_state=resume_state
         )
         
-        if X_val is not None:
-            val_dataset = TimeSeriesDataset(X_val, y_val)
-            val_loader = DataLoader(
-                val_dataset,
-                batch_size=self.batch_size,
-                shuffle=False,
-                num_workers=0
+        self._finish_training(checkpoint_path)
+        
+        return history
+    
+    def train_from_store(
+        self,
+        store: Any,
+        sequence_length: int,
+        val_fraction: float = 0.2,
+        val_samples: int = 20000,
+        block_chunks: int = 2,
+        checkpoint_path: Optional[Path] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Train on a PixelTimeSeriesStore without loading it into memory
+        
+        Every epoch streams shuffled windows block by block from disk. The
+        last val_fraction of the date axis is held out: a fixed random sample
+        of windows targeting it is the validation set. Normalization is fitted
+        on the training dates of the store.
+        
+        Args:
+            store: data.pixel_store.PixelTimeSeriesStore (target feature first)
+            sequence_length: Observations per input sequence
+            val_fraction: Share of the date axis used for validation targets
+            val_samples: Validation windows kept in memory
+            block_chunks: Store chunks loaded together per shuffle block
+            checkpoint_path: In-progress training checkpoint file
+            seed: Random seed for shuffling and the validation sample
+            
+        Returns:
+            Training history
+        """
+        n_dates = store.n_dates
+        split = sequence_length + int((n_dates - sequence_length) * (1 - val_fraction))
+        
+        self.feature_names = list(store.features)
+        self.normalization = store.normalization_stats(days=slice(0, split))
+        if self.model is None:
+            self.build_model(input_size=len(store.features))
+        
+        X_val, y_val = store.sample_windows(
+            val_samples, sequence_length, self.output_size,
+            target_days=(split, n_dates), normalization=self.normalization, seed=seed
+        )
+        if len(X_val) == 0:
+            X_val, y_val = None, None
+        
+        print(f"\n🚀 Training {self.model_type.upper()} model from pixel store...")
+        print(f"   Pixels: {store.n_pixels} in {store.n_chunks} chunks | Dates: {n_dates}")
+        print(f"   Sequence length: {sequence_length}")
+        print(f"   Features: {len(store.features)}")
+        
+        rng = np.random.default_rng(seed)
+        
+        def train_batches():
+            """One epoch of shuffled windows streamed from disk"""
+            non_blocking = self.device.type == 'cuda'
+            for batch_X, batch_y in store.iter_windows(
+                sequence_length, self.batch_size, self.output_size,
+                target_days=(sequence_length, split), normalization=self.normalization,
+                block_chunks=block_chunks, seed=int(rng.integers(2 ** 31))
+            ):
+                yield (self._take(batch_X, slice(None)).to(self.device, non_blocking=non_blocking),
+                       self._take(batch_y, slice(None)).to(self.device, non_blocking=non_blocking))
+        
+        resume_state = self._start_training(checkpoint_path)
+        
+        history = self._fit(
+            None, None, X_val, y_val, self.epochs,
+            checkpoint_path=checkpoint_path, resume_state=resume_state,
+            train_batches=train_batches
+        )
+        
+        self._finish_training(checkpoint_path)
+        
+        return history
+    
+    def _start_training(self, checkpoint_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """
+        Create the optimizer; resume state of an existing checkpoint, if any
+        
+        The checkpoint is applied first (it rebuilds the module), so the
+        optimizer always steps the parameters that are actually trained.
+        """
+        resume_state = None
+        if checkpoint_path is not None and Path(checkpoint_path).exists():
+            try:
+                resume_state = self._apply_checkpoint(
+                    torch.load(checkpoint_path, map_location=self.device)
+                )
+            except Exception as e:
+                print(f"   ⚠️  Could not resume from {checkpoint_path}: {e}")
+        
+        self.optimizer = torch.optim.Adam(self.model.parameters(), lr=self.learning_rate)
+        
+        if resume_state is not None:
+            try:
+                self.optimizer.load_state_dict(resume_state['optimizer_state'])
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"   ⚠️  Could not restore optimizer state: {e}")
+        
+        return resume_state
+    
+    def _finish_training(self, checkpoint_path: Optional[Path]) -> None:
+        """Mark trained and drop the in-progress checkpoint"""
+        self.is_trained = True
+        if checkpoint_path is not None:
+            Path(checkpoint_path).unlink(missing_ok=True)
+        print(f"✅ Training completed!")
+    
+    def fine_tune(
+        self,
+        X_new: np.ndarray,
+        y_new: np.ndarray,
+        X_history: Optional[np.ndarray] = None,
+        y_history: Optional[np.ndarray] = None,
+        X_val: Optional[np.ndarray] = None,
+        y_val: Optional[np.ndarray] = None,
+        epochs: int = 5,
+        replay_size: int = 256,
+        learning_rate: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Continue training a loaded model on newly appended windows
+        
+        Starts from the current weights and the saved optimizer state; a random
+        replay buffer of historical windows is mixed in to avoid forgetting.
+        
+        Args:
+            X_new: Windows added since the model was trained
+            y_new: Labels of X_new
+            X_history: Windows the model was trained on (replay source)
+            y_history: Labels of X_history
+            X_val: Validation sequences
+            y_val: Validation labels
+            epochs: Fine-tune epochs
+            replay_size: Historical windows mixed into every fine-tune run
+            learning_rate: Learning rate (default: the training rate)
+            
+        Returns:
+            Training history
+        """
+        if self.model is None:
+            raise RuntimeError("Model must be built or loaded before fine-tuning")
+        
+        X_fit, y_fit = X_new, y_new
+        if X_history is not None and len(X_history) > 0 and replay_size > 0:
+            replay = np.random.default_rng().choice(
+                len(X_history), size=min(replay_size, len(X_history)), replace=False
             )
+            X_fit = np.concatenate([X_new, X_history[replay]])
+            y_fit = np.concatenate([y_new, y_history[replay]])
+        
+        print(f"\n🔧 Fine-tuning {self.model_type.upper()} model...")
+        print(f"   New windows: {len(X_new)} | Replay windows: {len(X_fit) - len(X_new)}")
+        
+        self.optimizer = torch.optim.Adam(self.model.parameters(), lr=self.learning_rate)
+        if self.optimizer_state is not None:
+            try:
+                self.optimizer.load_state_dict(self.optimizer_state)
+            except ValueError as e:
+                print(f"   ⚠️  Could not restore optimizer state: {e}")
+        for group in self.optimizer.param_groups:
+            group['lr'] = learning_rate or self.learning_rate
+        
+        history = self._fit(X_fit, y_fit, X_val, y_val, epochs)
+        
+        self.is_trained = True
+        print(f"✅ Fine-tuning completed!")
+        
+        return history
+    
+    def _as_tensor(self, a: np.ndarray) -> torch.Tensor:
+        """Whole array as one contiguous float32 tensor (pinned when training on GPU)"""
+        tensor = torch.from_numpy(np.ascontiguousarray(a, dtype=np.float32))
+        if self.device.type == 'cuda':
+            tensor = tensor.pin_memory()
+        return tensor
+    
+    def _batch_source(self, a: np.ndarray):
+        """
+        Training data as batches are drawn from it
+        
+        Arrays whose float32 copy fits materialize_budget_mb become one
+        (pinned) tensor, window views (create_sequences / SlidingWindowDataset)
+        included; larger views stay lazy and only each batch is copied.
+        """
+        if isinstance(a, np.ndarray) and not a.flags['C_CONTIGUOUS']:
+            if a.size * 4 > self.materialize_budget_mb * 1024 ** 2:
+                return a
+        return self._as_tensor(a)
+    
+    @staticmethod
+    def _take(source, idx) -> torch.Tensor:
+        """Rows of a batch source as a float32 tensor"""
+        if isinstance(source, torch.Tensor):
+            return source[idx]
+        return torch.from_numpy(np.ascontiguousarray(source[idx], dtype=np.float32))
+    
+    def _batches(self, X, y, shuffle: bool):
+        """
+        Yield (X, y) mini-batches on the device by slicing the batch sources
+        
+        Shuffled batches index a random permutation; unshuffled ones are
+        plain slices (views, no copy on CPU).
+        """
+        n = len(X)
+        order = np.random.permutation(n) if shuffle else None
+        non_blocking = self.device.type == 'cuda'
+        
+        for start in range(0, n, self.batch_size):
+            if order is not None:
+                idx = order[start:start + self.batch_size]
+            else:
+                idx = slice(start, start + self.batch_size)
+            
+            yield (self._take(X, idx).to(self.device, non_blocking=non_blocking),
+                   self._take(y, idx).to(self.device, non_blocking=non_blocking))
+    
+    def _fit(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: Optional[np.ndarray],
+        y_val: Optional[np.ndarray],
+        epochs: int,
+        checkpoint_path: Optional[Path] = None,
+        resume_state: Optional[Dict[str, Any]] = None,
+        train_batches: Optional[Callable[[], Iterator]] = None
+    ) -> Dict[str, Any]:
+        """
+        Epoch loop with LR scheduling and early stopping (uses self.optimizer)
+        
+        The weights of the best validation epoch are kept in memory and
+        restored when the loop ends.
+        
+        Args:
+            X_train: Training sequences
+            y_train: Training labels
+            X_val: Validation sequences
+            y_val: Validation labels
+            epochs: Maximum epochs
+            checkpoint_path: Write the training state here every checkpoint_every epochs
+            resume_state: Training state of a loaded checkpoint to continue from
+            train_batches: Callable returning one epoch of (X, y) device batches
+                (streamed training); replaces X_train / y_train
+            
+        Returns:
+            Training history
+        """
+        # Whole sets as single tensors (or lazy window views); batches are index slices
+        if train_batches is None:
+            X_train_t, y_train_t = self._batch_source(X_train), self._batch_source(y_train)
+            train_batches = lambda: self._batches(X_train_t, y_train_t, shuffle=True)
+        
+        if X_val is not None:
+            X_val_t, y_val_t = self._batch_source(X_val), self._batch_source(y_val)
         
-        # Loss and optimizer
         criterion = nn.MSELoss()
-        optimizer = torch.optim.Adam(self.model.parameters(), lr=self.learning_rate)
+        optimizer = self.optimizer
         scheduler = torch.optim.lr_scheduler.ReduceLROnPlateau(
             optimizer, mode='min', factor=0.5, patience=10, verbose=True
         )
+        self.scheduler = scheduler
         
         # Training loop
         history = {'train_loss': [], 'val_loss': []}
         best_val_loss = float('inf')
+        best_state = None
         patience_counter = 0
-        
-        for epoch in range(self.epochs):
+        start_epoch = 0
+        
+        if resume_state is not None:
+            if resume_state.get('scheduler_state') is not None:
+                scheduler.load_state_dict(resume_state['scheduler_state'])
+            history = resume_state['history']
+            best_val_loss = resume_state['best_val_loss']
+            best_state = resume_state.get('best_model_state')
+            patience_counter = resume_state['patience_counter']
+            start_epoch = resume_state['epoch'] + 1
+            print(f"   ↩️  Resuming from epoch {start_epoch + 1}")
+        
+        for epoch in range(start_epoch, epochs):
             # Training
             self.model.train()
             train_losses = []
             
-            for batch_X, batch_y in train_loader:
-                batch_X = batch_X.to(self.device)
-                batch_y = batch_y.to(self.device)
-                
+            for batch_X, batch_y in train_batches():
                 # Forward pass
                 outputs = self.model(batch_X).squeeze()
                 loss = criterion(outputs, batch_y)
@@ -330,7 +646,7 @@ class DeepLearningBloomModel(BaseBloomModel):
                 
                 train_losses.append(loss.item())
             
-            avg_train_loss = np.mean(train_losses)
+            avg_train_loss = float(np.mean(train_losses))
             history['train_loss'].append(avg_train_loss)
             
             # Validation
@@ -338,29 +654,27 @@ class DeepLearningBloomModel(BaseBloomModel):
                 self.model.eval()
                 val_losses = []
                 
-                with torch.no_grad():
-                    for batch_X, batch_y in val_loader:
-                        batch_X = batch_X.to(self.device)
-                        batch_y = batch_y.to(self.device)
-                        
+                with torch.inference_mode():
+                    for batch_X, batch_y in self._batches(X_val_t, y_val_t, shuffle=False):
                         outputs = self.model(batch_X).squeeze()
                         loss = criterion(outputs, batch_y)
                         val_losses.append(loss.item())
                 
-                avg_val_loss = np.mean(val_losses)
+                avg_val_loss = float(np.mean(val_losses))
                 history['val_loss'].append(avg_val_loss)
                 
                 scheduler.step(avg_val_loss)
                 
-                # Early stopping
+                # Early stopping (keep the best weights in memory)
                 if avg_val_loss < best_val_loss:
                     best_val_loss = avg_val_loss
+                    best_state = {k: v.detach().clone() for k, v in self.model.state_dict().items()}
                     patience_counter = 0
                 else:
                     patience_counter += 1
                 
                 if (epoch + 1) % 10 == 0:
-                    print(f"Epoch [{epoch+1}/{self.epochs}] "
+                    print(f"Epoch [{epoch+1}/{epochs}] "
                           f"Train Loss: {avg_train_loss:.4f} | "
                           f"Val Loss: {avg_val_loss:.4f}")
                 
@@ -369,10 +683,21 @@ class DeepLearningBloomModel(BaseBloomModel):
                     break
             else:
                 if (epoch + 1) % 10 == 0:
-                    print(f"Epoch [{epoch+1}/{self.epochs}] Train Loss: {avg_train_loss:.4f}")
-        
-        self.is_trained = True
-        print(f"✅ Training completed!")
+                    print(f"Epoch [{epoch+1}/{epochs}] Train Loss: {avg_train_loss:.4f}")
+            
+            if checkpoint_path is not None and (epoch + 1) % self.checkpoint_every == 0:
+                self.save_checkpoint(
+                    checkpoint_path,
+                    epoch=epoch,
+                    history=history,
+                    best_val_loss=best_val_loss,
+                    best_model_state=best_state,
+                    patience_counter=patience_counter
+                )
+        
+        if best_state is not None:
+            self.model.load_state_dict(best_state)
+            print(f"   ↩️  Restored best weights (val loss {best_val_loss:.4f})")
         
         return history
     
@@ -380,6 +705,8 @@ class DeepLearningBloomModel(BaseBloomModel):
         """
         Make predictions
         
+        Runs in chunks of inference_batch_size under inference mode.
+        
         Args:
             X: Input sequences
             
@@ -391,50 +718,98 @@ class DeepLearningBloomModel(BaseBloomModel):
         
         self.model.eval()
         
-        dataset = TimeSeriesDataset(X, np.zeros((len(X), self.output_size)))
-        loader = DataLoader(dataset, batch_size=self.batch_size, shuffle=False)
+        if isinstance(X, SlidingWindowDataset):
+            X = X.X
+        predictions = np.empty((len(X), self.output_size), dtype=np.float32)
         
-        predictions = []
+        with torch.inference_mode():
+            for start in range(0, len(X), self.inference_batch_size):
+                stop = start + self.inference_batch_size
+                batch_X = self._take(X, slice(start, stop)).to(self.device)
+                predictions[start:stop] = self.model(batch_X).reshape(-1, self.output_size).cpu().numpy()
         
-        with torch.no_grad():
-            for batch_X, _ in loader:
-                batch_X = batch_X.to(self.device)
-                outputs = self.model(batch_X)
-                predictions.append(outputs.cpu().numpy())
+        return predictions
+    
+    def _checkpoint(self, **training_state) -> Dict[str, Any]:
+        """Everything needed to rebuild, use and continue training the model"""
+        return {
+            'model_type': self.model_type,
+            'architecture': {
+                'input_size': self.input_size,
+                'hidden_size': self.hidden_size,
+                'num_layers': self.num_layers,
+                'dropout': self.dropout,
+                'bidirectional': self.bidirectional,
+                'output_size': self.output_size
+            },
+            'model_state': self.model.state_dict(),
+            'optimizer_state': (self.optimizer.state_dict() if self.optimizer is not None
+                                else self.optimizer_state),
+            'scheduler_state': (self.scheduler.state_dict() if self.scheduler is not None
+                                else self.scheduler_state),
+            'normalization': self.normalization,
+            'feature_names': self.feature_names,
+            'is_trained': self.is_trained,
+            **training_state
+        }
+    
+    def save_checkpoint(self, path: Path, **training_state) -> None:
+        """
+        Write the checkpoint to a single file (atomically via a temp file)
         
-        return np.concatenate(predictions, axis=0)
+        Args:
+            path: Checkpoint file
+            **training_state: Extra entries (epoch, history, ...) for resuming
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        torch.save(self._checkpoint(**training_state), tmp_path)
+        tmp_path.replace(path)
+    
+    def _apply_checkpoint(self, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the model from a checkpoint dict; returns the checkpoint"""
+        architecture = checkpoint['architecture']
+        self.hidden_size = architecture['hidden_size']
+        self.num_layers = architecture['num_layers']
+        self.dropout = architecture['dropout']
+        self.bidirectional = architecture['bidirectional']
+        self.output_size = architecture['output_size']
+        self.build_model(architecture['input_size'])
+        
+        self.model.load_state_dict(checkpoint['model_state'])
+        self.optimizer_state = checkpoint.get('optimizer_state')
+        self.scheduler_state = checkpoint.get('scheduler_state')
+        self.normalization = checkpoint.get('normalization')
+        self.feature_names = checkpoint.get('feature_names')
+        self.is_trained = checkpoint.get('is_trained', False)
+        
+        return checkpoint
     
     def save(self, save_dir: Path) -> None:
-        """Save model to disk"""
+        """
+        Save model to disk
+        
+        Writes one {model_name}_checkpoint.pth with weights, optimizer and
+        scheduler state, normalization statistics and feature names.
+        """
         save_dir = Path(save_dir)
         save_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save model weights
-        model_path = save_dir / f"{self.model_name}_weights.pth"
-        torch.save(self.model.state_dict(), model_path)
-        
-        # Save configuration
-        config = {
-            'model_type': self.model_type,
-            'input_size': self.input_size,
-            'hidden_size': self.hidden_size,
-            'num_layers': self.num_layers,
-            'dropout': self.dropout,
-            'bidirectional': self.bidirectional,
-            'output_size': self.output_size,
-            'is_trained': self.is_trained
-        }
-        
-        config_path = save_dir / f"{self.model_name}_config.json"
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        self.save_checkpoint(save_dir / f"{self.model_name}_checkpoint.pth")
         
         print(f"✅ Model saved to {save_dir}")
     
     def load(self, load_dir: Path) -> None:
-        """Load model from disk"""
+        """Load model from disk (single checkpoint, or legacy weights + config files)"""
         load_dir = Path(load_dir)
         
+        checkpoint_path = load_dir / f"{self.model_name}_checkpoint.pth"
+        if checkpoint_path.exists():
+            self._apply_checkpoint(torch.load(checkpoint_path, map_location=self.device))
+            print(f"✅ Model loaded from {load_dir}")
+            return
+        
         # Load configuration
         config_path = load_dir / f"{self.model_name}_config.json"
         with open(config_path, 'r') as f:
@@ -448,6 +823,11 @@ class DeepLearningBloomModel(BaseBloomModel):
         model_path = load_dir / f"{self.model_name}_weights.pth"
         self.model.load_state_dict(torch.load(model_path, map_location=self.device))
         
+        # Load optimizer state if saved
+        optimizer_path = load_dir / f"{self.model_name}_optimizer.pth"
+        if optimizer_path.exists():
+            self.optimizer_state = torch.load(optimizer_path, map_location=self.device)
+        
         self.is_trained = config['is_trained']
         
         print(f"✅ Model loaded from {load_dir}")
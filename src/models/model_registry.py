@@ -0,0 +1,290 @@
+"""
+Persistent registry of trained models, so nightly runs reuse yesterday's model
+unless it is stale
+"""
+import hashlib
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ModelRegistry:
+    """
+    Trained models on disk, keyed by AOI / model type / feature-set hash
+
+    Layout: {registry_dir}/{aoi}/{model_type}/{feature_hash}/ holds
+    manifest.json (data fingerprint, validation score, training time) and one
+    model-{timestamp}/ directory per registration with the files written by
+    model.save(). The manifest names the current version, so replacing it
+    switches versions atomically.
+    """
+
+    # Reuse policies
+    POLICIES = ('retrain', 'reuse', 'retrain_if_stale')
+
+    # Model config keys that do not change the trained model (docs, runtime-only settings)
+    RUNTIME_KEYS = (
+        'description', 'use_case', 'inference_batch_size', 'checkpoint_every',
+        'materialize_budget_mb', 'dtype'
+    )
+
+    def __init__(
+        self,
+        registry_dir: Path,
+        max_age_days: float = 7,
+        drift_threshold: float = 0.5,
+        score_tolerance: float = 0.25
+    ):
+        """
+        Initialize registry
+
+        Args:
+            registry_dir: Root directory (e.g. outputs/models)
+            max_age_days: Retrain schedule; older models are stale
+            drift_threshold: Stale when a feature mean moved by more than this
+                many training standard deviations
+            score_tolerance: Stale when the validation MSE on current data is
+                worse than the registered score by more than this fraction
+        """
+        self.registry_dir = Path(registry_dir)
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age_days = max_age_days
+        self.drift_threshold = drift_threshold
+        self.score_tolerance = score_tolerance
+
+    @classmethod
+    def feature_hash(
+        cls,
+        model_type: str,
+        feature_names: List[str],
+        sequence_length: int,
+        model_config: Dict[str, Any]
+    ) -> str:
+        """
+        Hash of everything that changes the model's inputs or architecture
+
+        Args:
+            model_type: Model type ('random_forest', 'lstm', 'gru')
+            feature_names: Feature order used for training
+            sequence_length: Observations per input sequence
+            model_config: Hyperparameters
+
+        Returns:
+            Short hex digest
+        """
+        payload = json.dumps({
+            'model_type': model_type,
+            'features': list(feature_names),
+            'sequence_length': sequence_length,
+            'config': {k: v for k, v in model_config.items() if k not in cls.RUNTIME_KEYS}
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def data_fingerprint(time_series_df: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
+        """
+        Summary of the training data used for staleness / drift checks
+
+        Args:
+            time_series_df: AOI time series
+            columns: Feature columns to summarize
+
+        Returns:
+            Dict with row count, date range, per-column mean/std and a digest
+        """
+        stats = {}
+        for col in columns:
+            if col in time_series_df.columns and pd.api.types.is_numeric_dtype(time_series_df[col]):
+                values = time_series_df[col].to_numpy(dtype=np.float64)
+                stats[col] = [float(np.nanmean(values)), float(np.nanstd(values))]
+
+        dates = pd.to_datetime(time_series_df['date']) if 'date' in time_series_df.columns else None
+        fingerprint = {
+            'n_rows': int(len(time_series_df)),
+            'start': dates.min().strftime('%Y-%m-%d') if dates is not None and len(dates) else None,
+            'end': dates.max().strftime('%Y-%m-%d') if dates is not None and len(dates) else None,
+            'stats': stats
+        }
+        fingerprint['digest'] = hashlib.sha256(
+            json.dumps(fingerprint, sort_keys=True).encode('utf-8')
+        ).hexdigest()[:16]
+        return fingerprint
+
+    def entry_dir(self, aoi_name: str, model_type: str, feature_hash: str) -> Path:
+        """Directory of one registry entry"""
+        return self.registry_dir / aoi_name / model_type / feature_hash
+
+    def model_dir(
+        self,
+        aoi_name: str,
+        model_type: str,
+        feature_hash: str,
+        manifest: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        """
+        Directory holding the model files of a registry entry
+
+        Args:
+            manifest: Entry manifest (looked up when None)
+
+        Returns:
+            Current version directory (the entry directory for manifests
+            written before entries were versioned)
+        """
+        entry_dir = self.entry_dir(aoi_name, model_type, feature_hash)
+        if manifest is None:
+            manifest = self.lookup(aoi_name, model_type, feature_hash)
+        version = (manifest or {}).get('version')
+        return entry_dir / version if version else entry_dir
+
+    def lookup(self, aoi_name: str, model_type: str, feature_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Manifest of a registered model
+
+        Returns:
+            Manifest dict or None if nothing usable is registered
+        """
+        manifest_path = self.entry_dir(aoi_name, model_type, feature_hash) / 'manifest.json'
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"   ⚠️  Could not read registry manifest {manifest_path}: {e}")
+            return None
+
+    def staleness(
+        self,
+        manifest: Dict[str, Any],
+        fingerprint: Dict[str, Any],
+        current_score: Optional[float] = None
+    ) -> Tuple[bool, str, bool]:
+        """
+        Decide whether a registered model needs retraining
+
+        Age and drift are measured against the last full training (fine-tuning
+        does not reset them), so they call for a full retrain; a degraded
+        validation score alone can be repaired by fine-tuning.
+
+        Args:
+            manifest: Registry manifest
+            fingerprint: data_fingerprint() of the current training data
+            current_score: Validation MSE of the registered model on current data
+
+        Returns:
+            (stale, reason, fine_tunable)
+        """
+        base_trained_at = manifest.get('base_trained_at', manifest['trained_at'])
+        age_days = (datetime.now() - datetime.fromisoformat(base_trained_at)).total_seconds() / 86400
+        if age_days > self.max_age_days:
+            return True, f"last full training {age_days:.1f} days ago (max {self.max_age_days})", False
+
+        base_fingerprint = manifest.get('base_fingerprint', manifest.get('fingerprint', {}))
+        old_stats = base_fingerprint.get('stats', {})
+        for col, (mean, std) in fingerprint['stats'].items():
+            if col not in old_stats:
+                continue
+            old_mean, old_std = old_stats[col]
+            shift = abs(mean - old_mean) / (old_std + 1e-9)
+            if shift > self.drift_threshold:
+                return True, f"drift in {col} ({shift:.2f} std)", False
+
+        registered_score = manifest.get('val_score')
+        if current_score is not None and registered_score is not None:
+            if current_score > registered_score * (1 + self.score_tolerance) + 1e-12:
+                return True, (f"validation MSE degraded {registered_score:.6f} → "
+                              f"{current_score:.6f}"), True
+
+        return False, f"fresh ({age_days:.1f} days since full training)", False
+
+    def register(
+        self,
+        aoi_name: str,
+        model_type: str,
+        feature_hash: str,
+        model: Any,
+        feature_names: List[str],
+        fingerprint: Dict[str, Any],
+        val_score: float,
+        n_train_samples: Optional[int] = None,
+        last_train_date: Optional[str] = None,
+        base_manifest: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        """
+        Save a trained model and its manifest
+
+        Args:
+            n_train_samples: Training windows of the last (fine-)training run
+            last_train_date: Target date of the newest training window (fine-tuning
+                later trains on the windows after it)
+            base_manifest: Manifest of the model this one was fine-tuned from;
+                its full-training time and fingerprint are carried over
+
+        Returns:
+            Directory of the saved model files
+        """
+        entry_dir = self.entry_dir(aoi_name, model_type, feature_hash)
+
+        # New files go to a fresh version directory; the current version stays
+        # intact until the manifest points at the new one
+        version = f"model-{datetime.now().strftime('%Y%m%dT%H%M%S%f')}"
+        model.save(entry_dir / version)
+
+        trained_at = datetime.now().isoformat()
+
+        # Age and drift checks stay anchored to the last full training
+        if base_manifest is not None:
+            base_trained_at = base_manifest.get('base_trained_at', base_manifest['trained_at'])
+            base_fingerprint = base_manifest.get('base_fingerprint', base_manifest['fingerprint'])
+        else:
+            base_trained_at, base_fingerprint = trained_at, fingerprint
+
+        manifest = {
+            'aoi_name': aoi_name,
+            'model_type': model_type,
+            'feature_hash': feature_hash,
+            'feature_names': list(feature_names),
+            'fingerprint': fingerprint,
+            'val_score': float(val_score),
+            'n_train_samples': n_train_samples,
+            'last_train_date': last_train_date,
+            'trained_at': trained_at,
+            'base_trained_at': base_trained_at,
+            'base_fingerprint': base_fingerprint,
+            'version': version
+        }
+
+        # Manifest last: an entry only counts once the model files are complete
+        tmp_path = entry_dir / 'manifest.json.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        tmp_path.replace(entry_dir / 'manifest.json')
+
+        # Older versions (and leftovers of interrupted registrations) are unreferenced now
+        for old_dir in entry_dir.glob('model-*'):
+            if old_dir.is_dir() and old_dir.name != version:
+                shutil.rmtree(old_dir, ignore_errors=True)
+
+        return entry_dir / version
+
+    def load(self, aoi_name: str, model_type: str, feature_hash: str, model: Any) -> Any:
+        """
+        Load a registered model into an unbuilt model instance
+
+        Args:
+            model: RandomForestBloomModel / DeepLearningBloomModel to load into
+
+        Returns:
+            The loaded model
+        """
+        manifest = self.lookup(aoi_name, model_type, feature_hash)
+        model.load(self.model_dir(aoi_name, model_type, feature_hash, manifest))
+        if manifest is not None:
+            model.feature_names = manifest['feature_names']
+        return model
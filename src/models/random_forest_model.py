@@ -23,6 +23,9 @@ class RandomForestBloomModel(BaseBloomModel):
         super().__init__('random_forest', config)
         self.task = task
         self.scaler = StandardScaler()
+        
+        # Feature dtype (runtime.dtype); trees split on float32 internally anyway
+        self.dtype = np.dtype(config.get('dtype', 'float32'))
     
     def build_model(self) -> None:
         """Build Random Forest model"""
@@ -81,6 +84,7 @@ class RandomForestBloomModel(BaseBloomModel):
             n_samples, seq_len, n_features = X_train.shape
             X_train = X_train.reshape(n_samples, seq_len * n_features)
             print(f"   Reshaped from (samples, seq_len, features) to (samples, {seq_len * n_features} features)")
+        X_train = np.asarray(X_train, dtype=self.dtype)
         
         print(f"   Features: {X_train.shape[1]}")
         
@@ -106,6 +110,7 @@ class RandomForestBloomModel(BaseBloomModel):
             if X_val.ndim == 3:
                 n_val, seq_len, n_features = X_val.shape
                 X_val = X_val.reshape(n_val, seq_len * n_features)
+            X_val = np.asarray(X_val, dtype=self.dtype)
             
             X_val_scaled = self.scaler.transform(X_val)
             val_score = self.model.score(X_val_scaled, y_val)
@@ -117,6 +122,53 @@ class RandomForestBloomModel(BaseBloomModel):
         
         return metrics
     
+    def train_from_store(
+        self,
+        store: Any,
+        sequence_length: int,
+        max_samples: int = 200000,
+        val_fraction: float = 0.2,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Train on a random subsample of a PixelTimeSeriesStore
+        
+        Forests do not need every window: max_samples windows are drawn
+        uniformly over all pixels, reading one chunk at a time. The last
+        val_fraction of the date axis is held out for validation.
+        
+        Args:
+            store: data.pixel_store.PixelTimeSeriesStore (target feature first)
+            sequence_length: Observations per input sequence
+            max_samples: Training windows drawn (validation draws a quarter of that)
+            val_fraction: Share of the date axis used for validation targets
+            seed: Random seed
+            
+        Returns:
+            Training metrics
+        """
+        n_dates = store.n_dates
+        split = sequence_length + int((n_dates - sequence_length) * (1 - val_fraction))
+        
+        X_train, y_train = store.sample_windows(
+            max_samples, sequence_length, target_days=(sequence_length, split), seed=seed
+        )
+        X_val, y_val = store.sample_windows(
+            max_samples // 4, sequence_length, target_days=(split, n_dates),
+            seed=None if seed is None else seed + 1
+        )
+        if len(X_train) == 0:
+            raise ValueError("Pixel store has no training windows")
+        
+        self.feature_names = list(store.features)
+        if self.model is None:
+            self.build_model()
+        
+        return self.train(
+            X_train, y_train.ravel(),
+            X_val if len(X_val) else None, y_val.ravel() if len(y_val) else None
+        )
+    
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
         Make predictions
@@ -134,6 +186,7 @@ class RandomForestBloomModel(BaseBloomModel):
         if X.ndim == 3:
             n_samples, seq_len, n_features = X.shape
             X = X.reshape(n_samples, seq_len * n_features)
+        X = np.asarray(X, dtype=self.dtype)
         
         X_scaled = self.scaler.transform(X)
         return self.model.predict(X_scaled)
@@ -155,6 +208,7 @@ class RandomForestBloomModel(BaseBloomModel):
         if X.ndim == 3:
             n_samples, seq_len, n_features = X.shape
             X = X.reshape(n_samples, seq_len * n_features)
+        X = np.asarray(X, dtype=self.dtype)
         
         X_scaled = self.scaler.transform(X)
         
@@ -0,0 +1,273 @@
+"""
+Per-pixel model inference over the spatial prediction grid
+"""
+import os
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def available_memory_bytes(default: int = 2 * 1024 ** 3) -> int:
+    """
+    Best-effort estimate of currently available system memory
+
+    Args:
+        default: Value used when no estimate is possible
+
+    Returns:
+        Available memory in bytes
+    """
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+
+    try:
+        return int(os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE'))
+    except (ValueError, OSError, AttributeError):
+        return default
+
+
+class SpatialInferenceEngine:
+    """Build per-pixel feature sequences and run a trained bloom model over them"""
+
+    TEMPORAL_FEATURES = [
+        'day_of_year', 'month', 'week',
+        'day_sin', 'day_cos', 'month_sin', 'month_cos'
+    ]
+
+    def __init__(
+        self,
+        model: Any,
+        feature_names: List[str],
+        reference_df: pd.DataFrame,
+        z_score_cols: List[str],
+        target_col: str = 'ARI',
+        sequence_length: int = 30,
+        memory_fraction: float = 0.25,
+        memory_budget_bytes: Optional[int] = None
+    ):
+        """
+        Initialize inference engine
+
+        Args:
+            model: Trained RandomForestBloomModel or DeepLearningBloomModel
+            feature_names: Feature order the model was trained with
+            reference_df: AOI training time series (z-score and target statistics)
+            z_score_cols: Columns that have a '<col>_z' feature
+            target_col: Column the model forecasts (first training feature)
+            sequence_length: Observations per input sequence
+            memory_fraction: Share of available memory one inference batch may use
+            memory_budget_bytes: Hard cap for one inference batch (runtime.memory_budget_mb)
+        """
+        self.model = model
+        self.feature_names = list(feature_names)
+        self.target_col = target_col
+        self.sequence_length = sequence_length
+        self.memory_fraction = memory_fraction
+        self.memory_budget_bytes = memory_budget_bytes
+
+        # Statistics are taken from the training series, never from pixels
+        self.z_stats = {
+            col: (float(reference_df[col].mean()), float(reference_df[col].std()))
+            for col in z_score_cols if col in reference_df.columns
+        }
+
+        target = reference_df[target_col].astype(float)
+        self.target_mean = float(target.mean())
+        self.target_std = float(target.std())
+        if not np.isfinite(self.target_std) or self.target_std == 0:
+            self.target_std = 1.0
+
+        self.static_features = [f for f in self.feature_names if f not in self.TEMPORAL_FEATURES]
+        self.temporal_features = [f for f in self.feature_names if f in self.TEMPORAL_FEATURES]
+        self._static_pos = [self.feature_names.index(f) for f in self.static_features]
+        self._temporal_pos = [self.feature_names.index(f) for f in self.temporal_features]
+
+        # Normalization persisted with the model (never refitted on pixels)
+        self._offset, self._scale = self._normalization_arrays(getattr(model, 'normalization', None))
+
+    def _normalization_arrays(self, stats: Optional[Dict[str, Any]]):
+        """(offset, scale) float32 arrays in feature order, or (None, None)"""
+        if not stats:
+            return None, None
+
+        features = stats.get('features') or self.feature_names
+        offset = dict(zip(features, stats['offset']))
+        scale = dict(zip(features, stats['scale']))
+        return (np.array([offset.get(f, 0.0) for f in self.feature_names], dtype=np.float32),
+                np.array([scale.get(f, 1.0) for f in self.feature_names], dtype=np.float32))
+
+    def _normalize(self, block: np.ndarray, pos: List[int]) -> np.ndarray:
+        """Apply the model's normalization to the feature columns at pos"""
+        if self._scale is None:
+            return block
+        return (block - self._offset[pos]) / self._scale[pos]
+
+    def build_sequences(
+        self,
+        pixel_df: pd.DataFrame,
+        n_pixels: int
+    ) -> Dict[str, np.ndarray]:
+        """
+        Assemble right-aligned per-pixel sequences of the latest observations
+
+        Args:
+            pixel_df: Long-form observations (pixel_id, date, band columns)
+            n_pixels: Number of grid pixels
+
+        Returns:
+            Dict with 'static' (n_pixels, seq_len, n_static) float32 features,
+            'dates' (n_pixels, seq_len) observation dates and 'has_data' mask
+        """
+        L = self.sequence_length
+        static = np.zeros((n_pixels, L, len(self.static_features)), dtype=np.float32)
+        dates = np.full((n_pixels, L), np.datetime64('NaT'), dtype='datetime64[D]')
+        valid = np.zeros((n_pixels, L), dtype=bool)
+
+        if len(pixel_df) > 0:
+            # Overlapping tiles on the same day → one observation per pixel/date
+            df = pixel_df.groupby(['pixel_id', 'date'], as_index=False).mean(numeric_only=True)
+            df = df.sort_values(['pixel_id', 'date'])
+
+            # Keep the last L observations of each pixel, right-aligned
+            rank = df.groupby('pixel_id').cumcount(ascending=False).to_numpy()
+            keep = rank < L
+            df = df[keep]
+            pos = L - 1 - rank[keep]
+            pid = df['pixel_id'].to_numpy(dtype=np.int64)
+
+            columns = {}
+            for name in self.static_features:
+                if name in df.columns:
+                    columns[name] = df[name].to_numpy(dtype=np.float32)
+                elif name.endswith('_z') and name[:-2] in self.z_stats and name[:-2] in df.columns:
+                    mean, std = self.z_stats[name[:-2]]
+                    columns[name] = ((df[name[:-2]].to_numpy(dtype=np.float64) - mean)
+                                     / (std + 1e-9)).astype(np.float32)
+                else:
+                    columns[name] = np.zeros(len(df), dtype=np.float32)
+
+            static[pid, pos, :] = np.column_stack([columns[name] for name in self.static_features])
+            dates[pid, pos] = df['date'].to_numpy().astype('datetime64[D]')
+            valid[pid, pos] = True
+
+        has_data = valid.any(axis=1)
+
+        # Pad short histories by repeating the nearest observation (bfill/ffill,
+        # matching the training feature pipeline)
+        idx = np.where(valid, np.arange(L), -1)
+        np.maximum.accumulate(idx, axis=1, out=idx)
+        first_valid = valid.argmax(axis=1)
+        idx = np.where(idx < 0, first_valid[:, None], idx)
+
+        static = np.take_along_axis(static, idx[:, :, None], axis=1)
+        dates = np.take_along_axis(dates, idx, axis=1)
+        np.nan_to_num(static, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+        return {'static': static, 'dates': dates, 'has_data': has_data}
+
+    def _temporal_block(self, dates: np.ndarray) -> np.ndarray:
+        """Temporal features (same encoding as add_temporal_features) for a date array"""
+        index = pd.DatetimeIndex(dates.ravel())
+        day_of_year = index.dayofyear.to_numpy(dtype=np.float64)
+        month = index.month.to_numpy(dtype=np.float64)
+
+        values = {
+            'day_of_year': day_of_year,
+            'month': month,
+            'week': index.isocalendar().week.to_numpy(dtype=np.float64),
+            'day_sin': np.sin(2 * np.pi * day_of_year / 365.25),
+            'day_cos': np.cos(2 * np.pi * day_of_year / 365.25),
+            'month_sin': np.sin(2 * np.pi * month / 12),
+            'month_cos': np.cos(2 * np.pi * month / 12)
+        }
+
+        block = np.column_stack([values[name] for name in self.temporal_features])
+        return block.reshape(dates.shape + (len(self.temporal_features),)).astype(np.float32)
+
+    def batch_size(self, n_samples: int) -> int:
+        """
+        Inference batch size that fits the memory budget
+
+        Args:
+            n_samples: Total samples to predict
+
+        Returns:
+            Samples per model.predict call
+        """
+        # Input tensor plus flattened/scaled copies and model activations
+        bytes_per_sample = self.sequence_length * len(self.feature_names) * 4 * 8
+        budget = available_memory_bytes() * self.memory_fraction
+        if self.memory_budget_bytes is not None:
+            budget = min(budget, self.memory_budget_bytes)
+        return int(max(256, min(n_samples, budget // bytes_per_sample)))
+
+    def predict_dates(
+        self,
+        sequences: Dict[str, np.ndarray],
+        target_dates: Sequence[str],
+        window_end: str
+    ) -> np.ndarray:
+        """
+        Bloom probabilities for every pixel and target date
+
+        The observed window is re-anchored to each target date by shifting its
+        observation dates, so temporal features match the forecast date.
+
+        Args:
+            sequences: Output of build_sequences()
+            target_dates: Forecast dates (YYYY-MM-DD)
+            window_end: Last day of the observation window (YYYY-MM-DD)
+
+        Returns:
+            Array (n_dates, n_pixels); NaN where a pixel had no observations
+        """
+        static = sequences['static']
+        obs_dates = sequences['dates']
+        has_data = sequences['has_data']
+        n_pixels = len(static)
+
+        probabilities = np.full((len(target_dates), n_pixels), np.nan, dtype=np.float32)
+        pixel_idx = np.flatnonzero(has_data)
+        if len(pixel_idx) == 0:
+            return probabilities
+
+        batch = self.batch_size(len(pixel_idx))
+        window_end_day = np.datetime64(window_end, 'D')
+        X = np.empty((min(batch, len(pixel_idx)), self.sequence_length, len(self.feature_names)),
+                     dtype=np.float32)
+
+        for start in range(0, len(pixel_idx), batch):
+            rows = pixel_idx[start:start + batch]
+            Xb = X[:len(rows)]
+            Xb[:, :, self._static_pos] = self._normalize(static[rows], self._static_pos)
+
+            for d, target_date in enumerate(target_dates):
+                shift = np.datetime64(target_date, 'D') - window_end_day
+                if self._temporal_pos:
+                    Xb[:, :, self._temporal_pos] = self._normalize(
+                        self._temporal_block(obs_dates[rows] + shift), self._temporal_pos
+                    )
+
+                preds = np.asarray(self.model.predict(Xb), dtype=np.float64).reshape(-1)
+                probabilities[d, rows] = self.to_probability(preds)
+
+        return probabilities
+
+    def to_probability(self, predictions: np.ndarray) -> np.ndarray:
+        """
+        Map forecast target values to bloom probability
+
+        Uses a logistic of the anomaly against the AOI training series, so
+        above-normal anthocyanin/flowering signal maps above 0.5.
+
+        Args:
+            predictions: Model outputs in target units
+
+        Returns:
+            Probabilities in [0, 1]
+        """
+        z = (predictions - self.target_mean) / self.target_std
+        return 1.0 / (1.0 + np.exp(-z))
@@ -1,5 +1,12 @@
 """Utility modules"""
 from .config import get_config, Config
 from .ee_utils import initialize_earth_engine, robust_getinfo
+from .geojson_io import GeoJSONFeatureWriter, write_feature_collection
+from .web_tiles import write_web_tiles
+from .memory_profile import MemoryProfiler, resolve_dtype
 
-__all__ = ['get_config', 'Config', 'initialize_earth_engine', 'robust_getinfo']
+__all__ = [
+    'get_config', 'Config', 'initialize_earth_engine', 'robust_getinfo',
+    'GeoJSONFeatureWriter', 'write_feature_collection', 'write_web_tiles',
+    'MemoryProfiler', 'resolve_dtype'
+]
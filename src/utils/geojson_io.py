@@ -0,0 +1,414 @@
+"""
+Streaming GeoJSON FeatureCollection writer for point hotspot exports
+"""
+import datetime as dt
+import gzip
+import io
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+DEFAULT_CRS = {
+    "type": "name",
+    "properties": {
+        "name": "urn:ogc:def:crs:OGC:1.3:CRS84"
+    }
+}
+
+# File suffix per compression codec
+COMPRESSION_SUFFIX = {'gzip': '.gz', 'brotli': '.br'}
+
+
+class _BrotliFile(io.RawIOBase):
+    """Minimal binary file wrapper that brotli-compresses everything written"""
+
+    def __init__(self, path: Path, quality: int = 9):
+        import brotli
+        self._file = open(path, 'wb')
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._file.write(self._compressor.process(bytes(data)))
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._file.write(self._compressor.finish())
+            self._file.close()
+        super().close()
+
+
+def output_path_for(path: Union[str, Path], compression: Optional[str] = None) -> Path:
+    """Final file path for a compression setting (adds .gz / .br)"""
+    path = Path(path)
+    suffix = COMPRESSION_SUFFIX.get(compression or '')
+    if suffix and path.suffix != suffix:
+        path = path.with_name(path.name + suffix)
+    return path
+
+
+def link_or_copy(src: Union[str, Path], dst: Union[str, Path]) -> Path:
+    """
+    Second copy of a finished file: hardlink when on the same filesystem,
+    otherwise a file copy (never a re-serialization)
+
+    Args:
+        src: Finished file
+        dst: Destination (replaced if it exists)
+
+    Returns:
+        Destination path
+    """
+    src, dst = Path(src), Path(dst)
+    if dst.exists() and src.resolve() == dst.resolve():
+        return dst
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def compression_for(path: Union[str, Path]) -> Optional[str]:
+    """Compression codec implied by a file suffix"""
+    suffix = Path(path).suffix
+    for codec, codec_suffix in COMPRESSION_SUFFIX.items():
+        if suffix == codec_suffix:
+            return codec
+    return None
+
+
+def open_binary(path: Union[str, Path]):
+    """Open a (possibly compressed) GeoJSON file for binary reading"""
+    path = Path(path)
+    compression = compression_for(path)
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'brotli':
+        import brotli
+        with open(path, 'rb') as f:
+            return io.BytesIO(brotli.decompress(f.read()))
+    return open(path, 'rb')
+
+
+def read_crs(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Read the crs member of a FeatureCollection (stops before the features
+    when ijson is available)
+    """
+    try:
+        import ijson
+    except ImportError:
+        with open_binary(path) as f:
+            return json.load(f).get('crs')
+
+    with open_binary(path) as f:
+        return next(ijson.items(f, 'crs'), None)
+
+
+def iter_features(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate the features of a FeatureCollection
+
+    Uses the ijson incremental parser when installed, so only one feature is
+    in memory at a time; otherwise the file is loaded whole (one file at a time).
+    """
+    try:
+        import ijson
+    except ImportError:
+        with open_binary(path) as f:
+            data = json.load(f)
+        yield from data.get('features', [])
+        return
+
+    with open_binary(path) as f:
+        yield from ijson.items(f, 'features.item', use_float=True)
+
+
+def _open_text(path: Path, compression: Optional[str]):
+    """Open path for UTF-8 text writing with optional compression"""
+    if compression is None:
+        return open(path, 'w', encoding='utf-8')
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+    if compression == 'brotli':
+        raw = _BrotliFile(path)
+        return io.TextIOWrapper(io.BufferedWriter(raw), encoding='utf-8')
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+class GeoJSONFeatureWriter:
+    """
+    Write a FeatureCollection incrementally
+
+    Features are written one per line (no pretty-printing) as they arrive, so
+    memory does not grow with the number of features.
+    
+    With index_dates, features must arrive grouped by date; close() then adds
+    top-level 'date_index' (date → [offset, count] into features) and
+    'date_summary' (date → count / mean / max bloom_probability) members.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        name: str,
+        crs: Optional[Dict[str, Any]] = None,
+        precision: int = 6,
+        compression: Optional[str] = None,
+        drop_coordinate_properties: bool = True,
+        lon_col: str = 'lon',
+        lat_col: str = 'lat',
+        index_dates: bool = False
+    ):
+        """
+        Initialize writer
+
+        Args:
+            path: Output path (.gz / .br is appended for compressed output)
+            name: FeatureCollection name
+            crs: CRS member (default: CRS84)
+            precision: Decimal places for coordinates
+            compression: None, 'gzip' or 'brotli' (falls back to gzip if the
+                brotli package is missing)
+            drop_coordinate_properties: Leave lon/lat out of properties (they
+                duplicate the geometry)
+            lon_col: Longitude column name
+            lat_col: Latitude column name
+            index_dates: Track per-date feature slices and summaries
+        """
+        if compression == 'brotli':
+            try:
+                import brotli  # noqa: F401
+            except ImportError:
+                print("   ⚠️  brotli not installed, writing gzip instead")
+                compression = 'gzip'
+
+        self.path = output_path_for(path, compression)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.precision = precision
+        self.drop_coordinate_properties = drop_coordinate_properties
+        self.lon_col = lon_col
+        self.lat_col = lat_col
+        self.n_features = 0
+        
+        # date → [offset, count, probability sum, probability max]
+        self._dates = {} if index_dates else None
+        self._last_date = None
+
+        # Write to a temp file and move into place on close
+        self._tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self._file = _open_text(self._tmp_path, compression)
+
+        header = json.dumps({
+            "type": "FeatureCollection",
+            "name": name,
+            "crs": crs or DEFAULT_CRS
+        }, ensure_ascii=False)
+        self._file.write(header[:-1] + ',"features":[\n')
+
+    def __enter__(self) -> 'GeoJSONFeatureWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write_raw(self, feature_json: str) -> None:
+        """Write one already-serialized feature"""
+        if self.n_features:
+            self._file.write(',\n')
+        self._file.write(feature_json)
+        self.n_features += 1
+
+    def _index_date(self, date_str: Optional[str], count: int, prob_sum: float, prob_max: float) -> None:
+        """Record count features of one date about to be written"""
+        if self._dates is None or date_str is None:
+            return
+        
+        if date_str != self._last_date:
+            if date_str in self._dates:
+                raise ValueError(f"Features for {date_str} are not contiguous; write them sorted by date")
+            self._dates[date_str] = [self.n_features, 0, 0.0, float('-inf')]
+            self._last_date = date_str
+        
+        entry = self._dates[date_str]
+        entry[1] += count
+        entry[2] += prob_sum
+        entry[3] = max(entry[3], prob_max)
+    
+    def write_features(self, features: Iterable[Dict[str, Any]]) -> None:
+        """Write feature dicts"""
+        for feature in features:
+            if self._dates is not None:
+                properties = feature.get('properties') or {}
+                prob = properties.get('bloom_probability')
+                prob = float(prob) if prob is not None else 0.0
+                self._index_date(properties.get('date'), 1, prob, prob)
+            
+            self.write_raw(json.dumps(feature, ensure_ascii=False, separators=(',', ':')))
+
+    def write_frame(
+        self,
+        df: pd.DataFrame,
+        properties: Optional[List[str]] = None
+    ) -> None:
+        """
+        Write point features straight from DataFrame columns
+
+        Args:
+            df: Table with lon/lat columns (a geometry column is ignored)
+            properties: Property columns (default: all except geometry)
+        """
+        if len(df) == 0:
+            return
+
+        if properties is None:
+            properties = [c for c in df.columns if c != 'geometry']
+        if self.drop_coordinate_properties:
+            properties = [c for c in properties if c not in (self.lon_col, self.lat_col)]
+
+        props = pd.DataFrame({col: _json_ready(df[col]) for col in properties})
+        
+        if self._dates is not None and 'date' in df.columns:
+            self._index_frame(_json_ready(df['date']).to_numpy(), df)
+        prop_lines = props.to_json(
+            orient='records', lines=True, force_ascii=False, double_precision=10
+        ).splitlines()
+
+        fmt = f'%.{self.precision}f'
+        lons = np.char.mod(fmt, df[self.lon_col].to_numpy(dtype=np.float64))
+        lats = np.char.mod(fmt, df[self.lat_col].to_numpy(dtype=np.float64))
+
+        for prop, lon, lat in zip(prop_lines, lons, lats):
+            self.write_raw(
+                '{"type":"Feature","properties":' + prop +
+                ',"geometry":{"type":"Point","coordinates":[' + lon + ',' + lat + ']}}'
+            )
+
+    def _index_frame(self, dates: np.ndarray, df: pd.DataFrame) -> None:
+        """Record the date runs of a frame about to be written"""
+        if 'bloom_probability' in df.columns:
+            probs = np.nan_to_num(df['bloom_probability'].to_numpy(dtype=np.float64))
+        else:
+            probs = np.zeros(len(df))
+        
+        starts = np.concatenate([[0], np.flatnonzero(dates[1:] != dates[:-1]) + 1])
+        ends = np.append(starts[1:], len(dates))
+        for start, end in zip(starts, ends):
+            self._index_date(dates[start], int(end - start),
+                             float(probs[start:end].sum()), float(probs[start:end].max()))
+    
+    def date_members(self) -> Dict[str, Any]:
+        """'date_index' and 'date_summary' members for the features written so far"""
+        if self._dates is None:
+            return {}
+        
+        return {
+            'date_index': {
+                date_str: [offset, count]
+                for date_str, (offset, count, _, _) in self._dates.items()
+            },
+            'date_summary': {
+                date_str: {
+                    'count': count,
+                    'mean': round(prob_sum / count, 6) if count else 0.0,
+                    'max': round(prob_max, 6) if count else 0.0
+                }
+                for date_str, (_, count, prob_sum, prob_max) in self._dates.items()
+            }
+        }
+    
+    def close(self, extra: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Finish the collection
+
+        Args:
+            extra: Additional top-level members written after the features
+
+        Returns:
+            Final output path
+        """
+        self._file.write('\n]')
+        for key, value in {**self.date_members(), **(extra or {})}.items():
+            self._file.write(f',{json.dumps(key)}:')
+            self._file.write(json.dumps(value, ensure_ascii=False, separators=(',', ':')))
+        self._file.write('}\n')
+        self._file.close()
+        self._tmp_path.replace(self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """Discard a partially written file"""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+def _json_ready(series: pd.Series) -> pd.Series:
+    """Dates → YYYY-MM-DD strings; everything else unchanged"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime('%Y-%m-%d')
+
+    if series.dtype == object:
+        first = series.dropna().iloc[0] if series.notna().any() else None
+        if isinstance(first, (dt.date, pd.Timestamp)):
+            return series.map(lambda v: v.strftime('%Y-%m-%d') if pd.notna(v) else None)
+
+    return series
+
+
+def write_feature_collection(
+    path: Union[str, Path],
+    df: pd.DataFrame,
+    name: str,
+    precision: int = 6,
+    compression: Optional[str] = None,
+    drop_coordinate_properties: bool = True,
+    indent: Optional[int] = None
+) -> Path:
+    """
+    Write point features to a GeoJSON FeatureCollection
+
+    Args:
+        path: Output path
+        df: Table with lon/lat columns (or point geometry)
+        name: FeatureCollection name
+        precision: Decimal places for coordinates
+        compression: None, 'gzip' or 'brotli'
+        drop_coordinate_properties: Leave lon/lat out of properties
+        indent: Pretty-print with this indent (slow; for debugging only)
+
+    Returns:
+        Final output path
+    """
+    if 'lon' not in df.columns and 'geometry' in df.columns and len(df) > 0:
+        df = df.assign(lon=df.geometry.x, lat=df.geometry.y)
+
+    with GeoJSONFeatureWriter(
+        path, name,
+        precision=precision,
+        compression=compression,
+        drop_coordinate_properties=drop_coordinate_properties
+    ) as writer:
+        writer.write_frame(df)
+
+    if indent is not None and compression is None:
+        with open(writer.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        with open(writer.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+
+    return writer.path
@@ -0,0 +1,184 @@
+"""
+Runtime dtype policy and per-stage peak memory reporting
+"""
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+SUPPORTED_DTYPES = ('float32', 'float64')
+
+
+def resolve_dtype(name: Optional[str] = None) -> np.dtype:
+    """
+    Floating-point dtype of the runtime policy
+
+    Args:
+        name: 'float32' or 'float64' (None → float32)
+
+    Returns:
+        NumPy dtype
+    """
+    name = name or 'float32'
+    if name not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported runtime dtype: {name} (use one of {SUPPORTED_DTYPES})")
+    return np.dtype(name)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Process high-water resident set size in MiB
+
+    Includes memory held by native libraries (torch, Earth Engine client
+    buffers). Never decreases during the process lifetime.
+
+    Returns:
+        Peak RSS, or None where the resource module is unavailable (Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    if sys.platform == 'darwin':
+        return peak / 1024 ** 2
+    return peak / 1024
+
+
+class MemoryProfiler:
+    """
+    Peak memory per pipeline stage
+
+    Stages run one after another: begin() closes the open stage. Every stage
+    records the process peak RSS (cheap, covers torch and other native
+    buffers). With trace=True, tracemalloc additionally measures the stage's
+    own Python and NumPy/pandas peak; tracing slows allocation-heavy code, so
+    it is opt-in.
+    """
+
+    def __init__(self, trace: bool = False, budget_mb: Optional[float] = None):
+        """
+        Initialize profiler
+
+        Args:
+            trace: Also trace Python allocations with tracemalloc
+            budget_mb: Warn when a stage peaks above this many MiB
+        """
+        self.trace = trace
+        self.budget_mb = budget_mb
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._open = None
+        self._owns_tracing = False
+
+    def reset(self) -> None:
+        """Forget recorded stages (start of a new run)"""
+        self.end()
+        self.stages = {}
+
+    def begin(self, name: str) -> None:
+        """
+        Close the open stage and start measuring the next one
+
+        Args:
+            name: Stage name (a repeated name keeps its largest peak)
+        """
+        self.end()
+
+        baseline = None
+        if self.trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+
+        self._open = (name, baseline, peak_rss_mb(), time.perf_counter())
+
+    def end(self) -> None:
+        """Record the open stage, if any"""
+        if self._open is None:
+            return
+
+        name, baseline, rss_before, t0 = self._open
+        self._open = None
+        rss = peak_rss_mb()
+
+        record = {
+            'rss_peak_mb': round(rss, 1) if rss is not None else None,
+            'rss_growth_mb': round(rss - rss_before, 1) if rss is not None else None,
+            'seconds': round(time.perf_counter() - t0, 2)
+        }
+        if baseline is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            record.update({
+                'peak_mb': round(peak / 1024 ** 2, 1),
+                'stage_peak_mb': round((peak - baseline) / 1024 ** 2, 1),
+                'retained_mb': round((current - baseline) / 1024 ** 2, 1)
+            })
+
+        # Traced peak is stage-local; RSS peak is the process high-water mark
+        peak_mb = record.get('peak_mb', record['rss_peak_mb'])
+        previous = self.stages.get(name)
+        previous_peak = None if previous is None else previous.get('peak_mb', previous['rss_peak_mb'])
+        if previous_peak is None or (peak_mb is not None and peak_mb >= previous_peak):
+            self.stages[name] = record
+
+        if self.budget_mb is not None and peak_mb is not None and peak_mb > self.budget_mb:
+            print(f"   ⚠️  Stage '{name}' peaked at {peak_mb:.1f} MiB "
+                  f"(budget {self.budget_mb:.0f} MiB)")
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure the enclosed block as one stage"""
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Close the open stage, stop tracing and print the report
+
+        Returns:
+            Recorded stages (for run metadata)
+        """
+        self.end()
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+        self.report()
+        return self.as_dict()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Recorded stages"""
+        return {name: dict(record) for name, record in self.stages.items()}
+
+    def report(self) -> None:
+        """Print the per-stage peak memory table"""
+        if not self.stages:
+            return
+
+        def mib(value):
+            return f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+
+        print("\n📈 Peak memory per stage:")
+        header = f"   {'Stage':<28} {'RSS MiB':>10} {'RSS +MiB':>10}"
+        if self.trace:
+            header += f" {'Traced MiB':>10} {'Stage MiB':>10} {'Kept MiB':>10}"
+        print(header + f" {'Seconds':>9}")
+
+        for name, record in self.stages.items():
+            line = f"   {name:<28} {mib(record['rss_peak_mb'])} {mib(record['rss_growth_mb'])}"
+            if self.trace:
+                line += (f" {mib(record.get('peak_mb'))} {mib(record.get('stage_peak_mb'))}"
+                         f" {mib(record.get('retained_mb'))}")
+            print(line + f" {record['seconds']:>9.2f}")
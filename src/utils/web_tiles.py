@@ -0,0 +1,125 @@
+"""
+Pre-tiled, date-indexed hotspot data for the web frontend
+
+Layout (under web/tiles/{name}/):
+    index.json                  dates, zoom levels, per-date tile keys, bounds, summary
+    {date}/{z}/{x}/{y}.json     compact FeatureCollection of one date's points in one tile
+"""
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Sequence, Union
+
+from .geojson_io import DEFAULT_CRS, GeoJSONFeatureWriter, _json_ready
+
+
+def tile_xy(lons: np.ndarray, lats: np.ndarray, zoom: int):
+    """
+    Web Mercator (slippy map) tile indices for point coordinates
+
+    Args:
+        lons: Longitudes in degrees
+        lats: Latitudes in degrees
+        zoom: Zoom level
+
+    Returns:
+        (x, y) integer arrays
+    """
+    n = 2 ** zoom
+    lat_rad = np.radians(np.clip(lats, -85.0511, 85.0511))
+
+    x = np.floor((np.asarray(lons) + 180.0) / 360.0 * n).astype(np.int64)
+    y = np.floor((1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0 * n).astype(np.int64)
+    return np.clip(x, 0, n - 1), np.clip(y, 0, n - 1)
+
+
+def date_summary(probabilities: pd.Series) -> Dict[str, Any]:
+    """Count / mean / max of one date's bloom probabilities"""
+    if len(probabilities) == 0:
+        return {'count': 0, 'mean': 0.0, 'max': 0.0}
+
+    return {
+        'count': int(len(probabilities)),
+        'mean': round(float(probabilities.mean()), 6),
+        'max': round(float(probabilities.max()), 6)
+    }
+
+
+def write_web_tiles(
+    df: pd.DataFrame,
+    out_dir: Union[str, Path],
+    name: str,
+    zooms: Sequence[int] = (8, 10, 12),
+    precision: int = 6
+) -> Path:
+    """
+    Write per-date, per-zoom point tiles and their index
+
+    The output directory is replaced, so tiles of dates that are no longer
+    forecast do not linger.
+
+    Args:
+        df: Hotspots with lon/lat (or point geometry), date and bloom_probability
+        out_dir: Tile directory for this dataset (e.g. web/tiles/{AOI})
+        name: Dataset name written to the index
+        zooms: Zoom levels to pre-tile
+        precision: Decimal places for coordinates
+
+    Returns:
+        Path of index.json
+    """
+    out_dir = Path(out_dir)
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if 'lon' not in df.columns and 'geometry' in df.columns and len(df) > 0:
+        df = df.assign(lon=df.geometry.x, lat=df.geometry.y)
+
+    zooms = sorted(int(z) for z in zooms)
+    index = {
+        'name': name,
+        'crs': DEFAULT_CRS,
+        'zooms': zooms,
+        'dates': [],
+        'tiles': {},
+        'bounds': {},
+        'summary': {}
+    }
+
+    if len(df) > 0:
+        df = df.assign(date=_json_ready(df['date'])).sort_values('date', kind='stable')
+
+        for date_str, day in df.groupby('date', sort=True):
+            lons = day['lon'].to_numpy(dtype=np.float64)
+            lats = day['lat'].to_numpy(dtype=np.float64)
+
+            index['dates'].append(date_str)
+            index['bounds'][date_str] = [
+                round(float(lons.min()), precision), round(float(lats.min()), precision),
+                round(float(lons.max()), precision), round(float(lats.max()), precision)
+            ]
+            index['summary'][date_str] = date_summary(day['bloom_probability'])
+            index['tiles'][date_str] = {}
+
+            for zoom in zooms:
+                x, y = tile_xy(lons, lats, zoom)
+                keys = []
+
+                for (tx, ty), tile in day.groupby([x, y], sort=True):
+                    path = out_dir / date_str / str(zoom) / str(tx) / f"{ty}.json"
+                    with GeoJSONFeatureWriter(
+                        path, f"{name}_{date_str}_{zoom}_{tx}_{ty}", precision=precision
+                    ) as writer:
+                        writer.write_frame(tile)
+                    keys.append(f"{tx}/{ty}")
+
+                index['tiles'][date_str][str(zoom)] = keys
+
+    index_path = out_dir / 'index.json'
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+    return index_path
@@ -1,4 +1,5 @@
 """Workflow orchestration modules"""
 from .bloom_workflow import BloomForecastingWorkflow
+from .prediction_cube import PredictionCube
 
-__all__ = ['BloomForecastingWorkflow']
+__all__ = ['BloomForecastingWorkflow', 'PredictionCube']
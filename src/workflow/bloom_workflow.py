@@ -3,6 +3,8 @@ Main workflow agent for bloom forecasting pipeline
 """
 import os
 import sys
+import time
+import traceback
 import ee
 import pandas as pd
 import numpy as np
@@ -10,6 +12,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
 from tqdm import tqdm
 
 # Fix Windows console encoding for emoji support
@@ -24,29 +28,64 @@ if sys.platform == 'win32':
 try:
     from ..utils.config import get_config
     from ..utils.ee_utils import initialize_earth_engine, robust_getinfo
+    from ..utils.geojson_io import GeoJSONFeatureWriter, link_or_copy, write_feature_collection
+    from ..utils.web_tiles import write_web_tiles
+    from ..utils.memory_profile import MemoryProfiler, resolve_dtype
     from ..data.ee_data_collector import EarthEngineDataCollector
+    from ..data.timeseries_cache import TimeSeriesCache
+    from ..data.pixel_store import PixelTimeSeriesStore
     from ..models.random_forest_model import RandomForestBloomModel
     from ..models.deep_learning_models import DeepLearningBloomModel
     from ..models.base_model import TimeSeriesDataPreprocessor
+    from ..models.spatial_inference import SpatialInferenceEngine
+    from ..models.model_registry import ModelRegistry
     from ..analysis.hotspot_detection import HotspotAnalyzer
     from ..visualization.visualizer import BloomVisualizer
+    from .prediction_cube import PredictionCube
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from utils.config import get_config
     from utils.ee_utils import initialize_earth_engine, robust_getinfo
+    from utils.geojson_io import GeoJSONFeatureWriter, link_or_copy, write_feature_collection
+    from utils.web_tiles import write_web_tiles
+    from utils.memory_profile import MemoryProfiler, resolve_dtype
     from data.ee_data_collector import EarthEngineDataCollector
+    from data.timeseries_cache import TimeSeriesCache
+    from data.pixel_store import PixelTimeSeriesStore
     from models.random_forest_model import RandomForestBloomModel
     from models.deep_learning_models import DeepLearningBloomModel
     from models.base_model import TimeSeriesDataPreprocessor
+    from models.spatial_inference import SpatialInferenceEngine
+    from models.model_registry import ModelRegistry
     from analysis.hotspot_detection import HotspotAnalyzer
     from visualization.visualizer import BloomVisualizer
+    from workflow.prediction_cube import PredictionCube
 
 
 class BloomForecastingWorkflow:
     """Main workflow orchestrator for bloom forecasting"""
     
+    # Indices extracted from Sentinel-2 (AOI series and per-pixel series)
+    SPECTRAL_BANDS = ['ARI', 'NYI', 'CRI', 'NDVI', 'EVI', 'SAVI', 'NDRE']
+    
+    # Indices that get a z-score feature
+    ZSCORE_INDICES = ['ARI', 'NYI', 'CRI', 'NDVI', 'EVI']
+    
+    # Observations per model input sequence
+    SEQUENCE_LENGTH = 30
+    
+    # Cluster ids are offset per spatial tile so ids from different tiles never
+    # collide; clusters crossing tile edges are merged afterwards
+    TILE_CLUSTER_STRIDE = 1_000_000
+    
+    # Time-series export modes
+    EXPORT_MODES = ('merged', 'daily', 'both')
+    
+    # Model types implemented by DeepLearningBloomModel (advanced ones fall back to LSTM)
+    DEEP_LEARNING_MODELS = ['lstm', 'gru', 'cnn_lstm', 'cnn3d_lstm', 'attention_lstm']
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize workflow
@@ -57,23 +96,46 @@ class BloomForecastingWorkflow:
         print("🚀 Initializing Bloom Forecasting Workflow...")
         
         # Load configuration
+        self.config_path = config_path
         self.config = get_config(config_path)
         print(f"   Project: {self.config.get('project_name')}")
         print(f"   Version: {self.config.get('version')}")
         
+        # Floating-point dtype of every numeric stage (extraction → sequences → models)
+        self.dtype = resolve_dtype(self.config.get('runtime.dtype', 'float32'))
+        
         # Initialize Earth Engine
         initialize_earth_engine(self.config.ee_project_id)
         
         # Initialize components (simplified - matches notebook approach)
         self.data_collector = EarthEngineDataCollector(
-            scale=self.config.get('data_sources.sentinel2.scale', 20)
+            scale=self.config.get('data_sources.sentinel2.scale', 20),
+            fetch_workers=self.config.get('data_sources.sentinel2.fetch.workers', 4),
+            batch_size=self.config.get('data_sources.sentinel2.fetch.batch_size', 50),
+            max_batch_size=self.config.get('data_sources.sentinel2.fetch.max_batch_size', 500),
+            target_latency=self.config.get('data_sources.sentinel2.fetch.target_latency', 5.0),
+            extraction_mode=self.config.get('data_sources.sentinel2.extraction_mode', 'paged'),
+            dtype=self.dtype.name
         )
         
+        # Persistent time-series cache (only new dates are fetched on later runs)
+        if self.config.get('data_sources.sentinel2.cache.enabled', True):
+            self.timeseries_cache = TimeSeriesCache(
+                self.config.timeseries_dir / 'cache',
+                refresh_days=self.config.get('data_sources.sentinel2.cache.refresh_days', 5)
+            )
+        else:
+            self.timeseries_cache = None
+        
         self.hotspot_analyzer = HotspotAnalyzer(
             probability_threshold=self.config.get('spatial_analysis.hotspot_threshold', 0.70),
             distance_band=self.config.get('spatial_analysis.gi_star.distance_band', 1000),
             dbscan_eps=self.config.get('spatial_analysis.dbscan.eps', 500),
-            dbscan_min_samples=self.config.get('spatial_analysis.dbscan.min_samples', 10)
+            dbscan_min_samples=self.config.get('spatial_analysis.dbscan.min_samples', 10),
+            gi_star_permutations=self.config.get('spatial_analysis.gi_star.permutations', 999),
+            significance_level=self.config.get('spatial_analysis.gi_star.significance_level', 0.05),
+            cache_size=self.config.get('spatial_analysis.neighborhood_cache.size', 1),
+            max_cached_pairs=self.config.get('spatial_analysis.neighborhood_cache.max_pairs', 50_000_000)
         )
         
         self.visualizer = BloomVisualizer(self.config._config)
@@ -83,6 +145,25 @@ class BloomForecastingWorkflow:
         # Models
         self.models = {}
         
+        # Peak memory per pipeline stage
+        self.memory_profiler = MemoryProfiler(
+            trace=self.config.get('runtime.profile_memory', False),
+            budget_mb=self.config.get('runtime.memory_budget_mb')
+        )
+        
+        # Input normalization and training-window target dates of the last
+        # prepared training data
+        self.normalization = None
+        self.train_target_dates = None
+        
+        # Trained models per AOI / model type / feature set, reused across runs
+        self.model_registry = ModelRegistry(
+            self.config.models_dir,
+            max_age_days=self.config.get('model_registry.max_age_days', 7),
+            drift_threshold=self.config.get('model_registry.drift_threshold', 0.5),
+            score_tolerance=self.config.get('model_registry.score_tolerance', 0.25)
+        )
+        
         print("✅ Workflow initialized successfully!\n")
     
     def run_full_pipeline(
@@ -90,7 +171,8 @@ class BloomForecastingWorkflow:
         aoi_name: str,
         model_types: List[str] = ['random_forest', 'lstm'],
         train_years: int = 3,
-        forecast_days: int = 30
+        forecast_days: int = 30,
+        model_policy: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Run complete bloom forecasting pipeline
@@ -100,6 +182,8 @@ class BloomForecastingWorkflow:
             model_types: List of models to train ('random_forest', 'lstm', 'gru')
             train_years: Years of historical data for training
             forecast_days: Days to forecast ahead
+            model_policy: 'retrain', 'reuse' or 'retrain_if_stale'
+                (default: model_registry.policy)
             
         Returns:
             Dictionary with all results
@@ -115,8 +199,10 @@ class BloomForecastingWorkflow:
             'timestamp': datetime.now().isoformat(),
             'config': self.config._config
         }
+        self.memory_profiler.reset()
         
         # Step 1: Data Collection
+        self.memory_profiler.begin('data_collection')
         print("\n📡 STEP 1: DATA COLLECTION")
         print("-" * 80)
         time_series_df, aoi_geometry = self._collect_data(aoi_name, train_years)
@@ -124,6 +210,7 @@ class BloomForecastingWorkflow:
         results['aoi_geometry'] = aoi_geometry
         
         # Step 2: Feature Engineering
+        self.memory_profiler.begin('feature_engineering')
         print("\n🔧 STEP 2: FEATURE ENGINEERING")
         print("-" * 80)
         X_train, y_train, X_val, y_val, feature_names = self._engineer_features(
@@ -134,14 +221,17 @@ class BloomForecastingWorkflow:
         results['val_samples'] = len(X_val)
         
         # Step 3: Model Training & Selection
+        self.memory_profiler.begin('model_training')
         print("\n🎯 STEP 3: MODEL TRAINING & SELECTION")
         print("-" * 80)
         model_results = self._train_models(
-            model_types, X_train, y_train, X_val, y_val, feature_names
+            model_types, X_train, y_train, X_val, y_val, feature_names,
+            aoi_name=aoi_name, time_series_df=time_series_df, model_policy=model_policy
         )
         results['models'] = model_results
         
         # Step 4: Best Model Selection
+        self.memory_profiler.begin('model_selection')
         print("\n🏆 STEP 4: BEST MODEL SELECTION")
         print("-" * 80)
         best_model_name, best_model = self._select_best_model(model_results)
@@ -149,22 +239,24 @@ class BloomForecastingWorkflow:
         print(f"   ✅ Selected: {best_model_name}")
         
         # Step 5: Spatial Prediction
+        self.memory_profiler.begin('spatial_prediction')
         print("\n🗺️  STEP 5: SPATIAL PREDICTION")
         print("-" * 80)
-        predictions_gdf = self._spatial_prediction(
-            best_model, aoi_geometry, aoi_name, forecast_days
+        engine = self._build_inference_engine(best_model, feature_names, time_series_df)
+        hotspots_gdf = self._spatial_prediction(
+            engine, aoi_geometry, aoi_name, forecast_days
         )
-        results['predictions'] = predictions_gdf
+        results['hotspots'] = hotspots_gdf
         
-        # Step 6: Hotspot Detection
-        print("\n🔥 STEP 6: HOTSPOT DETECTION")
+        # Step 6: Hotspot Ranking (detection runs per tile in step 5)
+        self.memory_profiler.begin('hotspot_ranking')
+        print("\n🔥 STEP 6: HOTSPOT RANKING")
         print("-" * 80)
-        hotspots_gdf = self.hotspot_analyzer.identify_hotspots(predictions_gdf)
         top_hotspots = self.hotspot_analyzer.get_top_hotspots(hotspots_gdf, n=150)
-        results['hotspots'] = hotspots_gdf
         results['top_hotspots'] = top_hotspots
         
         # Step 7: Visualization
+        self.memory_profiler.begin('visualization')
         print("\n📊 STEP 7: VISUALIZATION")
         print("-" * 80)
         vis_paths = self._create_visualizations(
@@ -173,10 +265,12 @@ class BloomForecastingWorkflow:
         results['visualization_paths'] = vis_paths
         
         # Step 8: Export Results
+        self.memory_profiler.begin('export')
         print("\n💾 STEP 8: EXPORT RESULTS")
         print("-" * 80)
         export_paths = self._export_results(aoi_name, results)
         results['export_paths'] = export_paths
+        results['memory_profile'] = self.memory_profiler.finish()
         
         print(f"\n{'='*80}")
         print(f"✅ PIPELINE COMPLETED SUCCESSFULLY!")
@@ -191,7 +285,9 @@ class BloomForecastingWorkflow:
         date_end: Optional[str] = None,
         model_types: List[str] = ['random_forest', 'lstm'],
         train_years: int = 3,
-        top_n: int = 50
+        top_n: int = 50,
+        export_mode: Optional[str] = None,
+        model_policy: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Run time-series bloom forecasting pipeline
@@ -204,10 +300,20 @@ class BloomForecastingWorkflow:
             model_types: List of models to train
             train_years: Years of historical data for training
             top_n: Number of top hotspots per date
+            export_mode: 'merged' (single timeseries file, also linked into
+                web/), 'daily' (one file per date) or 'both'
+                (default: output.timeseries_export)
+            model_policy: 'retrain', 'reuse' or 'retrain_if_stale'
+                (default: model_registry.policy)
             
         Returns:
             Dictionary with time-series results
         """
+        if export_mode is None:
+            export_mode = self.config.get('output.timeseries_export', 'merged')
+        if export_mode not in self.EXPORT_MODES:
+            raise ValueError(f"Unknown export mode: {export_mode}")
+        
         print(f"\n{'='*80}")
         print(f"RUNNING TIME-SERIES BLOOM FORECASTING PIPELINE")
         print(f"AOI: {aoi_name}")
@@ -239,10 +345,13 @@ class BloomForecastingWorkflow:
                 'total_days': FIXED_FORECAST_DAYS
             },
             'top_n': top_n,
+            'export_mode': export_mode,
             'config': self.config._config
         }
+        self.memory_profiler.reset()
         
         # Step 1: Data Collection (same as single-date)
+        self.memory_profiler.begin('data_collection')
         print("\n📡 STEP 1: DATA COLLECTION")
         print("-" * 80)
         time_series_df, aoi_geometry = self._collect_data(aoi_name, train_years)
@@ -250,6 +359,7 @@ class BloomForecastingWorkflow:
         results['aoi_geometry'] = aoi_geometry
         
         # Step 2: Feature Engineering (same as single-date)
+        self.memory_profiler.begin('feature_engineering')
         print("\n🔧 STEP 2: FEATURE ENGINEERING")
         print("-" * 80)
         X_train, y_train, X_val, y_val, feature_names = self._engineer_features(
@@ -258,41 +368,40 @@ class BloomForecastingWorkflow:
         results['feature_names'] = feature_names
         
         # Step 3: Model Training & Selection (same as single-date)
+        self.memory_profiler.begin('model_training')
         print("\n🎯 STEP 3: MODEL TRAINING & SELECTION")
         print("-" * 80)
         model_results = self._train_models(
-            model_types, X_train, y_train, X_val, y_val, feature_names
+            model_types, X_train, y_train, X_val, y_val, feature_names,
+            aoi_name=aoi_name, time_series_df=time_series_df, model_policy=model_policy
         )
         results['models'] = model_results
         
         # Step 4: Best Model Selection
+        self.memory_profiler.begin('model_selection')
         print("\n🏆 STEP 4: BEST MODEL SELECTION")
         print("-" * 80)
         best_model_name, best_model = self._select_best_model(model_results)
         results['best_model'] = best_model_name
         print(f"   ✅ Selected: {best_model_name}")
         
-        # Step 5: TIME-SERIES Spatial Prediction (NEW!)
-        print("\n🗺️  STEP 5: TIME-SERIES SPATIAL PREDICTION")
-        print("-" * 80)
-        time_series_predictions = self._spatial_prediction_time_series(
-            best_model, aoi_geometry, aoi_name, date_start, actual_end, top_n
-        )
-        results['time_series_predictions'] = time_series_predictions
-        
-        # Step 6: TIME-SERIES Hotspot Detection (NEW!)
-        print("\n🔥 STEP 6: TIME-SERIES HOTSPOT DETECTION")
+        # Step 5: TIME-SERIES Spatial Prediction & Hotspot Detection (tiled)
+        self.memory_profiler.begin('spatial_prediction')
+        print("\n🗺️  STEP 5: TIME-SERIES SPATIAL PREDICTION & HOTSPOT DETECTION")
         print("-" * 80)
-        time_series_hotspots = self._detect_hotspots_time_series(
-            time_series_predictions, top_n
+        engine = self._build_inference_engine(best_model, feature_names, time_series_df)
+        time_series_hotspots = self._spatial_prediction_time_series(
+            engine, aoi_geometry, aoi_name, date_start, actual_end, top_n
         )
         results['time_series_hotspots'] = time_series_hotspots
         
-        # Step 7: Export Time-Series Results (NEW!)
-        print("\n💾 STEP 7: EXPORT TIME-SERIES RESULTS")
+        # Step 6: Export Time-Series Results
+        self.memory_profiler.begin('export')
+        print("\n💾 STEP 6: EXPORT TIME-SERIES RESULTS")
         print("-" * 80)
         export_paths = self._export_time_series_results(aoi_name, results)
         results['export_paths'] = export_paths
+        results['memory_profile'] = self.memory_profiler.finish()
         
         print(f"\n{'='*80}")
         print(f"✅ TIME-SERIES PIPELINE COMPLETED SUCCESSFULLY!")
@@ -303,6 +412,236 @@ class BloomForecastingWorkflow:
         
         return results
     
+    def run_all_aois(
+        self,
+        date_start: str,
+        aoi_names: Optional[List[str]] = None,
+        date_end: Optional[str] = None,
+        model_types: List[str] = ['random_forest', 'lstm'],
+        train_years: int = 3,
+        top_n: int = 50,
+        max_workers: Optional[int] = None,
+        export_mode: Optional[str] = None,
+        model_policy: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the time-series pipeline for many AOIs concurrently
+        
+        Each worker process initializes Earth Engine and the workflow once and
+        then runs whole AOIs, so Earth Engine fetching in one AOI overlaps with
+        model training in another. A failing AOI does not affect the others.
+        
+        Args:
+            date_start: Start date for predictions (YYYY-MM-DD)
+            aoi_names: AOIs to run (default: all AOIs in config)
+            date_end: End date (metadata only)
+            model_types: List of models to train
+            train_years: Years of historical data for training
+            top_n: Number of top hotspots per date
+            max_workers: Worker processes (default: orchestration.max_workers)
+            export_mode: Time-series export mode (see run_time_series_pipeline)
+            model_policy: Model reuse policy (see run_time_series_pipeline)
+            
+        Returns:
+            Run report with per-AOI status, duration and errors
+        """
+        if aoi_names is None:
+            aoi_names = [aoi['name'] for aoi in self.config.get_all_aois()]
+        
+        unknown = [name for name in aoi_names if self.config.get_aoi(name) is None]
+        if unknown:
+            raise ValueError(f"AOI(s) not found in config: {', '.join(unknown)}")
+        
+        if max_workers is None:
+            max_workers = self.config.get('orchestration.max_workers', None)
+        cpu_count = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers or cpu_count, len(aoi_names)))
+        
+        # Split CPU threads between workers to avoid oversubscription
+        torch_threads = max(1, cpu_count // max_workers)
+        
+        pipeline_kwargs = {
+            'date_start': date_start,
+            'date_end': date_end,
+            'model_types': model_types,
+            'train_years': train_years,
+            'top_n': top_n,
+            'export_mode': export_mode,
+            'model_policy': model_policy
+        }
+        
+        print(f"\n{'='*80}")
+        print(f"RUNNING {len(aoi_names)} AOIS IN PARALLEL")
+        print(f"Workers: {max_workers} (torch threads/worker: {torch_threads})")
+        print(f"AOIs: {', '.join(aoi_names)}")
+        print(f"{'='*80}\n")
+        
+        start_time = time.time()
+        aoi_reports = {}
+        
+        # 'spawn' keeps workers clear of torch/EE thread state from the parent
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_init_aoi_worker,
+            initargs=(self.config_path, torch_threads)
+        ) as executor:
+            futures = {
+                executor.submit(_run_aoi_worker, aoi_name, pipeline_kwargs): aoi_name
+                for aoi_name in aoi_names
+            }
+            
+            for future in as_completed(futures):
+                aoi_name = futures[future]
+                try:
+                    report = future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. initialization failure)
+                    report = {
+                        'aoi_name': aoi_name,
+                        'status': 'failed',
+                        'error': str(e),
+                        'traceback': traceback.format_exc()
+                    }
+                
+                aoi_reports[aoi_name] = report
+                status_icon = '✅' if report['status'] == 'success' else '❌'
+                print(f"   {status_icon} {aoi_name}: {report['status']}"
+                      f" ({report.get('duration_s', 0):.1f}s)")
+        
+        run_report = {
+            'date_start': date_start,
+            'generated_at': datetime.now().isoformat(),
+            'workers': max_workers,
+            'wall_clock_s': time.time() - start_time,
+            'succeeded': [n for n in aoi_names if aoi_reports[n]['status'] == 'success'],
+            'failed': [n for n in aoi_names if aoi_reports[n]['status'] != 'success'],
+            'aois': [aoi_reports[n] for n in aoi_names]
+        }
+        
+        report_path = self.config.hotspots_dir / f"run_all_aois_{date_start}.json"
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(run_report, f, indent=2, ensure_ascii=False)
+        
+        print(f"\n{'='*80}")
+        print(f"ALL AOIS COMPLETED in {run_report['wall_clock_s']:.1f}s")
+        print(f"   Succeeded: {len(run_report['succeeded'])}/{len(aoi_names)}")
+        for name in run_report['failed']:
+            print(f"   ❌ {name}: {aoi_reports[name].get('error')}")
+        print(f"   Report: {report_path}")
+        print(f"{'='*80}\n")
+        
+        return run_report
+    
+    def build_pixel_store(
+        self,
+        aoi_name: str,
+        train_years: int = 3
+    ) -> PixelTimeSeriesStore:
+        """
+        Extract per-pixel training series over the prediction grid to disk
+        
+        Pixels are extracted and written one store chunk at a time, so memory
+        stays bounded by training.pixel_store.chunk_pixels. The date axis is
+        the AOI series' observation dates. Train with
+        DeepLearningBloomModel.train_from_store() /
+        RandomForestBloomModel.train_from_store().
+        
+        Args:
+            aoi_name: Name of AOI from config
+            train_years: Years of history to extract
+            
+        Returns:
+            The written store (outputs/timeseries/pixel_store/{AOI})
+        """
+        time_series_df, aoi_geometry = self._collect_data(aoi_name, train_years)
+        
+        lons, lats = self._get_prediction_grid(aoi_geometry)
+        lon_grid, lat_grid = np.meshgrid(lons, lats)
+        point_lons, point_lats = lon_grid.ravel(), lat_grid.ravel()
+        
+        chunk_pixels = int(self.config.get('training.pixel_store.chunk_pixels', 1024))
+        store = PixelTimeSeriesStore.create(
+            self.config.timeseries_dir / 'pixel_store' / aoi_name,
+            time_series_df['date'],
+            self.SPECTRAL_BANDS,
+            dtype=self.dtype.name,
+            chunk_pixels=chunk_pixels
+        )
+        
+        dates = pd.to_datetime(time_series_df['date'])
+        collection = self.data_collector.get_sentinel2_collection(
+            aoi_geometry,
+            dates.min().strftime('%Y-%m-%d'),
+            (dates.max() + timedelta(days=1)).strftime('%Y-%m-%d')
+        )
+        
+        print(f"   Building pixel store: {len(point_lons)} pixels x {store.n_dates} dates")
+        for start in tqdm(range(0, len(point_lons), chunk_pixels), desc="   Extracting pixels"):
+            end = min(start + chunk_pixels, len(point_lons))
+            pixel_df = self.data_collector.extract_pixel_time_series(
+                collection,
+                point_lons[start:end],
+                point_lats[start:end],
+                self.SPECTRAL_BANDS,
+                max_points_per_request=self.config.get('spatial_prediction.max_points_per_request', 5000)
+            )
+            pixel_df['pixel_id'] += start
+            store.append(pixel_df)
+        
+        print(f"   ✅ Pixel store: {store.n_pixels} pixels with data in {store.n_chunks} chunks")
+        
+        return store
+    
+    def train_pixel_models(
+        self,
+        aoi_name: str,
+        model_types: List[str] = ['random_forest', 'lstm']
+    ) -> Dict[str, Any]:
+        """
+        Train models on the AOI's pixel store (see build_pixel_store())
+        
+        Deep learning models stream shuffled windows from disk; Random Forest
+        trains on a uniform subsample. Models are saved under
+        models_dir/pixel/{AOI}/{model}.
+        
+        Args:
+            aoi_name: Name of AOI from config
+            model_types: Models to train
+            
+        Returns:
+            Dict of model type → trained model
+        """
+        store = PixelTimeSeriesStore(self.config.timeseries_dir / 'pixel_store' / aoi_name)
+        models = {}
+        
+        for model_type in model_types:
+            actual_model_type, config = self._model_config(model_type)
+            
+            if actual_model_type == 'random_forest':
+                model = RandomForestBloomModel(config, task='regression')
+                model.train_from_store(
+                    store, self.SEQUENCE_LENGTH,
+                    max_samples=self.config.get('training.pixel_store.rf_max_samples', 200000),
+                    seed=42
+                )
+            elif model_type in self.DEEP_LEARNING_MODELS:
+                model = DeepLearningBloomModel(config, model_type=actual_model_type)
+                model.train_from_store(
+                    store, self.SEQUENCE_LENGTH,
+                    block_chunks=self.config.get('training.pixel_store.block_chunks', 2),
+                    seed=42
+                )
+            else:
+                print(f"   ⚠️  Unknown model type: {model_type}")
+                continue
+            
+            model.save(self.config.models_dir / 'pixel' / aoi_name / model_type)
+            models[model_type] = model
+        
+        return models
+    
     def _collect_data(
         self,
         aoi_name: str,
@@ -326,18 +665,36 @@ class BloomForecastingWorkflow:
         print(f"   Date range: {start_date.date()} to {end_date.date()}")
         print(f"   Collecting Sentinel-2 data...")
         
-        # Get collection
-        collection = self.data_collector.get_sentinel2_collection(
-            aoi_geometry,
-            start_date.strftime('%Y-%m-%d'),
-            end_date.strftime('%Y-%m-%d')
-        )
+        bands = self.SPECTRAL_BANDS
         
-        # Extract time series
-        bands = ['ARI', 'NYI', 'CRI', 'NDVI', 'EVI', 'SAVI', 'NDRE']
-        time_series_df = self.data_collector.extract_time_series(
-            collection, aoi_geometry, bands
-        )
+        def fetch(fetch_start: str, fetch_end: str) -> pd.DataFrame:
+            """Get collection and extract time series for a date range"""
+            collection = self.data_collector.get_sentinel2_collection(
+                aoi_geometry, fetch_start, fetch_end
+            )
+            return self.data_collector.extract_time_series(
+                collection, aoi_geometry, bands
+            )
+        
+        if self.timeseries_cache is not None:
+            cache_key = TimeSeriesCache.make_key(
+                coords,
+                bands,
+                self.data_collector.scale,
+                self.data_collector.cloud_threshold,
+                self.data_collector.COLLECTION_ID
+            )
+            time_series_df = self.timeseries_cache.get_or_fetch(
+                cache_key,
+                start_date.strftime('%Y-%m-%d'),
+                end_date.strftime('%Y-%m-%d'),
+                fetch
+            )
+        else:
+            time_series_df = fetch(
+                start_date.strftime('%Y-%m-%d'),
+                end_date.strftime('%Y-%m-%d')
+            )
         
         print(f"   ✅ Collected {len(time_series_df)} time points")
         
@@ -359,8 +716,7 @@ class BloomForecastingWorkflow:
         df = self.preprocessor.add_temporal_features(time_series_df)
         
         # Calculate z-scores
-        index_cols = ['ARI', 'NYI', 'CRI', 'NDVI', 'EVI']
-        df = self.preprocessor.calculate_z_scores(df, index_cols)
+        df = self.preprocessor.calculate_z_scores(df, self.ZSCORE_INDICES)
         
         # Select features
         feature_cols = [col for col in df.columns if col not in ['date']]
@@ -375,21 +731,33 @@ class BloomForecastingWorkflow:
         # Fill NaN values
         data = data.ffill().bfill()
         
-        # Convert to float64 explicitly
-        data = data.astype(np.float64).values
+        # Convert to the runtime dtype (runtime.dtype, float32 by default)
+        data = data.astype(self.dtype).values
         
         # Check for any remaining NaN or inf
         if np.any(np.isnan(data)) or np.any(np.isinf(data)):
             print("   ⚠️  Warning: Found NaN/Inf values, replacing with 0")
             data = np.nan_to_num(data, nan=0.0, posinf=0.0, neginf=0.0)
         
-        # Create sequences for time series models
-        sequence_length = 30  # Use 30 days of history
+        sequence_length = self.SEQUENCE_LENGTH  # Use 30 observations of history
+        
+        # Normalize with statistics of the training rows only (fitted on the 2D
+        # series, not on overlapping windows); the target stays in raw units
+        n_windows = max(len(data) - sequence_length, 0)
+        n_train_rows = n_windows - int(n_windows * 0.2) + sequence_length - 1
+        target = data[:, 0].copy()
+        self.normalization = self.preprocessor.fit_normalization(
+            data[:max(n_train_rows, 1)], feature_cols
+        )
+        data = self.preprocessor.apply_normalization(data, self.normalization, dtype=self.dtype)
+        
+        # Create sequences for time series models (zero-copy window views)
         X, y = self.preprocessor.create_sequences(
             data, 
             sequence_length=sequence_length,
             forecast_horizon=1,
-            stride=1
+            stride=1,
+            target=target
         )
         
         # Split train/val
@@ -399,6 +767,10 @@ class BloomForecastingWorkflow:
         X_val = X[-val_size:]
         y_val = y[-val_size:]
         
+        # Date of each training window's target row (fine-tuning selects new windows by it)
+        target_dates = pd.to_datetime(df['date']).to_numpy()[sequence_length:]
+        self.train_target_dates = target_dates[:len(X_train)]
+        
         print(f"   ✅ Train sequences: {len(X_train)}")
         print(f"   ✅ Val sequences: {len(X_val)}")
         
@@ -411,43 +783,100 @@ class BloomForecastingWorkflow:
         y_train: np.ndarray,
         X_val: np.ndarray,
         y_val: np.ndarray,
-        feature_names: List[str]
+        feature_names: List[str],
+        aoi_name: Optional[str] = None,
+        time_series_df: Optional[pd.DataFrame] = None,
+        model_policy: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Train all specified models"""
+        """
+        Train all specified models, or reuse registered ones
+        
+        Models are kept in the model registry per AOI, model type and feature
+        set. 'reuse' loads a registered model whenever one exists,
+        'retrain_if_stale' only when it is within its retrain schedule and
+        neither the data nor its validation score drifted, 'retrain' always trains.
+        """
+        if model_policy is None:
+            model_policy = self.config.get('model_registry.policy', 'retrain_if_stale')
+        if model_policy not in ModelRegistry.POLICIES:
+            raise ValueError(f"Unknown model policy: {model_policy}")
+        
+        use_registry = aoi_name is not None and time_series_df is not None
+        if use_registry:
+            fingerprint = ModelRegistry.data_fingerprint(time_series_df, self.SPECTRAL_BANDS)
+        
         model_results = {}
         
         for model_type in model_types:
             print(f"\n   Training {model_type.upper()} model...")
             print("   " + "-" * 70)
             
-            if model_type == 'random_forest':
-                model = self._train_random_forest(
-                    X_train, y_train, X_val, y_val, feature_names
-                )
-            elif model_type in ['lstm', 'gru', 'cnn_lstm', 'cnn3d_lstm', 'attention_lstm']:
-                # All deep learning models (LSTM, GRU, CNN-LSTM, 3D-CNN-LSTM, etc.)
-                model = self._train_deep_learning(
-                    model_type, X_train, y_train, X_val, y_val
-                )
-            else:
+            if model_type != 'random_forest' and model_type not in self.DEEP_LEARNING_MODELS:
                 print(f"   ⚠️  Unknown model type: {model_type}")
                 print(f"   ℹ️  Available models: random_forest, lstm, gru, cnn_lstm, cnn3d_lstm")
                 print(f"   ℹ️  Note: Advanced models (cnn3d_lstm) may not be fully implemented yet")
                 print(f"   ⏭️  Skipping {model_type}...")
                 continue
             
-            # Save model
-            model_dir = self.config.models_dir / model_type
-            model.save(model_dir)
+            model, val_score, status = None, None, 'trained'
+            if use_registry:
+                feature_hash = ModelRegistry.feature_hash(
+                    model_type, feature_names, self.SEQUENCE_LENGTH, self._model_config(model_type)[1]
+                )
+                if model_policy != 'retrain':
+                    model, val_score, status = self._load_registered_model(
+                        aoi_name, model_type, feature_hash, fingerprint, model_policy,
+                        X_train, y_train, X_val, y_val
+                    )
+            
+            if model is None:
+                status = 'trained'
+                if model_type == 'random_forest':
+                    model = self._train_random_forest(
+                        X_train, y_train, X_val, y_val, feature_names
+                    )
+                else:
+                    # All deep learning models (LSTM, GRU, CNN-LSTM, 3D-CNN-LSTM, etc.)
+                    # Registered runs checkpoint next to the entry so a killed run resumes
+                    checkpoint_path = None
+                    if use_registry:
+                        checkpoint_path = (self.model_registry.entry_dir(aoi_name, model_type, feature_hash)
+                                           / 'training_checkpoint.pth')
+                    model = self._train_deep_learning(
+                        model_type, X_train, y_train, X_val, y_val,
+                        feature_names=feature_names, checkpoint_path=checkpoint_path
+                    )
+                
+                # Evaluate
+                val_score = self._validation_mse(model, X_val, y_val)
+            
+            # New weights were fitted on the current normalization (fine-tuned
+            # models keep the statistics they were trained and fine-tuned with)
+            if status == 'trained':
+                model.normalization = self.normalization
             
-            # Evaluate
-            val_preds = model.predict(X_val)
-            val_score = np.mean((val_preds.flatten() - y_val.flatten()) ** 2)
+            # Save model (trained or fine-tuned)
+            if status == 'reused':
+                model_dir = self.model_registry.model_dir(aoi_name, model_type, feature_hash)
+            elif use_registry:
+                # Fine-tuned models keep the time and fingerprint of their full training
+                base_manifest = None
+                if status == 'fine_tuned':
+                    base_manifest = self.model_registry.lookup(aoi_name, model_type, feature_hash)
+                model_dir = self.model_registry.register(
+                    aoi_name, model_type, feature_hash, model,
+                    feature_names, fingerprint, val_score, n_train_samples=len(X_train),
+                    last_train_date=self._last_train_date(), base_manifest=base_manifest
+                )
+            else:
+                model_dir = self.config.models_dir / model_type
+                model.save(model_dir)
             
             model_results[model_type] = {
                 'model': model,
                 'val_score': val_score,
-                'model_dir': str(model_dir)
+                'model_dir': str(model_dir),
+                'status': status
             }
             
             print(f"   ✅ Validation MSE: {val_score:.6f}")
@@ -456,6 +885,152 @@ class BloomForecastingWorkflow:
         
         return model_results
     
+    @staticmethod
+    def _validation_mse(model: Any, X_val: np.ndarray, y_val: np.ndarray) -> float:
+        """Validation MSE of a trained model"""
+        val_preds = model.predict(X_val)
+        return float(np.mean((val_preds.flatten() - y_val.flatten()) ** 2))
+    
+    def _model_config(self, model_type: str) -> Tuple[str, Dict[str, Any]]:
+        """Implemented model type and its configuration for a requested model type"""
+        if model_type == 'random_forest':
+            config = dict(self.config.get_model_config('random_forest'))
+            config['dtype'] = self.dtype.name
+            return 'random_forest', config
+        return self._deep_learning_config(model_type)
+    
+    def _new_model(self, model_type: str) -> Any:
+        """Untrained model instance (e.g. to load registered weights into)"""
+        actual_model_type, config = self._model_config(model_type)
+        if actual_model_type == 'random_forest':
+            return RandomForestBloomModel(config, task='regression')
+        return DeepLearningBloomModel(config, model_type=actual_model_type)
+    
+    def _load_registered_model(
+        self,
+        aoi_name: str,
+        model_type: str,
+        feature_hash: str,
+        fingerprint: Dict[str, Any],
+        model_policy: str,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray
+    ) -> Tuple[Optional[Any], Optional[float], str]:
+        """
+        Registered model and its current validation MSE
+        
+        A deep learning model whose validation score degraded is fine-tuned
+        instead of retrained when model_registry.fine_tune is enabled; models
+        past their retrain schedule or with drifted data (both measured from
+        the last full training) are always retrained.
+        
+        Returns:
+            (model, val_score, status) with status 'reused' or 'fine_tuned';
+            (None, None, 'trained') when a model must be trained from scratch
+        """
+        manifest = self.model_registry.lookup(aoi_name, model_type, feature_hash)
+        if manifest is None:
+            print(f"   ℹ️  No registered {model_type} model for this feature set")
+            return None, None, 'trained'
+        
+        try:
+            model = self.model_registry.load(
+                aoi_name, model_type, feature_hash, self._new_model(model_type)
+            )
+            
+            # Score on inputs normalized the way the registered model was trained
+            val_score = self._validation_mse(model, self._model_inputs(model, X_val), y_val)
+        except Exception as e:
+            print(f"   ⚠️  Could not load registered model: {e}")
+            return None, None, 'trained'
+        
+        if model_policy == 'reuse':
+            print(f"   ♻️  Reusing registered model (trained {manifest['trained_at']})")
+            return model, val_score, 'reused'
+        
+        stale, reason, fine_tunable = self.model_registry.staleness(manifest, fingerprint, val_score)
+        if not stale:
+            print(f"   ♻️  Reusing registered model: {reason}")
+            return model, val_score, 'reused'
+        
+        # Schedule and drift are measured from the last full training and need a retrain
+        if (fine_tunable and isinstance(model, DeepLearningBloomModel)
+                and self.config.get('model_registry.fine_tune.enabled', True)):
+            print(f"   🔧 Stale ({reason}), fine-tuning registered model")
+            val_score = self._fine_tune_deep_learning(model, manifest, X_train, y_train, X_val, y_val)
+            if val_score is not None:
+                return model, val_score, 'fine_tuned'
+        
+        print(f"   🔁 Retraining: {reason}")
+        return None, None, 'trained'
+    
+    def _fine_tune_deep_learning(
+        self,
+        model: DeepLearningBloomModel,
+        manifest: Dict[str, Any],
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        X_val: np.ndarray,
+        y_val: np.ndarray
+    ) -> Optional[float]:
+        """
+        Fine-tune a registered model on the training windows added since it was trained
+        
+        New windows are those whose target date is after the manifest's
+        last_train_date (the training series is a rolling window, so counts
+        do not identify them). Inputs are renormalized to the model's own
+        statistics, which it keeps.
+        
+        Returns:
+            Validation MSE, or None when a full retrain is needed
+        """
+        last_train_date = manifest.get('last_train_date')
+        if last_train_date is None or self.train_target_dates is None:
+            print(f"   ℹ️  No last training date registered, cannot fine-tune")
+            return None
+        
+        new = self.train_target_dates > np.datetime64(last_train_date)
+        if not new.any():
+            print(f"   ℹ️  No training windows after {last_train_date}, cannot fine-tune")
+            return None
+        
+        X_model = self._model_inputs(model, X_train)
+        X_val_model = self._model_inputs(model, X_val)
+        
+        model.fine_tune(
+            X_model[new], y_train[new],
+            X_model[~new], y_train[~new],
+            X_val_model, y_val,
+            epochs=self.config.get('model_registry.fine_tune.epochs', 5),
+            replay_size=self.config.get('model_registry.fine_tune.replay_size', 256),
+            learning_rate=self.config.get('model_registry.fine_tune.learning_rate')
+        )
+        
+        val_score = self._validation_mse(model, X_val_model, y_val)
+        
+        # Fine-tuning must recover the registered quality, otherwise retrain
+        tolerance = self.config.get('model_registry.score_tolerance', 0.25)
+        if val_score > manifest['val_score'] * (1 + tolerance) + 1e-12:
+            print(f"   ⚠️  Fine-tuned validation MSE {val_score:.6f} still above "
+                  f"registered {manifest['val_score']:.6f}")
+            return None
+        
+        return val_score
+    
+    def _model_inputs(self, model: Any, X: np.ndarray) -> np.ndarray:
+        """Windows re-expressed in the normalization a loaded model was trained with"""
+        if self.normalization is None or model.normalization == self.normalization:
+            return X
+        return self.preprocessor.renormalize(X, self.normalization, model.normalization)
+    
+    def _last_train_date(self) -> Optional[str]:
+        """Target date of the newest training window (YYYY-MM-DD)"""
+        if self.train_target_dates is None or len(self.train_target_dates) == 0:
+            return None
+        return str(np.datetime64(self.train_target_dates.max(), 'D'))
+    
     def _train_random_forest(
         self,
         X_train: np.ndarray,
@@ -469,7 +1044,7 @@ class BloomForecastingWorkflow:
         X_train_2d = X_train.reshape(X_train.shape[0], -1)
         X_val_2d = X_val.reshape(X_val.shape[0], -1)
         
-        config = self.config.get_model_config('random_forest')
+        config = self._model_config('random_forest')[1]
         model = RandomForestBloomModel(config, task='regression')
         model.build_model()
         model.feature_names = feature_names
@@ -484,10 +1059,29 @@ class BloomForecastingWorkflow:
         X_train: np.ndarray,
         y_train: np.ndarray,
         X_val: np.ndarray,
-        y_val: np.ndarray
+        y_val: np.ndarray,
+        feature_names: Optional[List[str]] = None,
+        checkpoint_path: Optional[Path] = None
     ) -> DeepLearningBloomModel:
         """Train deep learning model (LSTM/GRU/CNN-LSTM/3D-CNN-LSTM)"""
         
+        actual_model_type, config = self._deep_learning_config(model_type)
+        
+        if actual_model_type != model_type:
+            print(f"   ℹ️  {model_type.upper()} not fully implemented yet")
+            print(f"   ℹ️  Using {actual_model_type.upper()} as fallback")
+            print(f"   💡 Note: Full implementation coming in future update")
+        
+        model = DeepLearningBloomModel(config, model_type=actual_model_type)
+        model.build_model(input_size=X_train.shape[2])
+        model.feature_names = feature_names
+        
+        model.train(X_train, y_train, X_val, y_val, checkpoint_path=checkpoint_path)
+        
+        return model
+    
+    def _deep_learning_config(self, model_type: str) -> Tuple[str, Dict[str, Any]]:
+        """Implemented model type and training configuration for a deep learning model"""
         # Map advanced models to implemented ones
         model_mapping = {
             'cnn_lstm': 'lstm',        # Fallback to LSTM
@@ -498,28 +1092,19 @@ class BloomForecastingWorkflow:
         
         actual_model_type = model_mapping.get(model_type, model_type)
         
-        if actual_model_type != model_type:
-            print(f"   ℹ️  {model_type.upper()} not fully implemented yet")
-            print(f"   ℹ️  Using {actual_model_type.upper()} as fallback")
-            print(f"   💡 Note: Full implementation coming in future update")
-        
-        # Get config for the actual model type
-        try:
-            config = self.config.get_model_config(actual_model_type)
-        except:
-            # If config not found, use lstm config
-            config = self.config.get_model_config('lstm')
+        # Get config for the actual model type (copy: never mutate the loaded config)
+        config = dict(self.config.get_model_config(actual_model_type) or
+                      self.config.get_model_config('lstm'))
         
         config['batch_size'] = self.config.get('training.batch_size', 32)
         config['epochs'] = self.config.get('training.epochs', 100)
         config['learning_rate'] = self.config.get('training.learning_rate', 0.001)
+        config['early_stopping_patience'] = self.config.get('training.early_stopping_patience', 15)
+        config['inference_batch_size'] = self.config.get('training.inference_batch_size', 8192)
+        config['checkpoint_every'] = self.config.get('training.checkpoint_every', 5)
+        config['materialize_budget_mb'] = self.config.get('training.materialize_budget_mb', 1024)
         
-        model = DeepLearningBloomModel(config, model_type=actual_model_type)
-        model.build_model(input_size=X_train.shape[2])
-        
-        model.train(X_train, y_train, X_val, y_val)
-        
-        return model
+        return actual_model_type, config
     
     def _select_best_model(
         self,
@@ -531,73 +1116,68 @@ class BloomForecastingWorkflow:
         
         return best_model_name, best_model
     
-    def _spatial_prediction(
+    def _build_inference_engine(
         self,
         model: Any,
+        feature_names: List[str],
+        time_series_df: pd.DataFrame
+    ) -> SpatialInferenceEngine:
+        """Wrap the selected model for per-pixel inference"""
+        return SpatialInferenceEngine(
+            model,
+            feature_names,
+            time_series_df,
+            z_score_cols=self.ZSCORE_INDICES,
+            target_col=feature_names[0],
+            sequence_length=self.SEQUENCE_LENGTH,
+            memory_fraction=self.config.get('spatial_prediction.memory_fraction', 0.25),
+            memory_budget_bytes=self._memory_budget_bytes()
+        )
+    
+    def _memory_budget_bytes(self) -> Optional[int]:
+        """runtime.memory_budget_mb in bytes (None → no cap)"""
+        budget_mb = self.config.get('runtime.memory_budget_mb')
+        return int(budget_mb * 1024 ** 2) if budget_mb else None
+    
+    def _spatial_prediction(
+        self,
+        engine: SpatialInferenceEngine,
         aoi_geometry: ee.Geometry,
         aoi_name: str,
         forecast_days: int
-    ) -> pd.DataFrame:
-        """Generate spatial predictions across AOI"""
-        print(f"   Generating spatial predictions...")
-        
-        # For now, create sample prediction grid
-        # In production, this would use actual spatial data
-        bounds = robust_getinfo(aoi_geometry.bounds())
-        coords = bounds['coordinates'][0]
-        
-        lons = np.linspace(coords[0][0], coords[2][0], 50)
-        lats = np.linspace(coords[0][1], coords[2][1], 50)
-        
-        lon_grid, lat_grid = np.meshgrid(lons, lats)
-        
-        # IMPROVED: Use better distribution matching time-series mode
-        # Beta(5, 3) for mean ~62.5% probability
-        current_date = datetime.now()
-        day_of_year = current_date.timetuple().tm_yday
-        
-        # Seasonal factor (peak during bloom season)
-        bloom_season_peak = 95  # April 5th
-        days_from_peak = abs(day_of_year - bloom_season_peak)
-        seasonal_factor = np.exp(-days_from_peak / 60)
-        seasonal_factor = 0.4 + 0.6 * seasonal_factor
-        
-        # Generate predictions
-        base_predictions = np.random.beta(5, 3, lon_grid.shape)
-        predictions = base_predictions * seasonal_factor
-        predictions = np.clip(predictions, 0, 1)
+    ) -> Any:
+        """
+        Generate spatial predictions across AOI and detect today's hotspots
         
-        # Add spatial variation
-        spatial_noise = np.random.normal(0, 0.05, lon_grid.shape)
-        predictions = np.clip(predictions + spatial_noise, 0, 1)
+        Predictions and neighbor graphs are built tile by tile (see
+        _predict_and_detect_tiled); only the probability grid and the hotspots
+        are kept in memory.
         
-        # Create DataFrame
-        pred_df = pd.DataFrame({
-            'lon': lon_grid.flatten(),
-            'lat': lat_grid.flatten(),
-            'bloom_probability': predictions.flatten(),
-            'date': datetime.now().date()
-        })
+        Returns:
+            GeoDataFrame with hotspots over the whole AOI
+        """
+        print(f"   Generating spatial predictions...")
         
-        print(f"   ✅ Generated {len(pred_df)} spatial predictions")
+        today = datetime.now().strftime('%Y-%m-%d')
+        hotspots = self._predict_and_detect_tiled(engine, aoi_geometry, [today])
         
-        return pred_df
+        return hotspots[today]
     
     def _spatial_prediction_time_series(
         self,
-        model: Any,
+        engine: SpatialInferenceEngine,
         aoi_geometry: ee.Geometry,
         aoi_name: str,
         date_start: str,
         date_end: str,
         top_n: int = 50
-    ) -> Dict[str, pd.DataFrame]:
+    ) -> Dict[str, Any]:
         """
-        Generate time-series spatial predictions
+        Generate time-series spatial predictions and hotspots
         ALWAYS generates predictions for date_start to date_end (30 days)
         
         Args:
-            model: Trained model
+            engine: Inference engine wrapping the trained model
             aoi_geometry: AOI geometry
             aoi_name: AOI name
             date_start: Start date (YYYY-MM-DD)
@@ -605,133 +1185,430 @@ class BloomForecastingWorkflow:
             top_n: Number of top hotspots per date
             
         Returns:
-            Dict mapping date_str → DataFrame with predictions
+            Dict of date → GeoDataFrame with top N hotspots
         """
         print(f"   Generating time-series predictions...")
         print(f"   Date range: {date_start} → {date_end}")
         print(f"   Top N per date: {top_n}")
         
         # Parse dates
-        start_dt = datetime.strptime(date_start, '%Y-%m-%d')
-        end_dt = datetime.strptime(date_end, '%Y-%m-%d')
-        date_range = pd.date_range(start_dt, end_dt, freq='D')
+        date_range = pd.date_range(date_start, date_end, freq='D')
+        dates = [d.strftime('%Y-%m-%d') for d in date_range]
         
-        print(f"   Total dates: {len(date_range)}")
+        print(f"   Total dates: {len(dates)}")
         
-        time_series_predictions = {}
+        time_series_hotspots = self._predict_and_detect_tiled(
+            engine, aoi_geometry, dates, top_n
+        )
         
-        # Use tqdm for progress
-        for current_date in tqdm(date_range, desc="   Dates", unit="day"):
-            # Generate predictions for this specific date
-            pred_df = self._predict_for_single_date(
-                model, aoi_geometry, current_date
-            )
+        total_hotspots = sum(len(gdf) for gdf in time_series_hotspots.values())
+        print(f"   ✅ Detected hotspots for {len(time_series_hotspots)} dates")
+        print(f"   ✅ Total hotspots (top {top_n}/day): {total_hotspots}")
+        
+        return time_series_hotspots
+    
+    def _grid_spacing_m(self) -> float:
+        """Prediction grid cell size in meters (defaults to the Sentinel-2 scale)"""
+        spacing = self.config.get('spatial_prediction.grid_spacing_m')
+        if not spacing:
+            spacing = self.config.get('data_sources.sentinel2.scale', 20)
+        return float(spacing)
+    
+    def _get_prediction_grid(
+        self,
+        aoi_geometry: ee.Geometry
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the spatial prediction grid over the AOI bounds
+        
+        Cells are spaced spatial_prediction.grid_spacing_m apart; points sit
+        at cell centres.
+        
+        Args:
+            aoi_geometry: AOI geometry
             
-            # Store in dictionary
-            date_str = current_date.strftime('%Y-%m-%d')
-            time_series_predictions[date_str] = pred_df
+        Returns:
+            (lons, lats) 1D grid axes
+        """
+        # Get bounds (single round trip per AOI)
+        bounds = robust_getinfo(aoi_geometry.bounds())
+        coords = bounds['coordinates'][0]
+        lon_min, lat_min = coords[0][0], coords[0][1]
+        lon_max, lat_max = coords[2][0], coords[2][1]
+        
+        # Meters → degrees at the AOI centre latitude
+        spacing = self._grid_spacing_m()
+        lat_step = spacing / 111320.0
+        lon_step = spacing / (111320.0 * np.cos(np.radians((lat_min + lat_max) / 2)))
         
-        print(f"   ✅ Generated predictions for {len(date_range)} dates")
-        print(f"   ✅ Total prediction points: {sum(len(df) for df in time_series_predictions.values())}")
+        lons = np.arange(lon_min + lon_step / 2, lon_max, lon_step)
+        lats = np.arange(lat_min + lat_step / 2, lat_max, lat_step)
         
-        return time_series_predictions
+        return lons, lats
     
-    def _predict_for_single_date(
+    def _tile_size(self, halo: int) -> int:
+        """
+        Tile side that keeps a padded tile's neighbor pairs within budget
+        
+        Each grid cell has about pi * (reach / spacing)^2 neighbors inside the
+        Gi* / DBSCAN reach, so the padded tile side is bounded by
+        sqrt(max_pairs / neighbors_per_cell); the configured tile_size is an
+        upper limit on top of that.
+        
+        Args:
+            halo: Extra cells read around each tile
+        
+        Returns:
+            Core tile side in grid cells
+        """
+        tile = int(self.config.get('spatial_prediction.tile_size', 256))
+        
+        reach = max(self.hotspot_analyzer.distance_band, self.hotspot_analyzer.dbscan_eps)
+        per_cell = max(np.pi * (reach / self._grid_spacing_m()) ** 2 - 1, 1.0)
+        padded_side = int(np.sqrt(self.hotspot_analyzer.max_cached_pairs / per_cell))
+        budget_tile = padded_side - 2 * halo
+        
+        min_tile = 16
+        if budget_tile < min_tile:
+            print(f"   ⚠️  ~{per_cell:.0f} neighbors per cell at {self._grid_spacing_m():.0f} m spacing: "
+                  f"even a {min_tile}-cell tile exceeds the neighbor pair budget; "
+                  f"consider a coarser spatial_prediction.grid_spacing_m")
+            return min_tile
+        
+        return min(tile, budget_tile)
+    
+    def _iter_grid_tiles(
         self,
-        model: Any,
+        n_lat: int,
+        n_lon: int,
+        halo: int,
+        tile: int
+    ):
+        """
+        Split the grid into square tiles with an overlapping halo
+        
+        Args:
+            n_lat: Grid rows
+            n_lon: Grid columns
+            halo: Extra cells read around each tile
+            tile: Core tile side in grid cells
+            
+        Yields:
+            (padded, core) pairs of (lat_slice, lon_slice); padded indexes the
+            full grid, core indexes the tile's own cells inside padded
+        """
+        for i0 in range(0, n_lat, tile):
+            for j0 in range(0, n_lon, tile):
+                i1, j1 = min(i0 + tile, n_lat), min(j0 + tile, n_lon)
+                pi0, pj0 = max(0, i0 - halo), max(0, j0 - halo)
+                padded = (slice(pi0, min(i1 + halo, n_lat)), slice(pj0, min(j1 + halo, n_lon)))
+                core = (slice(i0 - pi0, i1 - pi0), slice(j0 - pj0, j1 - pj0))
+                yield padded, core
+    
+    def _predict_grid(
+        self,
+        engine: SpatialInferenceEngine,
         aoi_geometry: ee.Geometry,
-        target_date: datetime
-    ) -> pd.DataFrame:
+        dates: List[str]
+    ) -> Tuple[PredictionCube, int, int]:
         """
-        Core prediction logic for a single date
-        Extracted from _spatial_prediction for reusability
+        Predict every cell of the AOI grid, one tile at a time
+        
+        Predictions are per pixel, so tiles are predicted without a halo. The
+        probabilities of the whole grid are kept (one float32 per cell and
+        date) so hotspot analysis can use AOI-wide statistics; only the
+        neighbor graphs are built per tile.
         
         Args:
-            model: Trained model
+            engine: Inference engine wrapping the trained model
             aoi_geometry: AOI geometry
-            target_date: Target date for prediction
+            dates: Target dates (YYYY-MM-DD)
             
         Returns:
-            DataFrame with predictions for this date
+            (PredictionCube over the AOI grid, tile side, analysis halo) with
+            tile side and halo in grid cells
         """
-        # Get bounds
-        bounds = robust_getinfo(aoi_geometry.bounds())
-        coords = bounds['coordinates'][0]
+        lons, lats = self._get_prediction_grid(aoi_geometry)
         
-        # Create spatial grid (50x50 = 2500 points)
-        lons = np.linspace(coords[0][0], coords[2][0], 50)
-        lats = np.linspace(coords[0][1], coords[2][1], 50)
+        reach = max(self.hotspot_analyzer.distance_band, self.hotspot_analyzer.dbscan_eps)
+        halo = int(np.ceil(reach / self._grid_spacing_m()))
+        tile = self._tile_size(halo)
+        tiles = list(self._iter_grid_tiles(len(lats), len(lons), 0, tile))
         
-        lon_grid, lat_grid = np.meshgrid(lons, lats)
+        print(f"   Grid: {len(lats)} x {len(lons)} = {len(lats) * len(lons)} points "
+              f"({self._grid_spacing_m():.0f} m spacing)")
+        print(f"   Tiles: {len(tiles)} of up to {tile} cells per side (halo: {halo} cells)")
+        
+        values = np.full((len(dates), len(lats), len(lons)), np.nan, dtype=np.float32)
+        for (rows, cols), _ in tqdm(tiles, desc="   Predicting tiles"):
+            cube = self._predict_cube(engine, aoi_geometry, lons[cols], lats[rows], dates)
+            values[:, rows, cols] = cube.values
         
-        # IMPROVED: Better mock data distribution for testing
-        # In production, this would use actual Earth Engine data + model predictions
-        # Use Beta(5, 3) for higher probabilities (mean = 5/8 = 62.5%)
-        day_of_year = target_date.timetuple().tm_yday
-        
-        # Seasonal variation: Peak during bloom season (Mar-Apr ~ day 80-110)
-        bloom_season_peak = 95  # April 5th
-        days_from_peak = abs(day_of_year - bloom_season_peak)
-        seasonal_factor = np.exp(-days_from_peak / 60)  # Gaussian-like curve
-        seasonal_factor = 0.4 + 0.6 * seasonal_factor  # Range: 0.4 to 1.0
-        
-        # Generate predictions with better distribution
-        base_predictions = np.random.beta(5, 3, lon_grid.shape)  # Mean ~62.5%
-        predictions = base_predictions * seasonal_factor
-        predictions = np.clip(predictions, 0, 1)  # Ensure [0, 1] range
-        
-        # Add spatial variation (some areas bloom more than others)
-        spatial_noise = np.random.normal(0, 0.05, lon_grid.shape)
-        predictions = np.clip(predictions + spatial_noise, 0, 1)
-        
-        # Create DataFrame
-        pred_df = pd.DataFrame({
-            'lon': lon_grid.flatten(),
-            'lat': lat_grid.flatten(),
-            'bloom_probability': predictions.flatten(),
-            'date': target_date.date()
-        })
-        
-        return pred_df
-    
-    def _detect_hotspots_time_series(
+        return PredictionCube(dates, lats, lons, values), tile, halo
+    
+    def _predict_and_detect_tiled(
         self,
-        time_series_predictions: Dict[str, pd.DataFrame],
-        top_n: int = 50
+        engine: SpatialInferenceEngine,
+        aoi_geometry: ee.Geometry,
+        dates: List[str],
+        top_n: Optional[int] = None
     ) -> Dict[str, Any]:
         """
-        Detect hotspots for each date in time series
-        Filter to top N hotspots per date
+        Predict and detect hotspots tile by tile with bounded neighbor graphs
+        
+        Each tile is analysed with a halo covering the Gi* band and DBSCAN eps,
+        and Gi* takes its mean, variance and permutation pool from every
+        high-probability cell of the AOI, so core-cell z-scores match a
+        whole-AOI run. DBSCAN clusters that continue across tile edges are
+        merged through the halo cells. Results differ from a whole-AOI run
+        only in cluster numbering, in DBSCAN's order-dependent assignment of
+        border points, in permutation sampling noise, and where the neighbor
+        pair budget truncates neighborhoods.
+        
+        With top_n, a running top N per date is kept instead of all hotspots.
+        Tiles are analysed as plain tables; geometry is added at the end.
         
         Args:
-            time_series_predictions: Dict of date → predictions DataFrame
-            top_n: Number of top hotspots to keep per date
+            engine: Inference engine wrapping the trained model
+            aoi_geometry: AOI geometry
+            dates: Target dates (YYYY-MM-DD)
+            top_n: Hotspots to keep per date (None keeps all)
             
         Returns:
-            Dict of date → GeoDataFrame with top N hotspots
+            Dict of date → GeoDataFrame with hotspots
         """
-        print(f"   Detecting hotspots for each date...")
-        print(f"   Filtering to top {top_n} per date")
+        import geopandas as gpd
+        
+        cube, tile, halo = self._predict_grid(engine, aoi_geometry, dates)
+        n_lat, n_lon = len(cube.lats), len(cube.lons)
+        threshold = self.hotspot_analyzer.probability_threshold
+        
+        # AOI-wide Gi* population: flat cell index and value of every
+        # high-probability cell per date
+        hot_cells = {}
+        for date_str in dates:
+            probabilities = cube.probabilities(date_str)
+            hot_idx = np.flatnonzero(probabilities >= threshold)
+            hot_cells[date_str] = (hot_idx, probabilities[hot_idx].astype(np.float64))
+        
+        hotspot_parts = {date_str: [] for date_str in dates}
+        cluster_links = {date_str: [] for date_str in dates}
+        
+        tiles = list(self._iter_grid_tiles(n_lat, n_lon, halo, tile))
+        for tile_idx, (padded, core) in enumerate(tqdm(tiles, desc="   Analysing tiles")):
+            window = PredictionCube(
+                dates, cube.lats[padded[0]], cube.lons[padded[1]],
+                cube.values[:, padded[0], padded[1]]
+            )
+            
+            # Flat AOI cell index of every padded tile point
+            rows, cols = np.arange(n_lat)[padded[0]], np.arange(n_lon)[padded[1]]
+            cell_idx = (rows[:, None] * n_lon + cols[None, :]).ravel()
+            core_mask = np.zeros((len(rows), len(cols)), dtype=bool)
+            core_mask[core] = True
+            core_mask = core_mask.ravel()
+            
+            for date_str in dates:
+                hot_idx, population = hot_cells[date_str]
+                tile_gdf = self.hotspot_analyzer.identify_hotspots(
+                    window.to_frame(date_str),
+                    verbose=False,
+                    geometry=False,
+                    population=population,
+                    population_index=np.searchsorted(hot_idx, cell_idx)
+                )
+                if len(tile_gdf) == 0:
+                    continue
+                
+                # Index is the point position inside the padded tile
+                position = tile_gdf.index.to_numpy()
+                labels = tile_gdf['cluster_id'].to_numpy().astype(np.int64)
+                clustered = labels >= 0
+                labels[clustered] += tile_idx * self.TILE_CLUSTER_STRIDE
+                tile_gdf['cluster_id'] = labels
+                
+                # Halo cells clustered here vs. core samples in their home tile
+                in_core = core_mask[position]
+                halo_hits = clustered & ~in_core
+                home_core = in_core & tile_gdf['is_core_sample'].to_numpy()
+                cluster_links[date_str].append((
+                    cell_idx[position[halo_hits]], labels[halo_hits],
+                    cell_idx[position[home_core]], labels[home_core]
+                ))
+                
+                tile_gdf = tile_gdf[in_core].drop(columns='is_core_sample')
+                if len(tile_gdf) == 0:
+                    continue
+                
+                parts = hotspot_parts[date_str]
+                parts.append(tile_gdf)
+                if top_n is not None:
+                    hotspot_parts[date_str] = [self._top_n_hotspots(parts, top_n)]
+            
+            # Every tile is visited once: free its neighbor distances now
+            self.hotspot_analyzer.clear_neighborhood_cache()
+        
+        # Geometry is only materialized for the hotspots that are kept
+        hotspots = {}
+        for date_str, parts in hotspot_parts.items():
+            if parts:
+                merged = self._top_n_hotspots(parts, top_n).reset_index(drop=True)
+                merged['cluster_id'] = self._merge_tile_clusters(
+                    merged['cluster_id'].to_numpy(), cluster_links[date_str]
+                )
+                hotspots[date_str] = self.hotspot_analyzer.to_geodataframe(merged)
+            else:
+                hotspots[date_str] = gpd.GeoDataFrame()
         
-        time_series_hotspots = {}
+        return hotspots
+    
+    @staticmethod
+    def _merge_tile_clusters(
+        labels: np.ndarray,
+        links: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]
+    ) -> np.ndarray:
+        """
+        Merge per-tile DBSCAN clusters that continue across tile edges
+        
+        A core sample's neighborhood is complete in its home tile, so when a
+        cell that is a core sample at home was clustered in a neighboring
+        tile's halo, the two clusters are one cluster of a whole-AOI run.
         
-        for date_str, pred_df in tqdm(time_series_predictions.items(), desc="   Processing dates"):
-            # Run hotspot detection
-            hotspots_gdf = self.hotspot_analyzer.identify_hotspots(pred_df)
+        Args:
+            labels: Tile-offset cluster ids (-1 for noise)
+            links: Per tile and date (halo cells, their cluster ids, home
+                core-sample cells, their cluster ids)
             
-            # Get top N by bloom probability
-            if len(hotspots_gdf) > top_n:
-                top_hotspots_gdf = hotspots_gdf.nlargest(top_n, 'bloom_probability')
-            else:
-                top_hotspots_gdf = hotspots_gdf
+        Returns:
+            Cluster ids where linked clusters share their smallest id
+        """
+        from scipy import sparse
+        from scipy.sparse.csgraph import connected_components
+        
+        clustered = labels >= 0
+        if not clustered.any() or not links:
+            return labels
+        
+        halo_cells, halo_labels, core_cells, core_labels = (
+            np.concatenate([link[k] for link in links]) for k in range(4)
+        )
+        
+        # Match halo cells to their home tile's core samples
+        order = np.argsort(core_cells)
+        core_cells, core_labels = core_cells[order], core_labels[order]
+        pos = np.minimum(np.searchsorted(core_cells, halo_cells), max(len(core_cells) - 1, 0))
+        matched = core_cells[pos] == halo_cells if len(core_cells) else np.zeros(len(halo_cells), dtype=bool)
+        a, b = halo_labels[matched], core_labels[pos[matched]]
+        
+        ids, inverse = np.unique(np.concatenate([a, b, labels[clustered]]), return_inverse=True)
+        graph = sparse.coo_matrix(
+            (np.ones(len(a)), (inverse[:len(a)], inverse[len(a):2 * len(a)])),
+            shape=(len(ids), len(ids))
+        )
+        n_components, component = connected_components(graph, directed=False)
+        
+        # Smallest tile-offset id of every component
+        root = np.full(n_components, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(root, component, ids)
+        
+        merged = labels.copy()
+        merged[clustered] = root[component[inverse[2 * len(a):]]]
+        return merged
+    
+    @staticmethod
+    def _top_n_hotspots(parts: List[Any], top_n: Optional[int]) -> Any:
+        """Concatenate hotspot tables and keep the top N by bloom probability"""
+        merged = pd.concat(parts) if len(parts) > 1 else parts[0]
+        if top_n is not None and len(merged) > top_n:
+            merged = merged.nlargest(top_n, 'bloom_probability')
+        return merged
+    
+    def _predict_cube(
+        self,
+        engine: SpatialInferenceEngine,
+        aoi_geometry: ee.Geometry,
+        lons: np.ndarray,
+        lats: np.ndarray,
+        dates: List[str]
+    ) -> PredictionCube:
+        """
+        Model-driven prediction for every grid pixel and date
+        
+        Per-pixel index series for the observation window before the first
+        forecast date are sampled from Earth Engine in one batched extraction,
+        assembled into (n_pixels, seq_len, n_features) sequences and pushed
+        through the trained model.
+        
+        Args:
+            engine: Inference engine wrapping the trained model
+            aoi_geometry: AOI geometry
+            lons: Grid longitudes
+            lats: Grid latitudes
+            dates: Target dates (YYYY-MM-DD)
             
-            time_series_hotspots[date_str] = top_hotspots_gdf
+        Returns:
+            PredictionCube of shape (dates, lat, lon); NaN where no pixel data
+        """
+        lon_grid, lat_grid = np.meshgrid(lons, lats)
+        point_lons = lon_grid.ravel()
+        point_lats = lat_grid.ravel()
         
-        total_hotspots = sum(len(gdf) for gdf in time_series_hotspots.values())
-        print(f"   ✅ Detected hotspots for {len(time_series_hotspots)} dates")
-        print(f"   ✅ Total hotspots (top {top_n}/day): {total_hotspots}")
+        # Observation window ends at the first forecast date (never in the future)
+        window_end = min(pd.Timestamp(dates[0]), pd.Timestamp(datetime.now().date()))
+        history_days = self.config.get('spatial_prediction.history_days', 240)
+        window_start = window_end - timedelta(days=history_days)
         
-        return time_series_hotspots
+        print(f"   Sampling {len(point_lons)} pixels: "
+              f"{window_start.date()} → {window_end.date()}")
+        
+        collection = self.data_collector.get_sentinel2_collection(
+            aoi_geometry,
+            window_start.strftime('%Y-%m-%d'),
+            (window_end + timedelta(days=1)).strftime('%Y-%m-%d')
+        )
+        pixel_df = self.data_collector.extract_pixel_time_series(
+            collection,
+            point_lons,
+            point_lats,
+            self.SPECTRAL_BANDS,
+            max_points_per_request=self.config.get('spatial_prediction.max_points_per_request', 5000)
+        )
+        
+        sequences = engine.build_sequences(pixel_df, len(point_lons))
+        print(f"   Pixel observations: {len(pixel_df)} "
+              f"({int(sequences['has_data'].sum())}/{len(point_lons)} pixels with data)")
+        
+        probabilities = engine.predict_dates(
+            sequences, dates, window_end.strftime('%Y-%m-%d')
+        )
+        
+        return PredictionCube(
+            dates, lats, lons,
+            probabilities.reshape(len(dates), len(lats), len(lons))
+        )
+    
+    def _predict_for_single_date(
+        self,
+        engine: SpatialInferenceEngine,
+        aoi_geometry: ee.Geometry,
+        target_date: datetime
+    ) -> pd.DataFrame:
+        """
+        Prediction for a single date (kept for callers outside the batched path)
+        
+        Args:
+            engine: Inference engine wrapping the trained model
+            aoi_geometry: AOI geometry
+            target_date: Target date for prediction
+            
+        Returns:
+            DataFrame with predictions for this date
+        """
+        date_str = target_date.strftime('%Y-%m-%d')
+        cube, _, _ = self._predict_grid(engine, aoi_geometry, [date_str])
+        if cube.n_points == 0:
+            return pd.DataFrame()
+        return cube.to_frame(date_str)
     
     def _create_visualizations(
         self,
@@ -813,14 +1690,27 @@ class BloomForecastingWorkflow:
         
         return paths
     
+    def _geojson_options(self) -> Dict[str, Any]:
+        """GeoJSON writer options from output.geojson"""
+        return {
+            'precision': self.config.get('output.geojson.precision', 6),
+            'compression': self.config.get('output.geojson.compression'),
+            'drop_coordinate_properties': self.config.get('output.geojson.drop_coordinate_properties', True),
+            'indent': self.config.get('output.geojson.indent')
+        }
+    
     def _export_time_series_results(
         self,
         aoi_name: str,
         results: Dict[str, Any]
     ) -> Dict[str, Path]:
         """
-        Export time-series results as individual GeoJSON files per date
-        Format: {AOI}_hotspots_{YYYY-MM-DD}.geojson
+        Export time-series results straight from the in-memory hotspots
+        
+        'merged' writes {AOI}_hotspots_timeseries.geojson sorted by date with a
+        date_index / date_summary (and links it into web/), 'daily' writes
+        {AOI}_hotspots_{YYYY-MM-DD}.geojson per date, 'both' writes both.
+        Date-indexed tiles for the map go to web/tiles/{AOI}.
         
         Args:
             aoi_name: AOI name
@@ -832,52 +1722,89 @@ class BloomForecastingWorkflow:
         export_dir = self.config.hotspots_dir / aoi_name
         export_dir.mkdir(parents=True, exist_ok=True)
         
+        export_mode = results.get('export_mode', 'merged')
+        geojson_options = self._geojson_options()
+        
         paths = {}
         daily_files = []
         
-        print(f"   Exporting time-series results...")
-        print(f"   Creating individual GeoJSON files per date...")
+        print(f"   Exporting time-series results ({export_mode})...")
         
         all_dates = sorted(results['time_series_hotspots'].keys())
+        frames = [
+            results['time_series_hotspots'][date_str] for date_str in all_dates
+            if len(results['time_series_hotspots'][date_str]) > 0
+        ]
         
-        # Export each date as separate GeoJSON file
-        for date_str in tqdm(all_dates, desc="   Exporting daily files"):
-            hotspots_gdf = results['time_series_hotspots'][date_str]
+        if export_mode in ('daily', 'both'):
+            print(f"   Creating individual GeoJSON files per date...")
             
-            import geopandas as gpd
-            if isinstance(hotspots_gdf, gpd.GeoDataFrame) and len(hotspots_gdf) > 0:
-                # Convert date column to string
-                hotspots_gdf_copy = hotspots_gdf.copy()
-                if 'date' in hotspots_gdf_copy.columns:
-                    hotspots_gdf_copy['date'] = hotspots_gdf_copy['date'].astype(str)
-                
-                # Create standard GeoJSON structure
-                geojson_data = json.loads(hotspots_gdf_copy.to_json())
-                
-                # Format as standard FeatureCollection with CRS
-                output = {
-                    "type": "FeatureCollection",
-                    "name": f"{aoi_name}_hotspots_{date_str}",
-                    "crs": {
-                        "type": "name",
-                        "properties": {
-                            "name": "urn:ogc:def:crs:OGC:1.3:CRS84"
-                        }
-                    },
-                    "features": geojson_data['features']
-                }
+            # Export each date as separate GeoJSON file
+            for date_str in tqdm(all_dates, desc="   Exporting daily files"):
+                hotspots_gdf = results['time_series_hotspots'][date_str]
                 
-                # Save individual date file
-                date_filename = f"{aoi_name}_hotspots_{date_str}.geojson"
-                date_path = export_dir / date_filename
-                with open(date_path, 'w', encoding='utf-8') as f:
-                    json.dump(output, f, indent=2, ensure_ascii=False)
-                
-                daily_files.append(date_path)
-                
-                print(f"      ✅ {date_filename} ({len(geojson_data['features'])} hotspots)")
+                if len(hotspots_gdf) > 0:
+                    # Save individual date file (streamed from columns, compact)
+                    date_path = write_feature_collection(
+                        export_dir / f"{aoi_name}_hotspots_{date_str}.geojson",
+                        hotspots_gdf,
+                        name=f"{aoi_name}_hotspots_{date_str}",
+                        **geojson_options
+                    )
+                    
+                    daily_files.append(date_path)
+                    
+                    print(f"      ✅ {date_path.name} ({len(hotspots_gdf)} hotspots)")
+            
+            paths['daily_geojson_files'] = daily_files
+        
+        if export_mode in ('merged', 'both'):
+            # One streaming pass over the dates, no intermediate files
+            with GeoJSONFeatureWriter(
+                export_dir / f"{aoi_name}_hotspots_timeseries.geojson",
+                name=f"{aoi_name}_hotspots_timeseries",
+                precision=geojson_options['precision'],
+                compression=geojson_options['compression'],
+                drop_coordinate_properties=geojson_options['drop_coordinate_properties'],
+                index_dates=True
+            ) as writer:
+                for date_str in all_dates:
+                    writer.write_frame(results['time_series_hotspots'][date_str])
+            
+            paths['merged_geojson'] = writer.path
+            paths['merged_geojson_web'] = link_or_copy(
+                writer.path, self._web_dir() / writer.path.name
+            )
+            
+            print(f"   ✅ Merged: {writer.path.name} ({writer.n_features} hotspots)")
+            print(f"   🌐 Frontend: {paths['merged_geojson_web']}")
+        
+        if self.config.get('output.web_tiles.enabled', True):
+            # Per-date, per-zoom tiles so the map fetches only what it shows
+            paths['web_tiles_index'] = write_web_tiles(
+                pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(),
+                self._web_dir() / 'tiles' / aoi_name,
+                name=aoi_name,
+                zooms=self.config.get('output.web_tiles.zooms', [8, 10, 12]),
+                precision=geojson_options['precision']
+            )
+            print(f"   🗺️  Web tiles: {paths['web_tiles_index'].parent}")
         
-        paths['daily_geojson_files'] = daily_files
+        # Columnar copies (all dates in one file, sorted by date) for analytics
+        for fmt in self.config.get('output.timeseries_formats', ['geojson']):
+            if fmt == 'geojson':
+                continue
+            
+            if not frames:
+                break
+            
+            columnar_path = export_dir / (
+                f"{aoi_name}_hotspots_timeseries{self.hotspot_analyzer.EXPORT_SUFFIX[fmt]}"
+            )
+            self.hotspot_analyzer.export_hotspots(
+                pd.concat(frames, ignore_index=True), str(columnar_path), format=fmt
+            )
+            paths[f'timeseries_{fmt}'] = columnar_path
         
         # Create summary metadata file
         summary_data = {
@@ -890,6 +1817,11 @@ class BloomForecastingWorkflow:
             },
             'top_n_per_date': results.get('top_n', 50),
             'model_used': results.get('best_model', 'unknown'),
+            'export_mode': export_mode,
+            'merged_file': paths['merged_geojson'].name if 'merged_geojson' in paths else None,
+            'columnar_files': [
+                p.name for key, p in paths.items() if key.startswith('timeseries_')
+            ],
             'total_files': len(daily_files),
             'files': [f.name for f in daily_files]
         }
@@ -899,11 +1831,58 @@ class BloomForecastingWorkflow:
             json.dump(summary_data, f, indent=2, ensure_ascii=False)
         paths['metadata'] = metadata_path
         
-        print(f"\n   ✅ Exported {len(daily_files)} daily GeoJSON files")
+        if daily_files:
+            print(f"\n   ✅ Exported {len(daily_files)} daily GeoJSON files")
         print(f"   ✅ Metadata: {metadata_path.name}")
         print(f"   ✅ All exports completed: {export_dir}")
         
         return paths
+    
+    def _web_dir(self) -> Path:
+        """Frontend data directory (output.web_dir, relative to the project root)"""
+        return self.config.project_root / self.config.get('output.web_dir', 'web')
+
+
+# Per-process workflow for run_all_aois workers (built once per worker)
+_worker_workflow = None
+
+
+def _init_aoi_worker(config_path: Optional[str], torch_threads: int) -> None:
+    """Initialize a run_all_aois worker process"""
+    global _worker_workflow
+    
+    import torch
+    torch.set_num_threads(torch_threads)
+    
+    _worker_workflow = BloomForecastingWorkflow(config_path)
+
+
+def _run_aoi_worker(
+    aoi_name: str,
+    pipeline_kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run one AOI inside a worker; failures are reported, never raised"""
+    start_time = time.time()
+    report = {'aoi_name': aoi_name, 'pid': os.getpid()}
+    
+    try:
+        results = _worker_workflow.run_time_series_pipeline(
+            aoi_name=aoi_name, **pipeline_kwargs
+        )
+        report['best_model'] = results.get('best_model')
+        
+        merged = results.get('export_paths', {}).get('merged_geojson_web')
+        if merged is not None:
+            report['merged_geojson'] = str(merged)
+        
+        report['status'] = 'success'
+    except Exception as e:
+        report['status'] = 'failed'
+        report['error'] = str(e)
+        report['traceback'] = traceback.format_exc()
+    
+    report['duration_s'] = time.time() - start_time
+    return report
 
 
 # CLI entry point
@@ -912,7 +1891,13 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Bloom Forecasting Workflow')
-    parser.add_argument('--aoi', type=str, required=True, help='AOI name from config')
+    parser.add_argument('--aoi', type=str, default=None, help='AOI name from config')
+    parser.add_argument('--all-aois', action='store_true',
+                      help='Run all AOIs (or those given by --aois) in parallel worker processes')
+    parser.add_argument('--aois', nargs='+', default=None,
+                      help='AOI names for --all-aois (default: every AOI in config)')
+    parser.add_argument('--workers', type=int, default=None,
+                      help='Worker processes for --all-aois (default: orchestration.max_workers)')
     parser.add_argument('--date', type=str, default=None,
                       help='[DEPRECATED] Target date for prediction (YYYY-MM-DD). Use --date-start/--date-end for time-series')
     parser.add_argument('--date-start', type=str, default=None,
@@ -927,6 +1912,16 @@ def main():
                       help='Years of training data')
     parser.add_argument('--forecast-days', type=int, default=30,
                       help='Days to forecast (fixed at 30 for time-series mode)')
+    parser.add_argument('--export-mode', choices=['merged', 'daily', 'both'], default=None,
+                      help='Time-series export: merged timeseries file, daily files, or both (default: output.timeseries_export)')
+    model_policy = parser.add_mutually_exclusive_group()
+    model_policy.add_argument('--reuse-models', dest='model_policy', action='store_const', const='reuse',
+                      help='Reuse registered models for the AOI/feature set whenever they exist')
+    model_policy.add_argument('--retrain-if-stale', dest='model_policy', action='store_const',
+                      const='retrain_if_stale',
+                      help='Reuse registered models unless past model_registry.max_age_days or the data drifted')
+    model_policy.add_argument('--retrain', dest='model_policy', action='store_const', const='retrain',
+                      help='Always train new models (default: model_registry.policy)')
     parser.add_argument('--threshold', type=float, default=0.5,
                       help='Bloom probability threshold for hotspots (0-1)')
     parser.add_argument('--config', type=str, default=None,
@@ -934,6 +1929,12 @@ def main():
     
     args = parser.parse_args()
     
+    if args.all_aois:
+        if args.date_start is None:
+            parser.error('--all-aois requires --date-start')
+    elif args.aoi is None:
+        parser.error('--aoi is required (or use --all-aois)')
+    
     # Determine mode: time-series or single-date (backward compatible)
     time_series_mode = args.date_start is not None
     
@@ -953,7 +1954,22 @@ def main():
     # Run workflow
     workflow = BloomForecastingWorkflow(args.config)
     
-    if time_series_mode:
+    if args.all_aois:
+        # Multi-AOI mode: one process pool for every AOI
+        report = workflow.run_all_aois(
+            date_start=args.date_start,
+            aoi_names=args.aois,
+            date_end=args.date_end,
+            model_types=args.models,
+            train_years=args.train_years,
+            top_n=args.top_n,
+            max_workers=args.workers,
+            export_mode=args.export_mode,
+            model_policy=args.model_policy
+        )
+        if report['failed']:
+            sys.exit(1)
+    elif time_series_mode:
         # NEW: Time-series mode
         results = workflow.run_time_series_pipeline(
             aoi_name=args.aoi,
@@ -961,7 +1977,9 @@ def main():
             date_end=args.date_end,
             model_types=args.models,
             train_years=args.train_years,
-            top_n=args.top_n
+            top_n=args.top_n,
+            export_mode=args.export_mode,
+            model_policy=args.model_policy
         )
     else:
         # ORIGINAL: Single-date mode (backward compatible)
@@ -969,7 +1987,8 @@ def main():
             aoi_name=args.aoi,
             model_types=args.models,
             train_years=args.train_years,
-            forecast_days=args.forecast_days
+            forecast_days=args.forecast_days,
+            model_policy=args.model_policy
         )
     
     print(f"\n✅ Workflow completed! Check outputs in the 'outputs' directory.")
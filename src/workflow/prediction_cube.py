@@ -0,0 +1,98 @@
+"""
+Gridded multi-date prediction container for time-series spatial prediction
+"""
+import numpy as np
+import pandas as pd
+from collections.abc import Mapping
+from typing import Iterator, Sequence
+
+
+class PredictionCube(Mapping):
+    """
+    Bloom probabilities for all forecast dates as one (dates, lat, lon) array
+
+    Acts as a read-only mapping date_str → DataFrame so existing consumers of
+    the per-date dict keep working; long-form tables are only built when a
+    date is actually accessed.
+    """
+
+    def __init__(
+        self,
+        dates: Sequence[str],
+        lats: np.ndarray,
+        lons: np.ndarray,
+        values: np.ndarray
+    ):
+        """
+        Initialize cube
+
+        Args:
+            dates: Forecast dates (YYYY-MM-DD), one per leading axis entry
+            lats: Grid latitudes (n_lat,)
+            lons: Grid longitudes (n_lon,)
+            values: Bloom probabilities (n_dates, n_lat, n_lon)
+        """
+        self.dates = list(dates)
+        self.lats = np.asarray(lats)
+        self.lons = np.asarray(lons)
+        self.values = np.asarray(values)
+
+        expected = (len(self.dates), len(self.lats), len(self.lons))
+        if self.values.shape != expected:
+            raise ValueError(f"Cube shape {self.values.shape} does not match {expected}")
+
+        self._index = {date_str: i for i, date_str in enumerate(self.dates)}
+
+        # Flattened point coordinates (lat-major, same order as a meshgrid
+        # flatten) shared by every per-date table
+        self.point_lons = np.tile(self.lons, len(self.lats))
+        self.point_lats = np.repeat(self.lats, len(self.lons))
+
+    @property
+    def n_points(self) -> int:
+        """Grid points per date"""
+        return len(self.lats) * len(self.lons)
+
+    def __getitem__(self, date_str: str) -> pd.DataFrame:
+        return self.to_frame(date_str)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.dates)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def probabilities(self, date_str: str) -> np.ndarray:
+        """Flat probability vector for one date (view, no copy)"""
+        return self.values[self._index[date_str]].reshape(-1)
+
+    def to_frame(self, date_str: str) -> pd.DataFrame:
+        """
+        Long-form table for one date
+
+        Args:
+            date_str: Forecast date (YYYY-MM-DD)
+
+        Returns:
+            DataFrame with lon, lat, bloom_probability, date
+        """
+        return pd.DataFrame({
+            'lon': self.point_lons,
+            'lat': self.point_lats,
+            'bloom_probability': self.probabilities(date_str),
+            'date': pd.Timestamp(date_str).date()
+        })
+
+    def to_long(self) -> pd.DataFrame:
+        """Long-form table for all dates"""
+        n_dates = len(self.dates)
+        return pd.DataFrame({
+            'lon': np.tile(self.point_lons, n_dates),
+            'lat': np.tile(self.point_lats, n_dates),
+            'bloom_probability': self.values.reshape(-1),
+            'date': np.repeat([pd.Timestamp(d).date() for d in self.dates], self.n_points)
+        })
+
+    def __repr__(self) -> str:
+        return (f"PredictionCube(dates={len(self.dates)}, "
+                f"grid={len(self.lats)}x{len(self.lons)})")
@@ -11,6 +11,12 @@ let selectedFeature = null;
 let currentSpecies = 'Ha_Giang_TamGiacMach'; // Default species
 let currentHotspotIndex = -1; // Current selected hotspot index
 let nearbyFeatures = []; // Features sorted by distance from selected
+let currentFeatures = []; // Features loaded for the current date
+let dateSummary = {}; // date → {count, mean, max}
+let tileIndex = null; // Pre-tiled data index (tiles/{species}/index.json); null → single GeoJSON file
+let tileCache = new Map(); // Tile URL → Promise of its features
+let tileLayers = new Map(); // Tile URL → markers currently on the map
+let tileRefreshId = 0; // Latest tile refresh (older async refreshes are dropped)
 
 // Species configuration
 const speciesConfig = {
@@ -81,6 +87,11 @@ function initializeMap() {
     // Add scale control
     L.control.scale().addTo(map);
     
+    // Tiled data: load the tiles of the current date that came into view
+    map.on('moveend', () => {
+        if (tileIndex) refreshVisibleTiles();
+    });
+    
     // Control circle visibility based on zoom level
     map.on('zoomend', () => {
         const currentZoom = map.getZoom();
@@ -104,21 +115,35 @@ async function loadGeoJSONData() {
     loadingOverlay.classList.remove('hidden');
     
     try {
-        // Construct filename based on current species
-        const filename = `${currentSpecies}_hotspots_timeseries.geojson`;
-        
-        // Load GeoJSON from local file
-        const response = await fetch(filename);
-        
-        if (!response.ok) {
-            throw new Error(`Failed to load ${filename}`);
+        // Prefer pre-tiled data (only the visible date and tiles are fetched)
+        tileIndex = await loadTileIndex();
+        tileCache.clear();
+        
+        if (tileIndex) {
+            allData = null;
+            allDates = tileIndex.dates;
+            dateSummary = tileIndex.summary;
+            console.log(`✅ Loaded tile index for ${currentSpecies}:`, tileIndex);
+        } else {
+            // Construct filename based on current species
+            const filename = `${currentSpecies}_hotspots_timeseries.geojson`;
+            
+            // Load GeoJSON from local file
+            const response = await fetch(filename);
+            
+            if (!response.ok) {
+                throw new Error(`Failed to load ${filename}`);
+            }
+            
+            allData = await response.json();
+            dateSummary = allData.date_summary || {};
+            console.log(`✅ Loaded GeoJSON for ${currentSpecies}:`, allData);
+            
+            // Extract unique dates and sort
+            allDates = allData.date_index
+                ? Object.keys(allData.date_index).sort()
+                : [...new Set(allData.features.map(f => f.properties.date))].sort();
         }
-        
-        allData = await response.json();
-        console.log(`✅ Loaded GeoJSON for ${currentSpecies}:`, allData);
-        
-        // Extract unique dates and sort
-        allDates = [...new Set(allData.features.map(f => f.properties.date))].sort();
         console.log('📅 Available dates:', allDates);
         
         // Set initial date range (first day and last day or first + 29 days)
@@ -182,8 +207,7 @@ function setupEventListeners() {
         console.log(`🌸 Switching to species: ${currentSpecies}`);
         
         // Clear current data
-        markers.forEach(marker => map.removeLayer(marker));
-        markers = [];
+        clearMarkers();
         
         // Reload data for new species
         await loadGeoJSONData();
@@ -309,117 +333,22 @@ function updateDateRangeSlider() {
 }
 
 function updateMap() {
-    if (!allData || !currentDate) return;
+    if (!hasData() || !currentDate) return;
+    
+    if (tileIndex) {
+        updateTiledMap();
+        return;
+    }
     
     // Clear existing markers
-    markers.forEach(marker => map.removeLayer(marker));
-    markers = [];
+    clearMarkers();
     
-    // Filter features for CURRENT DATE ONLY (from slider)
-    const features = allData.features.filter(f => {
-        return f.properties.date === currentDate;
-    });
+    // Features for CURRENT DATE ONLY (from slider)
+    currentFeatures = featuresForDate(currentDate);
     
     // Add markers
-    features.forEach(feature => {
-        const props = feature.properties;
-        const coords = feature.geometry.coordinates;
-        
-        // Determine color based on probability
-        const color = getColorByProbability(props.bloom_probability);
-        
-        // Get species icon
-        const speciesIcon = speciesConfig[currentSpecies].icon;
-        
-        // Create circle marker representing ~1km radius area
-        const radiusInMeters = 1000; // 1km radius
-        const currentZoom = map.getZoom();
-        const minZoomForCircles = 13; // Show circles only when zoomed in
-        
-        const circleMarker = L.circle([coords[1], coords[0]], {
-            radius: radiusInMeters,
-            fillColor: color,
-            fillOpacity: currentZoom >= minZoomForCircles ? 0.4 : 0,
-            color: color,
-            weight: 3,
-            opacity: currentZoom >= minZoomForCircles ? 0.8 : 0,
-            className: 'area-circle-marker'
-        });
-        
-        // Add tooltip for circle
-        circleMarker.bindTooltip('You can see flowers blooming in this proximity', {
-            permanent: false,
-            direction: 'top',
-            className: 'circle-tooltip',
-            opacity: 0.9
-        });
-        
-        // Add center icon marker for visual reference
-        const centerIconHtml = `
-            <div style="
-                width: 36px;
-                height: 36px;
-                background: ${color};
-                border: 3px solid white;
-                border-radius: 50%;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                font-size: 18px;
-                box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-                cursor: pointer;
-                transition: all 0.3s ease;
-            " class="custom-marker">${speciesIcon}</div>
-        `;
-        
-        const centerIcon = L.divIcon({
-            html: centerIconHtml,
-            className: 'custom-marker-wrapper',
-            iconSize: [36, 36],
-            iconAnchor: [18, 18],
-            popupAnchor: [0, -18]
-        });
-        
-        const marker = L.marker([coords[1], coords[0]], {
-            icon: centerIcon,
-            zIndexOffset: 1000
-        });
-        
-        // Add popup
-        const popupContent = createPopupContent(props);
-        marker.bindPopup(popupContent);
-        
-        // Add click event to show details and update chatbot
-        marker.on('click', () => {
-            showFeatureDetails(feature);
-            
-            // Zoom in to the marker with smooth animation
-            map.flyTo([coords[1], coords[0]], 15, {
-                duration: 1.0,
-                easeLinearity: 0.25
-            });
-            
-            // Update chatbot location context
-            if (typeof window.updateChatbotLocation === 'function') {
-                window.updateChatbotLocation(feature);
-            }
-        });
-        
-        // Also add click handler to circle
-        circleMarker.on('click', () => {
-            showFeatureDetails(feature);
-            
-            // Zoom in to the marker with smooth animation
-            map.flyTo([coords[1], coords[0]], 15, {
-                duration: 1.0,
-                easeLinearity: 0.25
-            });
-            
-            // Update chatbot location context
-            if (typeof window.updateChatbotLocation === 'function') {
-                window.updateChatbotLocation(feature);
-            }
-        });
+    currentFeatures.forEach(feature => {
+        const [marker, circleMarker] = createFeatureMarkers(feature);
         
         // Add both circle and center marker to map
         circleMarker.addTo(map);
@@ -459,8 +388,249 @@ function updateMap() {
     }
 }
 
+function createFeatureMarkers(feature) {
+    const props = feature.properties;
+    const coords = feature.geometry.coordinates;
+    
+    // Determine color based on probability
+    const color = getColorByProbability(props.bloom_probability);
+    
+    // Get species icon
+    const speciesIcon = speciesConfig[currentSpecies].icon;
+    
+    // Create circle marker representing ~1km radius area
+    const radiusInMeters = 1000; // 1km radius
+    const currentZoom = map.getZoom();
+    const minZoomForCircles = 13; // Show circles only when zoomed in
+    
+    const circleMarker = L.circle([coords[1], coords[0]], {
+        radius: radiusInMeters,
+        fillColor: color,
+        fillOpacity: currentZoom >= minZoomForCircles ? 0.4 : 0,
+        color: color,
+        weight: 3,
+        opacity: currentZoom >= minZoomForCircles ? 0.8 : 0,
+        className: 'area-circle-marker'
+    });
+    
+    // Add tooltip for circle
+    circleMarker.bindTooltip('You can see flowers blooming in this proximity', {
+        permanent: false,
+        direction: 'top',
+        className: 'circle-tooltip',
+        opacity: 0.9
+    });
+    
+    // Add center icon marker for visual reference
+    const centerIconHtml = `
+        <div style="
+            width: 36px;
+            height: 36px;
+            background: ${color};
+            border: 3px solid white;
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 18px;
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
+            cursor: pointer;
+            transition: all 0.3s ease;
+        " class="custom-marker">${speciesIcon}</div>
+    `;
+    
+    const centerIcon = L.divIcon({
+        html: centerIconHtml,
+        className: 'custom-marker-wrapper',
+        iconSize: [36, 36],
+        iconAnchor: [18, 18],
+        popupAnchor: [0, -18]
+    });
+    
+    const marker = L.marker([coords[1], coords[0]], {
+        icon: centerIcon,
+        zIndexOffset: 1000
+    });
+    
+    // Add popup
+    const popupContent = createPopupContent(props);
+    marker.bindPopup(popupContent);
+    
+    // Add click event to show details and update chatbot
+    marker.on('click', () => {
+        showFeatureDetails(feature);
+        
+        // Zoom in to the marker with smooth animation
+        map.flyTo([coords[1], coords[0]], 15, {
+            duration: 1.0,
+            easeLinearity: 0.25
+        });
+        
+        // Update chatbot location context
+        if (typeof window.updateChatbotLocation === 'function') {
+            window.updateChatbotLocation(feature);
+        }
+    });
+    
+    // Also add click handler to circle
+    circleMarker.on('click', () => {
+        showFeatureDetails(feature);
+        
+        // Zoom in to the marker with smooth animation
+        map.flyTo([coords[1], coords[0]], 15, {
+            duration: 1.0,
+            easeLinearity: 0.25
+        });
+        
+        // Update chatbot location context
+        if (typeof window.updateChatbotLocation === 'function') {
+            window.updateChatbotLocation(feature);
+        }
+    });
+    
+    return [marker, circleMarker];
+}
+
+function featuresForDate(date) {
+    // date_index: the date's features are one contiguous slice
+    if (allData.date_index) {
+        const slice = allData.date_index[date];
+        return slice ? allData.features.slice(slice[0], slice[0] + slice[1]) : [];
+    }
+    
+    return allData.features.filter(f => f.properties.date === date);
+}
+
+function clearMarkers() {
+    markers.forEach(marker => map.removeLayer(marker));
+    markers = [];
+    tileLayers.clear();
+    tileRefreshId++; // Pending tile loads must not add markers back
+}
+
+// ===== TILED DATA =====
+async function loadTileIndex() {
+    try {
+        const response = await fetch(`tiles/${currentSpecies}/index.json`);
+        return response.ok ? await response.json() : null;
+    } catch (error) {
+        return null;
+    }
+}
+
+function tileUrl(date, zoom, key) {
+    return `tiles/${currentSpecies}/${date}/${zoom}/${key}.json`;
+}
+
+function fetchTile(url) {
+    if (!tileCache.has(url)) {
+        tileCache.set(url, fetch(url)
+            .then(response => response.ok ? response.json() : { features: [] })
+            .then(data => data.features));
+    }
+    return tileCache.get(url);
+}
+
+function tileZoom() {
+    // Deepest pre-tiled zoom not deeper than the map
+    const zoom = map.getZoom();
+    const levels = tileIndex.zooms.filter(z => z <= zoom);
+    return levels.length > 0 ? Math.max(...levels) : Math.min(...tileIndex.zooms);
+}
+
+function lonToTileX(lon, zoom) {
+    return Math.floor((lon + 180) / 360 * Math.pow(2, zoom));
+}
+
+function latToTileY(lat, zoom) {
+    const latRad = Math.max(-85.0511, Math.min(85.0511, lat)) * Math.PI / 180;
+    return Math.floor((1 - Math.asinh(Math.tan(latRad)) / Math.PI) / 2 * Math.pow(2, zoom));
+}
+
+function visibleTileUrls(date, zoom) {
+    const keys = (tileIndex.tiles[date] || {})[zoom] || [];
+    const bounds = map.getBounds();
+    const xMin = lonToTileX(bounds.getWest(), zoom);
+    const xMax = lonToTileX(bounds.getEast(), zoom);
+    const yMin = latToTileY(bounds.getNorth(), zoom);
+    const yMax = latToTileY(bounds.getSouth(), zoom);
+    
+    return keys
+        .filter(key => {
+            const [x, y] = key.split('/').map(Number);
+            return x >= xMin && x <= xMax && y >= yMin && y <= yMax;
+        })
+        .map(key => tileUrl(date, zoom, key));
+}
+
+function loadDateFeatures(date) {
+    // Every zoom level holds all points of a date; the coarsest has fewest files
+    const zoom = Math.min(...tileIndex.zooms);
+    const keys = (tileIndex.tiles[date] || {})[zoom] || [];
+    return Promise.all(keys.map(key => fetchTile(tileUrl(date, zoom, key))))
+        .then(tiles => tiles.flat());
+}
+
+function updateTiledMap() {
+    const bounds = tileIndex.bounds[currentDate];
+    
+    // Drop the previous date's markers right away; moveend loads the new view
+    refreshVisibleTiles();
+    
+    if (bounds) {
+        map.flyToBounds([[bounds[1], bounds[0]], [bounds[3], bounds[2]]], {
+            duration: 1.2,
+            easeLinearity: 0.25,
+            padding: [50, 50]
+        });
+    }
+}
+
+async function refreshVisibleTiles() {
+    if (!tileIndex || !currentDate) return;
+    
+    const refreshId = ++tileRefreshId;
+    const date = currentDate;
+    const urls = visibleTileUrls(date, tileZoom());
+    const needed = new Set(urls);
+    
+    // Remove tiles of other dates, zoom levels or out of view; keep the rest
+    for (const [url, layers] of tileLayers) {
+        if (!needed.has(url)) {
+            layers.forEach(layer => map.removeLayer(layer));
+            tileLayers.delete(url);
+        }
+    }
+    markers = [...tileLayers.values()].flat();
+    
+    const tiles = await Promise.all(urls.map(fetchTile));
+    if (refreshId !== tileRefreshId) return; // A newer refresh took over
+    
+    urls.forEach((url, i) => {
+        if (tileLayers.has(url)) return;
+        const layers = tiles[i].flatMap(feature => createFeatureMarkers(feature));
+        layers.forEach(layer => layer.addTo(map));
+        tileLayers.set(url, layers);
+    });
+    
+    markers = [...tileLayers.values()].flat();
+    currentFeatures = tiles.flat();
+}
+
+function hasData() {
+    return tileIndex !== null || allData !== null;
+}
+
 function updateStatistics() {
-    if (!allData || !currentDate) return;
+    if (!hasData() || !currentDate) return;
+    
+    // Precomputed per-date summary: no feature scans
+    if (tileIndex || allData.date_summary) {
+        const summary = dateSummary[currentDate] || { count: 0, mean: 0, max: 0 };
+        const totalInRange = dateRangeList.reduce((sum, d) => sum + ((dateSummary[d] || {}).count || 0), 0);
+        setStatistics(totalInRange, summary.count, summary.mean, summary.max);
+        return;
+    }
     
     // Get all features in date range (for total count)
     const allFeaturesInRange = allData.features.filter(f => {
@@ -469,9 +639,7 @@ function updateStatistics() {
     });
     
     // Get features for current date only (for display)
-    const currentDateFeatures = allData.features.filter(f => {
-        return f.properties.date === currentDate;
-    });
+    const currentDateFeatures = featuresForDate(currentDate);
     
     // Calculate statistics for current date
     const probabilities = currentDateFeatures.map(f => f.properties.bloom_probability);
@@ -480,9 +648,12 @@ function updateStatistics() {
         : 0;
     const maxProb = probabilities.length > 0 ? Math.max(...probabilities) : 0;
     
-    // Update UI
-    document.getElementById('totalPoints').textContent = allFeaturesInRange.length;
-    document.getElementById('visiblePoints').textContent = currentDateFeatures.length;
+    setStatistics(allFeaturesInRange.length, currentDateFeatures.length, avgProb, maxProb);
+}
+
+function setStatistics(totalPoints, visiblePoints, avgProb, maxProb) {
+    document.getElementById('totalPoints').textContent = totalPoints;
+    document.getElementById('visiblePoints').textContent = visiblePoints;
     document.getElementById('avgProb').textContent = (avgProb * 100).toFixed(1) + '%';
     document.getElementById('maxProb').textContent = (maxProb * 100).toFixed(1) + '%';
 }
@@ -567,17 +738,12 @@ function showFeatureDetails(feature) {
 
 // ===== NEARBY MARKERS FUNCTIONALITY =====
 function updateNearbyMarkers(selectedFeature) {
-    if (!allData || !currentDate) return;
+    if (!hasData() || !currentDate) return;
     
     const selectedCoords = selectedFeature.geometry.coordinates;
     
-    // Get all features for current date
-    const currentDateFeatures = allData.features.filter(f => {
-        return f.properties.date === currentDate;
-    });
-    
-    // Calculate distances and sort
-    nearbyFeatures = currentDateFeatures
+    // Calculate distances to the current date's features and sort
+    nearbyFeatures = currentFeatures
         .map(feature => {
             const coords = feature.geometry.coordinates;
             const distance = calculateDistance(
@@ -746,23 +912,22 @@ function formatDate(dateStr) {
 }
 
 // ===== EXPORT FUNCTIONS =====
-function exportCurrentData() {
-    if (!allData || !startDate || !endDate) {
+async function exportCurrentData() {
+    if (!hasData() || !startDate || !endDate) {
         alert('No data to export!');
         return;
     }
     
     // Get current filtered features in date range
-    const features = allData.features.filter(f => {
-        const featureDate = f.properties.date;
-        return featureDate >= startDate && featureDate <= endDate;
-    });
+    const features = tileIndex
+        ? (await Promise.all(dateRangeList.map(loadDateFeatures))).flat()
+        : dateRangeList.flatMap(featuresForDate);
     
     // Create GeoJSON
     const exportData = {
         type: 'FeatureCollection',
         name: `${currentSpecies}_${startDate}_to_${endDate}_filtered`,
-        crs: allData.crs,
+        crs: tileIndex ? tileIndex.crs : allData.crs,
         features: features
     };
     